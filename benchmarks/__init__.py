@@ -0,0 +1,4 @@
+from benchmarks import bench_client, bench_e2e
+from benchmarks.harness import bench, compare, load, registry, run, save
+
+__all__ = ["bench", "compare", "load", "registry", "run", "save", "bench_client", "bench_e2e"]
@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from benchmarks import registry
+from benchmarks.harness import Result, compare, load, run, save
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Client-side benchmark suite.")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks whose name contains this string")
+    parser.add_argument("--group", choices=("micro", "e2e", "fixtures"), help="Only run one group")
+    parser.add_argument("--duration", type=float, default=1.0, help="Seconds spent timing each benchmark")
+    parser.add_argument("--memory", action="store_true", help="Also measure per-call allocations")
+    parser.add_argument("--save", metavar="NAME", help="Store the results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="Compare against baseline NAME (or a JSON path)")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed throughput drop / p95 growth before --compare fails (default 0.15)")
+    return parser.parse_args(argv)
+
+
+def _print(result: Result):
+    line = (f"{result.name:<32}{result.ops_per_sec:>14,.0f} ops/s{result.mean_us:>12.2f} us"
+            f"{result.p50_us:>12.2f} p50{result.p95_us:>12.2f} p95")
+    if result.alloc_bytes is not None:
+        line += f"{result.alloc_bytes:>12,.0f} B/call"
+    print(line, flush=True)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    benches = [entry for entry in registry() if args.group in (None, entry.group)]
+    results = run(benches, pattern=args.pattern, duration=args.duration, memory=args.memory, report=_print)
+    
+    if args.save:
+        print(f"\nSaved baseline to {save(results, args.save)}")
+    if args.compare:
+        comparisons = compare(results, load(args.compare), args.threshold)
+        print(f"\nCompared with baseline '{args.compare}' (threshold {args.threshold:.0%}):")
+        failed = False
+        for comparison in comparisons:
+            status = "REGRESSED " + ", ".join(comparison.regressions) if comparison.regressions else "ok"
+            print(f"  {comparison.name:<32}throughput {comparison.throughput_change:+7.1%}  "
+                  f"p95 {comparison.latency_change:+7.1%}  {status}")
+            failed = failed or bool(comparison.regressions)
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
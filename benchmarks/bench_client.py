@@ -0,0 +1,87 @@
+"""Micro-benchmarks of the client's own per-call overhead (no network)."""
+from requests import Request
+from requests.models import PreparedRequest
+
+from benchmarks.context import product_payload, products_body
+from benchmarks.harness import bench
+from clients.base_client import BaseClient
+from clients.models import Product
+from clients.response import ApiResponse
+
+
+@bench("build_url")
+def build_url():
+    client = BaseClient(base_url="http://127.0.0.1:8000")
+    return lambda: client._build_url("/products/42")
+
+
+@bench("client_setup")
+def client_setup():
+    def create():
+        client = BaseClient(base_url="http://127.0.0.1:8000")
+        client.close()
+    return create
+
+
+@bench("prepare_request", params=("session", "prepared"))
+def prepare_request(mode):
+    """What a PATCH costs before it reaches the adapter: ``Session.request``'s preparation vs ``PreparedSender``."""
+    client = BaseClient(base_url="http://127.0.0.1:8000")
+    url = client._build_url("/products/42")
+    payload = {"stock": 7}
+    
+    if mode == "prepared":
+        return lambda: client.sender.prepare("PATCH", url, json=payload)
+    
+    def prepare():
+        request = client.session.prepare_request(Request("PATCH", url, json=payload))
+        client.session.merge_environment_settings(request.url, {}, None, None, None)
+    return prepare
+
+
+@bench("encode_json_body", params=(32, 1024, 65536))
+def encode_json_body(description_bytes):
+    payload = product_payload(description_bytes)
+    
+    def encode():
+        request = PreparedRequest()
+        request.prepare_headers({"Content-Type": "application/json"})
+        request.prepare_body(data=None, files=None, json=payload)
+    return encode
+
+
+@bench("decode_json", params=(1, 100, 1000))
+def decode_json(count):
+    body = products_body(count)
+    
+    def decode():
+        response = ApiResponse()
+        response._content = body
+        return response.json()
+    return decode
+
+
+@bench("decode_model", params=(1, 100, 1000))
+def decode_model(count):
+    body = products_body(count)
+    
+    def decode():
+        response = ApiResponse()
+        response._content = body
+        response.status_code = 200
+        response.model_type = Product
+        return response.model
+    return decode
+
+
+@bench("decode_model_read_all", params=(1, 100, 1000))
+def decode_model_read_all(count):
+    body = products_body(count)
+    
+    def decode():
+        response = ApiResponse()
+        response._content = body
+        response.status_code = 200
+        response.model_type = Product
+        return list(response.model)
+    return decode
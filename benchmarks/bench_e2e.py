@@ -0,0 +1,93 @@
+"""End-to-end round trips against the local mock Products API."""
+import itertools
+
+from benchmarks.context import product_payload, server
+from benchmarks.harness import bench
+from clients.products_client import ProductsClient
+from config.settings import settings
+
+
+def _client() -> ProductsClient:
+    return ProductsClient(base_url=server().url, api_key=settings.API_KEY)
+
+
+@bench("get_product", group="e2e")
+def get_product():
+    client = _client()
+    return lambda: client.get_product(1)
+
+
+@bench("get_product_unprepared", group="e2e")
+def get_product_unprepared():
+    """``get_product`` through ``Session.request``, for comparison with the prepared-request path."""
+    client = _client()
+    client.sender = None
+    return lambda: client.get_product(1)
+
+
+@bench("get_products", params=(10, 100, 1000), group="e2e")
+def get_products(limit):
+    client = _client()
+    return lambda: client.get_products(limit=limit).json()
+
+
+@bench("create_product", params=(32, 4096), group="e2e")
+def create_product(description_bytes):
+    client = _client()
+    payload = product_payload(description_bytes)
+    return lambda: client.create_product(**payload)
+
+
+@bench("update_product", group="e2e")
+def update_product():
+    client = _client()
+    stock = itertools.count()
+    return lambda: client.update_product(1, stock=next(stock))
+
+
+@bench("create_delete_product", group="e2e")
+def create_delete_product():
+    client = _client()
+    payload = product_payload()
+    
+    def round_trip():
+        product_id = client.create_product(**payload).json()["id"]
+        client.delete_product(product_id)
+    return round_trip
+
+
+@bench("create_delete_products", params=(100, 1000), group="e2e")
+def create_delete_products(count):
+    """Seeding and cleaning up ``count`` products with the batch API."""
+    client = _client()
+    payloads = [product_payload()] * count
+    
+    def round_trip():
+        created = [result.data["id"] for result in client.create_products(payloads)]
+        for _ in client.delete_products(created, ordered=False):
+            pass
+    return round_trip
+
+
+@bench("fixture_inline_create", group="fixtures")
+def fixture_inline_create():
+    """What ``created_product`` used to cost per test: one create and one delete round trip."""
+    return create_delete_product()
+
+
+@bench("fixture_pooled_product", group="fixtures")
+def fixture_pooled_product():
+    """What ``created_product`` costs per test with ``ProductPool``, batched provisioning and teardown included."""
+    from tests.product_pool import ProductPool
+    
+    pool = ProductPool(name=lambda name: f"[bench] {name}", client=_client())
+    acquired = 0
+    
+    def acquire():
+        nonlocal acquired
+        product = pool.acquire()
+        pool.retire(product["id"])
+        acquired += 1
+        if acquired % pool.batch_size == 0:
+            pool.teardown()
+    return acquire
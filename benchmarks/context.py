@@ -0,0 +1,80 @@
+import atexit
+import socket
+import subprocess
+import sys
+import time
+from typing import Optional
+
+from config.settings import settings
+
+SEED_PRODUCTS = 1000
+STARTUP_TIMEOUT = 10.0
+
+_server: Optional["ServerProcess"] = None
+
+
+class ServerProcess:
+    """A mock Products API in a child process, so its CPU time is not charged to the client under test."""
+    
+    def __init__(self, port: int, process: subprocess.Popen):
+        self.port = port
+        self.process = process
+    
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+    
+    def wait_ready(self, timeout: float = STARTUP_TIMEOUT) -> "ServerProcess":
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Mock server exited with status {self.process.returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.1).close()
+                return self
+            except OSError:
+                time.sleep(0.05)
+        self.stop()
+        raise RuntimeError(f"Mock server did not start within {timeout}s")
+    
+    def stop(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server() -> ServerProcess:
+    """The local mock Products API shared by all end-to-end benchmarks, started on first use."""
+    global _server
+    if _server is None:
+        port = _free_port()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "mockserver", "--port", str(port), "--api-key", settings.API_KEY,
+             "--seed-products", str(SEED_PRODUCTS)],
+            stdout=subprocess.DEVNULL,
+        )
+        _server = ServerProcess(port, process).wait_ready()
+        atexit.register(_server.stop)
+    return _server
+
+
+def product_payload(description_bytes: int = 32) -> dict:
+    return {
+        "name": "Benchmark Product",
+        "price": 19.99,
+        "description": "d" * description_bytes,
+        "stock": 10,
+    }
+
+
+def products_body(count: int) -> bytes:
+    import json
+    return json.dumps([
+        {"id": index, **product_payload(), "image_url": None} for index in range(count)
+    ]).encode()
@@ -0,0 +1,182 @@
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+@dataclass
+class Bench:
+    name: str
+    setup: Callable[..., Callable[[], object]]
+    params: tuple = (None,)
+    group: str = "micro"
+    
+    def cases(self):
+        for param in self.params:
+            yield (self.name if param is None else f"{self.name}[{param}]"), param
+
+
+@dataclass
+class Result:
+    name: str
+    group: str
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p95_us: float
+    samples: int
+    alloc_bytes: Optional[float] = None
+    retained_bytes: Optional[float] = None
+
+
+_REGISTRY: List[Bench] = []
+
+
+def bench(name: str, params: Iterable = (None,), group: str = "micro"):
+    """Registers ``setup(param) -> fn``; the returned zero-argument ``fn`` is the timed operation."""
+    def register(setup):
+        _REGISTRY.append(Bench(name, setup, tuple(params), group))
+        return setup
+    return register
+
+
+def registry() -> List[Bench]:
+    return list(_REGISTRY)
+
+
+def _batch_size(fn: Callable[[], object], min_batch_time: float) -> int:
+    size = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(size):
+            fn()
+        if time.perf_counter() - started >= min_batch_time or size >= 1 << 20:
+            return size
+        size *= 2
+
+
+def measure(name: str, group: str, fn: Callable[[], object], duration: float = 1.0,
+            min_batch_time: float = 0.0005, memory: bool = False) -> Result:
+    """Times ``fn`` in batches for ``duration`` seconds and reports per-operation statistics."""
+    fn()
+    size = _batch_size(fn, min_batch_time)
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline or len(samples) < 5:
+            started = time.perf_counter_ns()
+            for _ in range(size):
+                fn()
+            samples.append((time.perf_counter_ns() - started) / size / 1000)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    
+    samples.sort()
+    mean = statistics.fmean(samples)
+    result = Result(
+        name=name,
+        group=group,
+        ops_per_sec=1_000_000 / mean,
+        mean_us=mean,
+        p50_us=samples[len(samples) // 2],
+        p95_us=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        samples=len(samples) * size,
+    )
+    if memory:
+        result.alloc_bytes, result.retained_bytes = allocations(fn)
+    return result
+
+
+def allocations(fn: Callable[[], object], calls: int = 200) -> tuple:
+    """Returns ``(peak bytes allocated during a call, bytes retained per call)``, averaged, via tracemalloc."""
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        peak_total = 0
+        for _ in range(calls):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - current
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_total / calls, (end - start) / calls
+
+
+def run(benches: Iterable[Bench], pattern: Optional[str] = None, duration: float = 1.0,
+        memory: bool = False, report: Callable[[Result], None] = lambda result: None) -> List[Result]:
+    results = []
+    for entry in benches:
+        for name, param in entry.cases():
+            if pattern and pattern not in name:
+                continue
+            fn = entry.setup(param) if param is not None else entry.setup()
+            result = measure(name, entry.group, fn, duration=duration, memory=memory)
+            results.append(result)
+            report(result)
+    return results
+
+
+def save(results: List[Result], baseline: str) -> str:
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    path = os.path.join(BASELINE_DIR, f"{baseline}.json")
+    with open(path, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": {result.name: asdict(result) for result in results},
+        }, f, indent=2, sort_keys=True)
+    return path
+
+
+def load(baseline: str) -> Dict[str, dict]:
+    path = baseline if baseline.endswith(".json") else os.path.join(BASELINE_DIR, f"{baseline}.json")
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline_ops: float
+    current_ops: float
+    baseline_p95: float
+    current_p95: float
+    regressions: List[str] = field(default_factory=list)
+    
+    @property
+    def throughput_change(self) -> float:
+        return self.current_ops / self.baseline_ops - 1 if self.baseline_ops else 0.0
+    
+    @property
+    def latency_change(self) -> float:
+        return self.current_p95 / self.baseline_p95 - 1 if self.baseline_p95 else 0.0
+
+
+def compare(results: List[Result], baseline: Dict[str, dict], threshold: float) -> List[Comparison]:
+    """Flags benchmarks whose throughput dropped or p95 latency grew by more than ``threshold``."""
+    comparisons = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        comparison = Comparison(result.name, previous["ops_per_sec"], result.ops_per_sec,
+                                previous["p95_us"], result.p95_us)
+        if comparison.throughput_change < -threshold:
+            comparison.regressions.append(f"throughput {comparison.throughput_change:+.1%}")
+        if comparison.latency_change > threshold:
+            comparison.regressions.append(f"p95 {comparison.latency_change:+.1%}")
+        comparisons.append(comparison)
+    return comparisons
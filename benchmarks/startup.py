@@ -0,0 +1,124 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+_DURATION = re.compile(r" in ([\d.]+)s")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    
+    @property
+    def package(self) -> str:
+        return self.module.partition(".")[0]
+
+
+@dataclass
+class CollectTime:
+    wall_s: float
+    collect_s: Optional[float]
+    summary: str
+
+
+def _env() -> Dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (ROOT, os.getenv("PYTHONPATH"))))}
+
+
+def profile_imports(module: str) -> List[ImportTime]:
+    """Imports ``module`` in a fresh interpreter under ``-X importtime`` and returns one record per module loaded."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, env=_env(), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    records = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append(ImportTime(name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def by_package(records: Sequence[ImportTime]) -> Dict[str, int]:
+    """Self time per top-level package, in microseconds."""
+    totals = defaultdict(int)
+    for record in records:
+        totals[record.package] += record.self_us
+    return dict(totals)
+
+
+def time_collection(paths: Sequence[str], repeat: int = 3) -> CollectTime:
+    """Best of ``repeat`` runs of ``pytest --collect-only``, each in a fresh process."""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", *paths],
+                                cwd=ROOT, env=_env(), capture_output=True, text=True)
+        wall = time.perf_counter() - started
+        if result.returncode not in (0, 5):
+            raise RuntimeError(f"Collection failed:\n{result.stdout[-2000:]}{result.stderr[-2000:]}")
+        summary = result.stdout.strip().splitlines()[-1].strip("= ") if result.stdout.strip() else ""
+        match = _DURATION.search(summary)
+        seconds = float(match.group(1)) if match else None
+        if best is None or wall < best.wall_s:
+            best = CollectTime(wall, seconds, summary)
+    return best
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup",
+                                     description="Import-time profile and collection timing of the test suite.")
+    parser.add_argument("modules", nargs="*", default=["tests.conftest"],
+                        help="Modules to profile (default: tests.conftest)")
+    parser.add_argument("--top", type=int, default=15, help="Rows to show per table (default 15)")
+    parser.add_argument("--collect", nargs="*", metavar="PATH",
+                        help="Also time 'pytest --collect-only' on PATHs (default: the configured testpaths)")
+    parser.add_argument("--repeat", type=int, default=3, help="Collection runs to take the best of (default 3)")
+    parser.add_argument("--max-ms", type=float, help="Fail if the best collection run takes longer than this")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    for module in args.modules:
+        records = profile_imports(module)
+        target = next((record for record in reversed(records) if record.module == module), None)
+        total_ms = target.cumulative_us / 1000 if target else sum(record.self_us for record in records) / 1000
+        print(f"import {module}: {total_ms:.1f} ms, {len(records)} modules loaded")
+    
+        print(f"\n  {'self ms':>9}  package")
+        for package, self_us in sorted(by_package(records).items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {self_us / 1000:>9.1f}  {package}")
+    
+        print(f"\n  {'cumul ms':>9}{'self ms':>9}  module")
+        for record in sorted(records, key=lambda record: -record.cumulative_us)[:args.top]:
+            print(f"  {record.cumulative_us / 1000:>9.1f}{record.self_us / 1000:>9.1f}  "
+                  f"{'  ' * record.depth}{record.module}")
+        print()
+    
+    if args.collect is not None:
+        timing = time_collection(args.collect, args.repeat)
+        collect = f", {timing.collect_s * 1000:.0f} ms collecting" if timing.collect_s is not None else ""
+        print(f"pytest --collect-only {' '.join(args.collect) or '(testpaths)'}: {timing.wall_s * 1000:.0f} ms wall{collect}"
+              f" ({timing.summary})")
+        if args.max_ms is not None and timing.wall_s * 1000 > args.max_ms:
+            print(f"FAILED: collection took longer than {args.max_ms:.0f} ms")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
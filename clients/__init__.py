@@ -1,4 +1,23 @@
-from clients.base_client import BaseClient
-from clients.products_client import ProductsClient
+from importlib import import_module
 
-__all__ = ["BaseClient", "ProductsClient"]
+# Clients are imported on first attribute access, so ``import clients`` (or any submodule)
+# doesn't load both the requests and the httpx stacks up front.
+_EXPORTS = {
+    "BaseClient": "clients.base_client",
+    "ProductsClient": "clients.products_client",
+    "AsyncBaseClient": "clients.async_base_client",
+    "AsyncProductsClient": "clients.async_products_client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'clients' has no attribute '{name}'")
+    value = globals()[name] = getattr(import_module(_EXPORTS[name]), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,56 @@
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from clients.instrumentation import timings
+from clients.response import ApiResponse
+
+
+class TimedHTTPConnection(HTTPConnection):
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            timings.connect = getattr(timings, "connect", 0.0) + time.perf_counter() - started
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            timings.connect = getattr(timings, "connect", 0.0) + time.perf_counter() - started
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class ClientAdapter(HTTPAdapter):
+    """Default transport for ``BaseClient``.
+    
+    Behaves like ``HTTPAdapter`` but its connections report how long DNS resolution,
+    TCP connect and the TLS handshake took, which the instrumentation layer picks up,
+    and it returns ``ApiResponse`` objects with lazily decoded, cached JSON bodies.
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+    
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = ApiResponse
+        return response
@@ -0,0 +1,70 @@
+import asyncio
+import httpx
+from typing import Optional
+from config.settings import settings
+from clients.ratelimit import RateLimiter
+from clients.transports import build_async_transport
+
+
+class AsyncBaseClient:
+    
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 max_concurrency: Optional[int] = None, rate_limiter: Optional[RateLimiter] = None):
+        self.base_url = base_url or settings.BASE_URL
+        self.api_key = api_key or settings.API_KEY
+        self.timeout = httpx.Timeout(settings.READ_TIMEOUT, connect=settings.CONNECT_TIMEOUT)
+        self.max_concurrency = max_concurrency or settings.MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings()
+        self.session = httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=build_async_transport(httpx.Limits(
+                max_connections=settings.POOL_SIZE,
+                max_keepalive_connections=settings.POOL_SIZE,
+                keepalive_expiry=settings.KEEPALIVE_EXPIRY
+            ))
+        )
+        self._setup_session()
+    
+    def _setup_session(self):
+        self.session.headers.update({
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        })
+    
+    def _build_url(self, endpoint: str) -> str:
+        return f"{self.base_url}{endpoint}"
+    
+    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        url = self._build_url(endpoint)
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(method, endpoint)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        async with self._semaphore:
+            return await self.session.request(method, url, **kwargs)
+    
+    async def get(self, endpoint: str, params: Optional[dict] = None, **kwargs) -> httpx.Response:
+        return await self._request("GET", endpoint, params=params, **kwargs)
+    
+    async def post(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> httpx.Response:
+        return await self._request("POST", endpoint, json=data, **kwargs)
+    
+    async def patch(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> httpx.Response:
+        return await self._request("PATCH", endpoint, json=data, **kwargs)
+    
+    async def put(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> httpx.Response:
+        return await self._request("PUT", endpoint, json=data, **kwargs)
+    
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self._request("DELETE", endpoint, **kwargs)
+    
+    async def close(self):
+        await self.session.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,124 @@
+import httpx
+from itertools import chain, islice
+from typing import AsyncIterator, Iterable, List, Optional, Union
+from config.settings import settings
+from clients.async_base_client import AsyncBaseClient
+from clients.batch import (
+    BatchResult, Chunk, arun_chunks, bulk_mode, bulk_results, bulk_support, chunked, create_operation,
+    decode, delete_operation, failed_results, update_operation
+)
+from clients.models import Product
+from clients.pagination import PageSizer, aiter_pages
+
+
+class AsyncProductsClient(AsyncBaseClient):
+    
+    ENDPOINT = "/products/"
+    BULK_ENDPOINT = "/products/bulk"
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bulk_supported = bulk_mode(settings.BULK_ENDPOINTS)
+    
+    async def get_products(self, skip: int = 0, limit: int = 100) -> httpx.Response:
+        params = {"skip": skip, "limit": limit}
+        return await self.get(self.ENDPOINT, params=params)
+    
+    async def get_product(self, product_id: int) -> httpx.Response:
+        endpoint = f"{self.ENDPOINT}{product_id}"
+        return await self.get(endpoint)
+    
+    async def create_product(self, name: str, price: float, description: Optional[str] = None, 
+                             stock: int = 0) -> httpx.Response:
+        payload = {
+            "name": name,
+            "price": price,
+            "stock": stock
+        }
+        if description:
+            payload["description"] = description
+        
+        return await self.post(self.ENDPOINT, data=payload)
+    
+    async def update_product(self, product_id: int, **kwargs) -> httpx.Response:
+        endpoint = f"{self.ENDPOINT}{product_id}"
+        return await self.patch(endpoint, data=kwargs)
+    
+    async def delete_product(self, product_id: int) -> httpx.Response:
+        endpoint = f"{self.ENDPOINT}{product_id}"
+        return await self.delete(endpoint)
+    
+    async def _fetch_page(self, skip: int, limit: int) -> list:
+        response = await self.get_products(skip=skip, limit=limit)
+        response.raise_for_status()
+        return response.json()
+    
+    async def iter_products(self, skip: int = 0, page_size: Optional[int] = None, prefetch: Optional[int] = None,
+                            typed: bool = False) -> AsyncIterator[Union[dict, Product]]:
+        """Streams the whole catalog page by page, prefetching upcoming pages concurrently."""
+        async for page in aiter_pages(self._fetch_page, skip=skip, prefetch=prefetch, sizer=PageSizer(page_size)):
+            for item in page:
+                yield Product.from_dict(item) if typed else item
+    
+    def create_products(self, products: Iterable[dict], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> AsyncIterator[BatchResult]:
+        return self._batch(map(create_operation, products), ordered, concurrency)
+    
+    def update_products(self, products: Iterable[dict], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> AsyncIterator[BatchResult]:
+        return self._batch(map(update_operation, products), ordered, concurrency)
+    
+    def delete_products(self, product_ids: Iterable[int], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> AsyncIterator[BatchResult]:
+        return self._batch(map(delete_operation, product_ids), ordered, concurrency)
+    
+    async def _batch(self, operations: Iterable[dict], ordered: bool = True,
+                     concurrency: Optional[int] = None) -> AsyncIterator[BatchResult]:
+        """Async counterpart of ``ProductsClient._batch``; bulk chunks or single requests run as tasks."""
+        concurrency = concurrency or settings.BATCH_CONCURRENCY
+        operations = iter(operations)
+        start = 0
+        if self.bulk_supported is None:
+            probe = list(islice(operations, settings.BATCH_SIZE))
+            if not probe:
+                return
+            results = await self._send_bulk((0, probe))
+            if self.bulk_supported is False:
+                operations = chain(probe, operations)
+            else:
+                for result in results:
+                    yield result
+                start = len(probe)
+        if self.bulk_supported is False:
+            send_chunk, chunks = self._send_single, chunked(operations, 1, start)
+        else:
+            send_chunk, chunks = self._send_bulk, chunked(operations, settings.BATCH_SIZE, start)
+        async for result in arun_chunks(send_chunk, chunks, concurrency, ordered):
+            yield result
+    
+    async def _send_bulk(self, chunk: Chunk) -> List[BatchResult]:
+        start, operations = chunk
+        try:
+            response = await self.post(self.BULK_ENDPOINT, data={"operations": operations})
+        except httpx.HTTPError as error:
+            return failed_results(start, operations, error)
+        if self.bulk_supported is None:
+            # A 5xx, 429 or auth error on the probe says nothing about the endpoint; the next chunk asks again.
+            self.bulk_supported = bulk_support(response.status_code)
+        return bulk_results(start, operations, response.status_code, decode(response))
+    
+    async def _send_single(self, chunk: Chunk) -> List[BatchResult]:
+        index, (operation,) = chunk
+        try:
+            response = await self._send_operation(operation)
+        except httpx.HTTPError as error:
+            return [BatchResult(index, error=error)]
+        return [BatchResult(index, response.status_code, decode(response))]
+    
+    async def _send_operation(self, operation: dict) -> httpx.Response:
+        if operation["op"] == "create":
+            return await self.post(self.ENDPOINT, data=operation["data"])
+        endpoint = f"{self.ENDPOINT}{operation['id']}"
+        if operation["op"] == "update":
+            return await self.patch(endpoint, data=operation["data"])
+        return await self.delete(endpoint)
@@ -1,46 +1,100 @@
 import requests
 from typing import Optional
 from config.settings import settings
+from clients.cache import ResponseCache
+from clients.compression import Compression
+from clients.instrumentation import Instrumentation
+from clients.prepared import PreparedSender
+from clients.ratelimit import RateLimiter
+from clients.resilience import Resilience
+from clients.transports import build_adapter
 
 
 class BaseClient:
     
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 instrumentation: Optional[Instrumentation] = None, resilience: Optional[Resilience] = None,
+                 cache: Optional[ResponseCache] = None, rate_limiter: Optional[RateLimiter] = None,
+                 compression: Optional[Compression] = None):
         self.base_url = base_url or settings.BASE_URL
         self.api_key = api_key or settings.API_KEY
-        self.timeout = settings.TIMEOUT
+        self.timeout = (settings.CONNECT_TIMEOUT, settings.READ_TIMEOUT)
+        self.instrumentation = instrumentation or Instrumentation.from_settings()
+        self.resilience = resilience or Resilience.from_settings()
+        self.cache = cache or ResponseCache.from_settings()
+        self.rate_limiter = rate_limiter or RateLimiter.from_settings()
+        self.compression = compression or Compression.from_settings()
         self.session = requests.Session()
         self._setup_session()
+        self.sender = PreparedSender(self.session, self.base_url, self.timeout) if settings.PREPARED_REQUESTS else None
     
     def _setup_session(self):
         self.session.headers.update({
             "x-api-key": self.api_key,
             "Content-Type": "application/json",
-            "Accept": "application/json"
+            "Accept": "application/json",
+            "Accept-Encoding": self.compression.accept,
         })
+        adapter = build_adapter()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def _build_url(self, endpoint: str) -> str:
         return f"{self.base_url}{endpoint}"
     
-    def get(self, endpoint: str, params: Optional[dict] = None, **kwargs) -> requests.Response:
+    def _request(self, method: str, endpoint: str, use_cache: bool = True, **kwargs) -> requests.Response:
+        if self.cache is None:
+            return self._dispatch(method, endpoint, **kwargs)
+        if method == "GET":
+            if not use_cache:
+                return self._dispatch(method, endpoint, **kwargs)
+            return self.cache.get(endpoint, kwargs.get("params"), lambda headers: self._dispatch(
+                method, endpoint, **{**kwargs, "headers": {**(kwargs.get("headers") or {}), **headers}}
+            ))
+        try:
+            return self._dispatch(method, endpoint, **kwargs)
+        finally:
+            self.cache.invalidate(endpoint)
+    
+    def _dispatch(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         url = self._build_url(endpoint)
-        return self.session.get(url, params=params, timeout=self.timeout, **kwargs)
+        kwargs = self.compression.encode(kwargs)
+        if self.resilience is None:
+            return self._send(method, endpoint, url, **kwargs)
+        idempotent = self.resilience.policy.is_idempotent(method, kwargs.get("headers"))
+        return self.resilience.call(method, url, lambda: self._send(method, endpoint, url, **kwargs), idempotent)
+    
+    def _send(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, endpoint)
+        if self.instrumentation is None:
+            return self._perform(method, url, **kwargs)
+        with self.instrumentation.measure(method, endpoint) as measurement:
+            measurement.response = self._perform(method, url, **kwargs)
+        return measurement.response
+    
+    def _perform(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.sender is not None:
+            prepared = self.sender.prepare(method, url, **kwargs)
+            if prepared is not None:
+                return self.sender.send(prepared)
+        return self.session.request(method, url, timeout=self.timeout, **kwargs)
+    
+    def get(self, endpoint: str, params: Optional[dict] = None, use_cache: bool = True,
+            **kwargs) -> requests.Response:
+        return self._request("GET", endpoint, params=params, use_cache=use_cache, **kwargs)
     
     def post(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> requests.Response:
-        url = self._build_url(endpoint)
-        return self.session.post(url, json=data, timeout=self.timeout, **kwargs)
+        return self._request("POST", endpoint, json=data, **kwargs)
     
     def patch(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> requests.Response:
-        url = self._build_url(endpoint)
-        return self.session.patch(url, json=data, timeout=self.timeout, **kwargs)
+        return self._request("PATCH", endpoint, json=data, **kwargs)
     
     def put(self, endpoint: str, data: Optional[dict] = None, **kwargs) -> requests.Response:
-        url = self._build_url(endpoint)
-        return self.session.put(url, json=data, timeout=self.timeout, **kwargs)
+        return self._request("PUT", endpoint, json=data, **kwargs)
     
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
-        url = self._build_url(endpoint)
-        return self.session.delete(url, timeout=self.timeout, **kwargs)
+        return self._request("DELETE", endpoint, **kwargs)
     
     def close(self):
         self.session.close()
@@ -0,0 +1,159 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+Chunk = Tuple[int, List[dict]]
+
+BULK_MODES = {"auto": None, "true": True, "false": False}
+# What a server without the bulk endpoint answers; nothing was applied, so the chunk is safe to resend.
+UNSUPPORTED_STATUSES = (404, 405)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of a batch call; ``index`` is the item's position in the input iterable."""
+    index: int
+    status_code: Optional[int] = None
+    data: Any = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and 200 <= self.status_code < 300
+
+
+def bulk_mode(value: str) -> Optional[bool]:
+    """Parses ``API_BULK_ENDPOINTS``: ``None`` means probe the server on first use."""
+    try:
+        return BULK_MODES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown bulk mode '{value}', expected one of {tuple(BULK_MODES)}") from None
+
+
+def bulk_support(status_code: int) -> Optional[bool]:
+    """What a bulk response says about the endpoint: True on 2xx, False on 404/405, None (probe again) otherwise."""
+    if status_code in UNSUPPORTED_STATUSES:
+        return False
+    if 200 <= status_code < 300:
+        return True
+    return None
+
+
+def create_operation(product: dict) -> dict:
+    return {"op": "create", "data": product}
+
+
+def update_operation(product: dict) -> dict:
+    fields = dict(product)
+    return {"op": "update", "id": fields.pop("id"), "data": fields}
+
+
+def delete_operation(product_id: int) -> dict:
+    return {"op": "delete", "id": product_id}
+
+
+def chunked(operations: Iterable[dict], size: int, start: int = 0) -> Iterator[Chunk]:
+    """Splits ``operations`` into ``(index of first operation, operations)`` chunks without materialising the input."""
+    operations = iter(operations)
+    while True:
+        chunk = list(islice(operations, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def decode(response) -> Any:
+    if not response.content:
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def bulk_results(start: int, operations: List[dict], status_code: int, payload: Any) -> List[BatchResult]:
+    """Maps a bulk endpoint response onto one result per operation.
+    
+    A rejected bulk request (e.g. 422 for the whole body) is reported on every operation it carried.
+    """
+    results = payload.get("results") if status_code == 200 and isinstance(payload, dict) else None
+    if not isinstance(results, list) or len(results) != len(operations):
+        return [BatchResult(start + offset, status_code, payload) for offset in range(len(operations))]
+    return [
+        BatchResult(start + offset, result.get("status"), result.get("body"))
+        for offset, result in enumerate(results)
+    ]
+
+
+def failed_results(start: int, operations: List[dict], error: BaseException) -> List[BatchResult]:
+    return [BatchResult(start + offset, error=error) for offset in range(len(operations))]
+
+
+def run_chunks(send_chunk: Callable[[Chunk], List[BatchResult]], chunks: Iterator[Chunk], concurrency: int,
+               ordered: bool = True) -> Iterator[BatchResult]:
+    """Sends up to ``concurrency`` chunks at a time on worker threads and streams their results.
+    
+    Results come back in input order, or as chunks complete when ``ordered`` is false. Chunks are
+    pulled from the iterator only as slots free up, so arbitrarily large inputs stay bounded in memory.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    pending = deque()
+    
+    def fill():
+        while len(pending) < max(1, concurrency):
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            pending.append(executor.submit(send_chunk, chunk))
+    
+    try:
+        fill()
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            results = future.result()
+            fill()
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def arun_chunks(send_chunk: Callable[[Chunk], Awaitable[List[BatchResult]]], chunks: Iterator[Chunk],
+                      concurrency: int, ordered: bool = True) -> AsyncIterator[BatchResult]:
+    """Async counterpart of ``run_chunks``; chunks are sent as tasks on the current event loop."""
+    import asyncio  # only the async clients need it, and they have already loaded it
+    
+    pending = deque()
+    
+    def fill():
+        while len(pending) < max(1, concurrency):
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            pending.append(asyncio.ensure_future(send_chunk(chunk)))
+    
+    try:
+        fill()
+        while pending:
+            if ordered:
+                task = pending.popleft()
+            else:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = done.pop()
+                pending.remove(task)
+            results = await task
+            fill()
+            for result in results:
+                yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,145 @@
+import copy
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Optional, Set, Tuple
+
+import requests
+
+from config.settings import settings
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+CacheKey = Tuple[str, tuple]
+
+
+class CacheEntry:
+    __slots__ = ("response", "expires", "etag", "last_modified", "size")
+    
+    def __init__(self, response: requests.Response, expires: float):
+        self.response = response
+        self.expires = expires
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.size = len(response.content) + 512
+
+
+class ResponseCache:
+    """LRU + TTL cache for GET responses with a memory cap and ETag/Last-Modified revalidation.
+    
+    Entries are indexed by path so a write to ``/products/42`` can drop both that
+    item and every cached page of its collection, ``/products/``.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        self.ttl = settings.CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or settings.CACHE_MAX_ENTRIES
+        self.max_bytes = max_bytes or settings.CACHE_MAX_BYTES
+        self.stats: Counter = Counter()
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._by_path: Dict[str, Set[CacheKey]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls) -> Optional["ResponseCache"]:
+        return cls() if settings.CACHE_ENABLED else None
+    
+    @staticmethod
+    def key(path: str, params: Optional[dict]) -> CacheKey:
+        return path, tuple(sorted((params or {}).items()))
+    
+    def _ttl_for(self, response: requests.Response) -> Optional[float]:
+        cache_control = response.headers.get("Cache-Control", "")
+        if "no-store" in cache_control:
+            return None
+        match = _MAX_AGE.search(cache_control)
+        return float(match.group(1)) if match else self.ttl
+    
+    def _remove(self, key: CacheKey):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+            keys = self._by_path.get(key[0])
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_path[key[0]]
+    
+    def _store(self, key: CacheKey, response: requests.Response):
+        ttl = self._ttl_for(response)
+        if ttl is None:
+            return
+        entry = CacheEntry(response, time.monotonic() + ttl)
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._by_path.setdefault(key[0], set()).add(key)
+            self.size += entry.size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats["evictions"] += 1
+    
+    def _lookup(self, key: CacheKey) -> Tuple[Optional[CacheEntry], bool]:
+        """Returns the entry for ``key`` (or None) and whether it is still fresh, counting fresh ones as hits."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            fresh = entry.expires > time.monotonic()
+            if fresh:
+                self.stats["hits"] += 1
+            return entry, fresh
+    
+    def get(self, path: str, params: Optional[dict],
+            send: Callable[[Dict[str, str]], requests.Response]) -> requests.Response:
+        """Serves ``GET path?params`` from the cache, calling ``send(extra_headers)`` on a miss or to revalidate.
+        
+        Hits are shallow copies of the cached response; an ``ApiResponse`` keeps its decoded body.
+        """
+        key = self.key(path, params)
+        entry, fresh = self._lookup(key)
+        if fresh:
+            return copy.copy(entry.response)
+        
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = send(headers)
+        
+        if response.status_code == 304 and entry is not None:
+            ttl = self._ttl_for(response)
+            with self._lock:
+                self.stats["revalidated"] += 1
+                entry.expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+            return copy.copy(entry.response)
+        with self._lock:
+            self.stats["misses"] += 1
+            if response.status_code != 200:
+                self._remove(key)
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+    
+    def invalidate(self, path: str):
+        """Drops cached entries for ``path`` and for its parent collection (e.g. ``/products/``)."""
+        collection = path[:path.rstrip("/").rfind("/") + 1]
+        with self._lock:
+            for affected in {path, collection}:
+                for key in list(self._by_path.get(affected, ())):
+                    self._remove(key)
+                    self.stats["invalidations"] += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_path.clear()
+            self.size = 0
@@ -0,0 +1,259 @@
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from clients.adapters import ClientAdapter
+from clients.response import ApiResponse
+from config.settings import settings
+
+_HEADER = struct.Struct("<II")
+# Headers that describe the wire encoding rather than the stored (decoded) body.
+_WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+Interaction = Tuple[int, str, Dict[str, str], bytes]
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """No recorded interaction matches a request made in replay mode."""
+
+
+def _canonical_body(body) -> bytes:
+    if not body:
+        return b""
+    if isinstance(body, str):
+        body = body.encode()
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode()
+    except ValueError:
+        return body
+
+
+def match_keys(method: str, url: str, headers, body) -> Tuple[str, str]:
+    """Returns the ``(strict, lenient)`` keys of a request.
+    
+    Strict keys cover method, path, sorted query, a hash of the API key and a hash of
+    the canonical JSON body. Lenient keys only cover method, path and API key. Neither includes the
+    host, so a cassette recorded against one server replays against any ``BASE_URL``.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    api_key = hashlib.sha1(headers.get("x-api-key", "").encode()).hexdigest()[:12]
+    digest = hashlib.sha1(_canonical_body(body)).hexdigest()[:16]
+    return f"{method} {parts.path}?{query} {api_key} {digest}", f"{method} {parts.path} {api_key}"
+
+
+class CassetteStore:
+    """Append-only on-disk store of recorded interactions.
+    
+    ``interactions.dat`` holds ``<meta length><body length><meta JSON><raw body>``
+    records. ``interactions.idx`` maps every strict and lenient key to the offsets of
+    its records. On replay the data file is memory-mapped, so a lookup is one dict
+    access plus a slice, and only the bodies that are actually replayed are touched.
+    """
+    
+    def __init__(self, directory: str, mode: str = "replay", match: str = "strict"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+        if match not in ("strict", "lenient"):
+            raise ValueError(f"Unknown cassette match mode '{match}'")
+        self.directory = directory
+        self.mode = mode
+        self.match = match
+        # Set while traffic that a replay will not repeat is on the wire, e.g. during a live test.
+        self.paused = False
+        self.data_path = os.path.join(directory, "interactions.dat")
+        self.index_path = os.path.join(directory, "interactions.idx")
+        self._lock = threading.Lock()
+        self._cursors: Dict[str, int] = {}
+        self._file = None
+        self._mmap = None
+        
+        if mode == "record":
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(self.data_path, "wb")
+            self.index: Dict[str, List[int]] = {}
+        else:
+            if not os.path.exists(self.data_path):
+                raise FileNotFoundError(
+                    f"No cassette in {directory!r} to replay. Record one first with API_TRANSPORT=record, "
+                    f"or point API_CASSETTE_DIR at an existing cassette."
+                )
+            self.index = self._load_index()
+            if os.path.getsize(self.data_path):
+                with open(self.data_path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _load_index(self) -> Dict[str, List[int]]:
+        size = os.path.getsize(self.data_path)
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                stored = json.load(f)
+            if stored.get("size") == size:
+                return stored["keys"]
+        return self._scan()
+    
+    def _scan(self) -> Dict[str, List[int]]:
+        """Rebuilds the index from the data file, reading only record headers and metadata."""
+        index: Dict[str, List[int]] = {}
+        with open(self.data_path, "rb") as f:
+            while True:
+                offset = f.tell()
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                meta_length, body_length = _HEADER.unpack(header)
+                meta = json.loads(f.read(meta_length))
+                f.seek(body_length, os.SEEK_CUR)
+                for key in meta["keys"]:
+                    index.setdefault(key, []).append(offset)
+        return index
+    
+    def record(self, method: str, url: str, headers, body, status: int, reason: str,
+               response_headers, response_body: bytes):
+        if self.paused:
+            return
+        keys = match_keys(method, url, headers, body)
+        meta = json.dumps({
+            "method": method,
+            "url": url,
+            "keys": keys,
+            "status": status,
+            "reason": reason,
+            "headers": {k: v for k, v in response_headers.items() if k.lower() not in _WIRE_HEADERS},
+        }, separators=(",", ":")).encode()
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(_HEADER.pack(len(meta), len(response_body)))
+            self._file.write(meta)
+            self._file.write(response_body)
+            for key in keys:
+                self.index.setdefault(key, []).append(offset)
+    
+    def _read(self, offset: int) -> Interaction:
+        meta_length, body_length = _HEADER.unpack_from(self._mmap, offset)
+        start = offset + _HEADER.size
+        meta = json.loads(self._mmap[start:start + meta_length])
+        body = self._mmap[start + meta_length:start + meta_length + body_length]
+        return meta["status"], meta["reason"], meta["headers"], body
+    
+    def replay(self, method: str, url: str, headers, body) -> Interaction:
+        """Returns the next recorded interaction for this request.
+        
+        Repeated identical requests replay their recordings in order. Once those run
+        out, strict mode raises ``CassetteMissError`` and lenient mode keeps replaying
+        the last one.
+        """
+        strict_key, lenient_key = match_keys(method, url, headers, body)
+        key = strict_key if self.match == "strict" else lenient_key
+        offsets = self.index.get(key)
+        if not offsets:
+            raise CassetteMissError(f"No recorded interaction for {key} in {self.directory}")
+        with self._lock:
+            position = self._cursors.get(key, 0)
+            if position >= len(offsets):
+                if self.match == "strict":
+                    raise CassetteMissError(f"Recorded interactions for {key} exhausted after {len(offsets)}")
+                position = len(offsets) - 1
+            self._cursors[key] = position + 1
+        return self._read(offsets[position])
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None and not self._file.closed:
+                self._file.close()
+                with open(self.index_path, "w") as f:
+                    json.dump({"size": os.path.getsize(self.data_path), "keys": self.index}, f)
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+
+
+_stores: Dict[tuple, CassetteStore] = {}
+_stores_lock = threading.Lock()
+
+
+def shared_store(mode: str, directory: Optional[str] = None, match: Optional[str] = None) -> CassetteStore:
+    """Returns the process-wide store for a cassette, so every client records to / replays from one place."""
+    key = (mode, directory or settings.CASSETTE_DIR, match or settings.CASSETTE_MATCH)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = CassetteStore(key[1], mode=key[0], match=key[2])
+            atexit.register(store.close)
+        return store
+
+
+class RecordingAdapter(ClientAdapter):
+    """Sends requests over the network and records every interaction to a cassette."""
+    
+    def __init__(self, store: CassetteStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+    
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        self.store.record(request.method, request.url, request.headers, request.body,
+                          response.status_code, response.reason or "", response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers requests from a cassette without any network I/O."""
+    
+    def __init__(self, store: CassetteStore):
+        super().__init__()
+        self.store = store
+    
+    def send(self, request, **kwargs):
+        status, reason, headers, body = self.store.replay(request.method, request.url, request.headers, request.body)
+        response = ApiResponse()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(0)
+        return response
+    
+    def close(self):
+        pass
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """httpx counterpart of the cassette adapters for ``AsyncBaseClient``."""
+    
+    def __init__(self, store: CassetteStore, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.store = store
+        self.transport = transport
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if self.store.mode == "replay":
+            status, _, headers, content = self.store.replay(request.method, str(request.url), request.headers, body)
+            return httpx.Response(status, headers=headers, content=content, request=request)
+        response = await self.transport.handle_async_request(request)
+        content = await response.aread()
+        self.store.record(request.method, str(request.url), request.headers, body,
+                          response.status_code, response.reason_phrase, response.headers, content)
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS]
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+    
+    async def aclose(self):
+        if self.transport is not None:
+            await self.transport.aclose()
@@ -0,0 +1,79 @@
+import gzip
+from typing import Callable, Dict, List, Optional
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+from clients.response import dumps
+from config.settings import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional codec
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional codec
+    zstandard = None
+
+# Levels that favour speed: the body is compressed on every call, inside the measured request time.
+CODECS: Dict[str, Callable[[bytes], bytes]] = {"gzip": lambda body: gzip.compress(body, compresslevel=5, mtime=0)}
+if brotli is not None:
+    CODECS["br"] = lambda body: brotli.compress(body, quality=4)
+if zstandard is not None:
+    CODECS["zstd"] = lambda body: zstandard.ZstdCompressor(level=3).compress(body)
+
+# Response encodings in order of preference; urllib3 decodes whichever of them it has a codec for.
+PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+
+def decodable_encodings() -> List[str]:
+    """Content encodings the ``requests`` stack can decode in this environment, most preferred first."""
+    supported = {encoding.strip() for encoding in ACCEPT_ENCODING.split(",")}
+    return [encoding for encoding in PREFERENCE if encoding in supported]
+
+
+class CompressedBody(bytes):
+    """Request body bytes that remember their size before compression, for the byte counters."""
+    
+    uncompressed_size: int
+    
+    def __new__(cls, body: bytes, uncompressed_size: int):
+        instance = super().__new__(cls, body)
+        instance.uncompressed_size = uncompressed_size
+        return instance
+
+
+class Compression:
+    """Request body compression and ``Accept-Encoding`` negotiation for ``BaseClient``.
+    
+    JSON bodies of at least ``min_bytes`` are sent compressed with ``encoding`` (``gzip``,
+    ``br`` or ``zstd``). ``accept`` is the ``Accept-Encoding`` header sent with every
+    request. urllib3 decompresses responses chunk by chunk as they are read, so the JSON
+    decoder gets the decoded body without a compressed copy being kept around.
+    """
+    
+    def __init__(self, encoding: Optional[str] = None, min_bytes: int = 1024, accept: Optional[str] = None):
+        if encoding and encoding not in CODECS:
+            raise ValueError(f"Unsupported request encoding '{encoding}', available: {tuple(CODECS)} "
+                             f"(br needs the brotli package, zstd the zstandard package)")
+        self.encoding = encoding or None
+        self.min_bytes = min_bytes
+        self.accept = accept or ", ".join(decodable_encodings())
+    
+    @classmethod
+    def from_settings(cls) -> "Compression":
+        accept = settings.ACCEPT_ENCODING
+        return cls(settings.COMPRESS_REQUESTS, settings.COMPRESS_MIN_BYTES, None if accept == "auto" else accept)
+    
+    def encode(self, kwargs: dict) -> dict:
+        """Replaces a ``json=`` body with its encoded bytes, compressed when it is large enough."""
+        if self.encoding is None or kwargs.get("json") is None:
+            return kwargs
+        kwargs = dict(kwargs)
+        body = dumps(kwargs.pop("json"))
+        if len(body) >= self.min_bytes:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Encoding": self.encoding}
+            body = CompressedBody(CODECS[self.encoding](body), len(body))
+        kwargs["data"] = body
+        return kwargs
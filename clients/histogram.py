@@ -0,0 +1,92 @@
+from array import array
+
+
+class Histogram:
+    """Fixed-size log-linear latency histogram in the style of HdrHistogram.
+    
+    Values are recorded as integer microseconds. Each power-of-two range is split
+    into ``2 ** (significant_bits - 1)`` linear sub-buckets, which bounds the
+    relative error to about ``2 ** -(significant_bits - 1)`` while keeping memory
+    constant no matter how many values are recorded.
+    """
+    
+    def __init__(self, significant_bits: int = 8, max_value_bits: int = 42):
+        self.significant_bits = significant_bits
+        self.max_value_bits = max_value_bits
+        self._sub_bucket_count = 1 << significant_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._max_value = (1 << max_value_bits) - 1
+        size = self._sub_bucket_count + (max_value_bits - significant_bits) * self._half_count
+        self.counts = array("Q", bytes(8 * size))
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value = None
+        self.max_value = 0
+    
+    def _index_for(self, value: int) -> int:
+        if value < self._sub_bucket_count:
+            return value
+        exponent = value.bit_length() - self.significant_bits
+        mantissa = value >> exponent
+        return self._sub_bucket_count + (exponent - 1) * self._half_count + (mantissa - self._half_count)
+    
+    def _value_for(self, index: int) -> int:
+        if index < self._sub_bucket_count:
+            return index
+        offset = index - self._sub_bucket_count
+        exponent = offset // self._half_count + 1
+        mantissa = offset % self._half_count + self._half_count
+        low = mantissa << exponent
+        return low + ((1 << exponent) >> 1)
+    
+    def record(self, value_us: int, count: int = 1):
+        value = min(max(int(value_us), 0), self._max_value)
+        self.counts[self._index_for(value)] += count
+        self.total_count += count
+        self.total_sum += value * count
+        if self.min_value is None or value < self.min_value:
+            self.min_value = value
+        if value > self.max_value:
+            self.max_value = value
+    
+    def record_seconds(self, seconds: float):
+        self.record(int(seconds * 1_000_000))
+    
+    def merge(self, other: "Histogram"):
+        if (other.significant_bits, other.max_value_bits) != (self.significant_bits, self.max_value_bits):
+            raise ValueError("Cannot merge histograms with different layouts")
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] += count
+        self.total_count += other.total_count
+        self.total_sum += other.total_sum
+        if other.min_value is not None and (self.min_value is None or other.min_value < self.min_value):
+            self.min_value = other.min_value
+        self.max_value = max(self.max_value, other.max_value)
+    
+    def percentile(self, percentile: float) -> int:
+        """Returns the recorded value (in microseconds) at the given percentile (0-100)."""
+        if not self.total_count:
+            return 0
+        target = max(1, int(round(self.total_count * percentile / 100.0)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min(self._value_for(index), self.max_value)
+        return self.max_value
+    
+    def percentiles(self, *percentiles: float) -> dict:
+        return {p: self.percentile(p) for p in percentiles}
+    
+    @property
+    def mean(self) -> float:
+        return self.total_sum / self.total_count if self.total_count else 0.0
+    
+    def reset(self):
+        self.counts = array("Q", bytes(8 * len(self.counts)))
+        self.total_count = 0
+        self.total_sum = 0
+        self.min_value = None
+        self.max_value = 0
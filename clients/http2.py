@@ -0,0 +1,152 @@
+import ssl
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+import httpx
+from requests import exceptions
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from urllib3.exceptions import NewConnectionError
+
+from clients.instrumentation import timings
+from clients.response import ApiResponse
+from config.settings import settings
+
+# httpcore trace steps that make up establishing a connection (TCP connect, then the TLS handshake).
+CONNECT_STEPS = ("connection.connect_tcp", "connection.start_tls")
+
+
+Cert = Union[None, str, Tuple[str, str]]
+
+
+@lru_cache(maxsize=None)
+def ssl_context(verify: Union[bool, str] = True, cert: Cert = None) -> ssl.SSLContext:
+    """One SSL context per ``verify`` and client ``cert`` value, shared by every httpx-backed client.
+    
+    Loading the CA bundle takes ~40ms, which httpx would otherwise repeat for every new client.
+    """
+    if isinstance(verify, str):
+        context = ssl.create_default_context(cafile=verify)
+    else:
+        context = httpx.create_ssl_context(verify=verify)
+    if isinstance(cert, tuple):
+        context.load_cert_chain(*cert)
+    elif cert:
+        context.load_cert_chain(cert)
+    return context
+
+
+def parse_pool_sizes(spec: str) -> Dict[str, int]:
+    """Parses ``API_HOST_POOL_SIZES`` (``host=size,host=size``)."""
+    sizes = {}
+    for item in spec.split(","):
+        host, _, size = item.strip().partition("=")
+        if host:
+            sizes[host] = int(size)
+    return sizes
+
+
+class Http2Adapter(BaseAdapter):
+    """``BaseClient`` transport backed by ``httpx.Client`` with HTTP/2 enabled.
+    
+    Every origin gets its own client and connection pool. The pool is sized from
+    ``API_HOST_POOL_SIZES`` and falls back to ``API_POOL_SIZE``. Over TLS, ALPN
+    negotiates HTTP/2, so concurrent requests to one host share a single multiplexed
+    connection instead of each opening (and handshaking) their own. All clients share
+    one SSL context. Plain ``http://`` origins stay on HTTP/1.1 with keep-alive.
+    
+    ``proxies`` and ``cert`` are honoured like ``requests.adapters.HTTPAdapter`` does:
+    the proxy is picked per URL, and the client certificate is only used for ``https``.
+    """
+    
+    def __init__(self, pool_sizes: Optional[Dict[str, int]] = None, pool_size: Optional[int] = None,
+                 keepalive_expiry: Optional[float] = None, http2: bool = True):
+        super().__init__()
+        self.pool_sizes = parse_pool_sizes(settings.HOST_POOL_SIZES) if pool_sizes is None else pool_sizes
+        self.pool_size = pool_size or settings.POOL_SIZE
+        self.keepalive_expiry = keepalive_expiry or settings.KEEPALIVE_EXPIRY
+        self.http2 = http2
+        self._clients: Dict[tuple, httpx.Client] = {}
+        self._lock = threading.Lock()
+    
+    def _client(self, url: httpx.URL, verify: Union[bool, str], cert: Cert = None,
+                proxy: Optional[str] = None) -> httpx.Client:
+        cert = tuple(cert) if isinstance(cert, list) else cert
+        key = (url.scheme, url.host, url.port, verify, cert, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    size = self.pool_sizes.get(url.host, self.pool_size)
+                    client = self._clients[key] = httpx.Client(
+                        http2=self.http2,
+                        verify=ssl_context(verify, cert) if verify is not False or cert else False,
+                        limits=httpx.Limits(max_connections=size, max_keepalive_connections=size,
+                                            keepalive_expiry=self.keepalive_expiry),
+                        proxy=proxy,
+                        trust_env=False,
+                    )
+        return client
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        started = None
+    
+        def trace(event: str, info: dict):
+            nonlocal started
+            step, _, stage = event.rpartition(".")
+            if step not in CONNECT_STEPS:
+                return
+            if stage == "started":
+                started = time.perf_counter()
+            elif started is not None:
+                timings.connect = getattr(timings, "connect", 0.0) + time.perf_counter() - started
+                started = None
+    
+        url = httpx.URL(request.url)
+        proxy = select_proxy(request.url, proxies) if proxies else None
+        client = self._client(url, verify, cert if url.scheme == "https" else None, proxy)
+        try:
+            response = client.request(
+                request.method, url, headers=list(request.headers.items()), content=request.body,
+                timeout=httpx.Timeout(read, connect=connect), extensions={"trace": trace},
+            )
+        except httpx.ConnectTimeout as error:
+            raise exceptions.ConnectTimeout(error, request=request) from error
+        except httpx.TimeoutException as error:
+            raise exceptions.ReadTimeout(error, request=request) from error
+        except httpx.ConnectError as error:
+            # Shaped like requests' own refused-connection error, so retries can tell nothing was sent.
+            raise exceptions.ConnectionError(NewConnectionError(None, str(error)), request=request) from error
+        except httpx.TransportError as error:
+            raise exceptions.ConnectionError(error, request=request) from error
+        return self.build_response(request, response)
+    
+    def build_response(self, request, response: httpx.Response) -> ApiResponse:
+        headers = CaseInsensitiveDict(response.headers)
+        if "content-encoding" in headers:
+            # httpx has already decoded the body, so these no longer describe ``_content``.
+            del headers["content-encoding"]
+            headers.pop("content-length", None)
+        result = ApiResponse()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = headers
+        result.encoding = get_encoding_from_headers(headers)
+        result._content = response.content
+        result.wire_bytes = response.num_bytes_downloaded
+        result.url = request.url
+        result.request = request
+        result.connection = self
+        result.elapsed = response.elapsed
+        return result
+    
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
@@ -0,0 +1,317 @@
+import atexit
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from clients.histogram import Histogram
+
+timings = threading.local()
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """Collapses numeric path segments, e.g. ``/products/42`` -> ``/products/{id}``."""
+    return _ID_SEGMENT.sub("/{id}", endpoint)
+
+
+@dataclass
+class RequestRecord:
+    method: str
+    endpoint: str
+    status: Optional[int]
+    bytes_sent: int
+    bytes_received: int
+    connect_time: float
+    ttfb: float
+    total_time: float
+    decode_time: float
+    timestamp: float
+    error: Optional[str] = None
+    uncompressed_bytes_sent: int = 0
+    uncompressed_bytes_received: int = 0
+
+
+def wire_bytes(response) -> int:
+    """Response body bytes as received, i.e. before any ``Content-Encoding`` was decoded."""
+    received = getattr(response, "wire_bytes", None)
+    if received is None:
+        tell = getattr(response.raw, "tell", None)
+        received = tell() if tell is not None else None
+    return received if received is not None else len(response.content)
+
+
+class InMemorySink:
+    """Aggregates records per ``(method, endpoint)`` into latency histograms and counters."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats: Dict[tuple, dict] = {}
+    
+    def _new_stats(self) -> dict:
+        return {
+            "count": 0,
+            "errors": 0,
+            "statuses": defaultdict(int),
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "uncompressed_bytes_sent": 0,
+            "uncompressed_bytes_received": 0,
+            "connect": Histogram(),
+            "ttfb": Histogram(),
+            "total": Histogram(),
+            "decode": Histogram(),
+        }
+    
+    def publish(self, record: RequestRecord):
+        key = (record.method, record.endpoint)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = self._new_stats()
+            stats["count"] += 1
+            stats["statuses"][record.status or record.error] += 1
+            if record.error or (record.status and record.status >= 500):
+                stats["errors"] += 1
+            stats["bytes_sent"] += record.bytes_sent
+            stats["bytes_received"] += record.bytes_received
+            stats["uncompressed_bytes_sent"] += record.uncompressed_bytes_sent
+            stats["uncompressed_bytes_received"] += record.uncompressed_bytes_received
+            stats["connect"].record_seconds(record.connect_time)
+            stats["ttfb"].record_seconds(record.ttfb)
+            stats["total"].record_seconds(record.total_time)
+            stats["decode"].record_seconds(record.decode_time)
+    
+    def summary(self) -> List[dict]:
+        rows = []
+        with self._lock:
+            for (method, endpoint), stats in sorted(self.stats.items()):
+                row = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "statuses": dict(stats["statuses"]),
+                    "bytes_sent": stats["bytes_sent"],
+                    "bytes_received": stats["bytes_received"],
+                    "uncompressed_bytes_sent": stats["uncompressed_bytes_sent"],
+                    "uncompressed_bytes_received": stats["uncompressed_bytes_received"],
+                }
+                for phase in ("connect", "ttfb", "total", "decode"):
+                    histogram = stats[phase]
+                    row[f"{phase}_p50_ms"] = histogram.percentile(50) / 1000
+                    row[f"{phase}_p99_ms"] = histogram.percentile(99) / 1000
+                rows.append(row)
+        return rows
+    
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """Appends one JSON object per request to a file."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", buffering=1 << 16)
+    
+    def publish(self, record: RequestRecord):
+        line = json.dumps(asdict(record), separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+    
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class PrometheusSink:
+    """Keeps Prometheus-style counters and cumulative histograms and renders the text exposition format."""
+    
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._requests: Dict[tuple, int] = defaultdict(int)
+        self._bytes: Dict[tuple, int] = defaultdict(int)
+        self._uncompressed_bytes: Dict[tuple, int] = defaultdict(int)
+        self._histograms: Dict[tuple, list] = {}
+    
+    def publish(self, record: RequestRecord):
+        status = str(record.status) if record.status is not None else record.error
+        with self._lock:
+            self._requests[(record.method, record.endpoint, status)] += 1
+            self._bytes[(record.method, record.endpoint, "sent")] += record.bytes_sent
+            self._bytes[(record.method, record.endpoint, "received")] += record.bytes_received
+            self._uncompressed_bytes[(record.method, record.endpoint, "sent")] += record.uncompressed_bytes_sent
+            self._uncompressed_bytes[(record.method, record.endpoint, "received")] += record.uncompressed_bytes_received
+            for phase, value in (("connect", record.connect_time), ("ttfb", record.ttfb),
+                                 ("total", record.total_time), ("decode", record.decode_time)):
+                key = (record.method, record.endpoint, phase)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = [[0] * len(self.BUCKETS), 0, 0.0]
+                for index, bound in enumerate(self.BUCKETS):
+                    if value <= bound:
+                        histogram[0][index] += 1
+                        break
+                histogram[1] += 1
+                histogram[2] += value
+    
+    def render(self) -> str:
+        lines = [
+            "# HELP api_client_requests_total Requests sent by the API client.",
+            "# TYPE api_client_requests_total counter",
+        ]
+        with self._lock:
+            for (method, endpoint, status), count in sorted(self._requests.items()):
+                lines.append(f'api_client_requests_total{{method="{method}",endpoint="{endpoint}",status="{status}"}} {count}')
+            lines += [
+                "# HELP api_client_bytes_total Request and response body bytes on the wire, i.e. compressed.",
+                "# TYPE api_client_bytes_total counter",
+            ]
+            for (method, endpoint, direction), count in sorted(self._bytes.items()):
+                lines.append(f'api_client_bytes_total{{method="{method}",endpoint="{endpoint}",direction="{direction}"}} {count}')
+            lines += [
+                "# HELP api_client_uncompressed_bytes_total Request and response body bytes before compression.",
+                "# TYPE api_client_uncompressed_bytes_total counter",
+            ]
+            for (method, endpoint, direction), count in sorted(self._uncompressed_bytes.items()):
+                lines.append(f'api_client_uncompressed_bytes_total{{method="{method}",endpoint="{endpoint}",'
+                             f'direction="{direction}"}} {count}')
+            lines += [
+                "# HELP api_client_request_seconds Request latency by phase.",
+                "# TYPE api_client_request_seconds histogram",
+            ]
+            for (method, endpoint, phase), (buckets, count, total) in sorted(self._histograms.items()):
+                labels = f'method="{method}",endpoint="{endpoint}",phase="{phase}"'
+                cumulative = 0
+                for bound, bucket in zip(self.BUCKETS, buckets):
+                    cumulative += bucket
+                    lines.append(f'api_client_request_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'api_client_request_seconds_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f"api_client_request_seconds_sum{{{labels}}} {total}")
+                lines.append(f"api_client_request_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+    
+    def close(self):
+        if self.path:
+            with open(self.path, "w") as f:
+                f.write(self.render())
+
+
+class Measurement:
+    __slots__ = ("response",)
+    
+    def __init__(self):
+        self.response = None
+
+
+class Instrumentation:
+    """Times each ``BaseClient`` call and publishes a ``RequestRecord`` to every sink."""
+    
+    def __init__(self, sinks: List[object], decode: bool = True):
+        self.sinks = list(sinks)
+        self.decode = decode
+    
+    @classmethod
+    def from_settings(cls) -> Optional["Instrumentation"]:
+        """Returns the process-wide instrumentation configured by ``API_INSTRUMENTATION``, or None."""
+        global _shared
+        if not settings.INSTRUMENTATION:
+            return None
+        if _shared is None:
+            sinks = []
+            for name in settings.INSTRUMENTATION.split(","):
+                name = name.strip()
+                if name == "memory":
+                    sinks.append(InMemorySink())
+                elif name == "jsonl":
+                    sinks.append(JsonlSink(settings.INSTRUMENTATION_JSONL_PATH))
+                elif name == "prometheus":
+                    sinks.append(PrometheusSink(settings.INSTRUMENTATION_PROMETHEUS_PATH))
+                elif name:
+                    raise ValueError(f"Unknown instrumentation sink '{name}'")
+            _shared = cls(sinks)
+            atexit.register(_shared.close)
+        return _shared
+    
+    def sink(self, sink_type: type):
+        return next((sink for sink in self.sinks if isinstance(sink, sink_type)), None)
+    
+    @contextmanager
+    def measure(self, method: str, endpoint: str):
+        measurement = Measurement()
+        timings.connect = 0.0
+        started = time.perf_counter()
+        error = None
+        try:
+            yield measurement
+        except Exception as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            total_time = time.perf_counter() - started
+            self.publish(self._record(method, endpoint, measurement.response, total_time, error))
+    
+    def _record(self, method: str, endpoint: str, response, total_time: float,
+                error: Optional[str]) -> RequestRecord:
+        status = ttfb = None
+        bytes_sent = bytes_received = uncompressed_sent = uncompressed_received = 0
+        decode_time = 0.0
+        connect_time = getattr(timings, "connect", 0.0)
+        if response is not None:
+            status = response.status_code
+            # ``elapsed`` runs from send() to the response headers, so it includes any new connection.
+            ttfb = max(response.elapsed.total_seconds() - connect_time, 0.0)
+            body = response.request.body
+            bytes_sent = len(body) if body else 0
+            uncompressed_sent = getattr(body, "uncompressed_size", bytes_sent)
+            content = response.content
+            bytes_received = wire_bytes(response)
+            uncompressed_received = len(content)
+            if self.decode and content:
+                # ApiResponse caches the decoded body, so the caller's own json() call is free.
+                decode_started = time.perf_counter()
+                try:
+                    response.json()
+                except ValueError:
+                    pass
+                decode_time = time.perf_counter() - decode_started
+        return RequestRecord(
+            method=method,
+            endpoint=endpoint_template(endpoint),
+            status=status,
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            connect_time=connect_time,
+            ttfb=ttfb if ttfb is not None else total_time,
+            total_time=total_time,
+            decode_time=decode_time,
+            timestamp=time.time(),
+            error=error,
+            uncompressed_bytes_sent=uncompressed_sent,
+            uncompressed_bytes_received=uncompressed_received,
+        )
+    
+    def publish(self, record: RequestRecord):
+        for sink in self.sinks:
+            sink.publish(record)
+    
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+_shared: Optional[Instrumentation] = None
@@ -0,0 +1,41 @@
+from typing import Optional
+
+
+class Product:
+    """Lightweight typed view of a product record."""
+    
+    __slots__ = ("id", "name", "price", "description", "stock", "image_url")
+    
+    def __init__(self, id: int, name: str, price: float, description: Optional[str] = None,
+                 stock: int = 0, image_url: Optional[str] = None):
+        self.id = id
+        self.name = name
+        self.price = price
+        self.description = description
+        self.stock = stock
+        self.image_url = image_url
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Product":
+        return cls(
+            data["id"],
+            data["name"],
+            data["price"],
+            data.get("description"),
+            data.get("stock", 0),
+            data.get("image_url"),
+        )
+    
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Product):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+    
+    # Records are mutable and compare by value, so they are deliberately unhashable; key sets and dicts by ``id``.
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"Product(id={self.id!r}, name={self.name!r}, price={self.price!r}, stock={self.stock!r})"
@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+from config.settings import settings
+
+
+class PageSizer:
+    """Grows the page size while pages come back quickly and shrinks it when they are slow.
+    
+    A page shorter than requested means either the end of the collection or a server-side
+    cap on ``limit``; the sizer remembers it as the new maximum so later requests stay
+    aligned with what the server actually returns.
+    """
+    
+    def __init__(self, initial: Optional[int] = None, minimum: int = 10, maximum: Optional[int] = None,
+                 target_latency: Optional[float] = None):
+        self.maximum = maximum or settings.MAX_PAGE_SIZE
+        self.minimum = min(minimum, self.maximum)
+        self.size = max(self.minimum, min(initial or settings.PAGE_SIZE, self.maximum))
+        self.target_latency = target_latency or settings.PAGE_TARGET_LATENCY
+    
+    def update(self, elapsed: float, requested: int, returned: int):
+        if 0 < returned < requested:
+            self.maximum = max(self.minimum, returned)
+            self.size = min(self.size, self.maximum)
+            return
+        if elapsed < self.target_latency / 2:
+            self.size = min(self.maximum, self.size * 2)
+        elif elapsed > self.target_latency * 1.5:
+            self.size = max(self.minimum, self.size // 2)
+
+
+def _timed(fetch_page: Callable[[int, int], List[dict]], skip: int, limit: int) -> Tuple[List[dict], float]:
+    started = time.perf_counter()
+    page = fetch_page(skip, limit)
+    return page, time.perf_counter() - started
+
+
+def iter_pages(fetch_page: Callable[[int, int], List[dict]], skip: int = 0, prefetch: Optional[int] = None,
+               sizer: Optional[PageSizer] = None) -> Iterator[List[dict]]:
+    """Yields pages from ``fetch_page(skip, limit)`` while up to ``prefetch`` further pages load in the background.
+    
+    Only the current page and the prefetched ones are held in memory.
+    """
+    prefetch = settings.PREFETCH_PAGES if prefetch is None else prefetch
+    sizer = sizer or PageSizer()
+    executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+    pending = deque()
+    next_skip = skip
+    
+    def issue():
+        nonlocal next_skip
+        limit = sizer.size
+        pending.append((next_skip, limit, executor.submit(_timed, fetch_page, next_skip, limit)))
+        next_skip += limit
+    
+    try:
+        issue()
+        while pending:
+            page_skip, limit, future = pending.popleft()
+            page, elapsed = future.result()
+            if not page:
+                return
+            sizer.update(elapsed, limit, len(page))
+            if len(page) < limit:
+                # Anything already in flight was issued at offsets that assumed a full page.
+                for _, _, stale in pending:
+                    stale.cancel()
+                pending.clear()
+                next_skip = page_skip + len(page)
+            while len(pending) <= prefetch:
+                issue()
+            yield page
+    finally:
+        for _, _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(fetch_page: Callable[[int, int], Awaitable[List[dict]]], skip: int = 0,
+                      prefetch: Optional[int] = None, sizer: Optional[PageSizer] = None) -> AsyncIterator[List[dict]]:
+    """Async counterpart of ``iter_pages``; prefetching runs as tasks on the current event loop."""
+    prefetch = settings.PREFETCH_PAGES if prefetch is None else prefetch
+    sizer = sizer or PageSizer()
+    pending = deque()
+    next_skip = skip
+    
+    async def timed(page_skip: int, limit: int):
+        started = time.perf_counter()
+        page = await fetch_page(page_skip, limit)
+        return page, time.perf_counter() - started
+    
+    def issue():
+        nonlocal next_skip
+        limit = sizer.size
+        pending.append((next_skip, limit, asyncio.ensure_future(timed(next_skip, limit))))
+        next_skip += limit
+    
+    try:
+        issue()
+        while pending:
+            page_skip, limit, task = pending.popleft()
+            page, elapsed = await task
+            if not page:
+                return
+            sizer.update(elapsed, limit, len(page))
+            if len(page) < limit:
+                for _, _, stale in pending:
+                    stale.cancel()
+                pending.clear()
+                next_skip = page_skip + len(page)
+            while len(pending) <= prefetch:
+                issue()
+            yield page
+    finally:
+        for _, _, task in pending:
+            task.cancel()
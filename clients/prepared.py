@@ -0,0 +1,89 @@
+import re
+from typing import Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.compat import json as complexjson
+from requests.cookies import RequestsCookieJar
+from requests.models import PreparedRequest
+from requests.utils import get_netrc_auth
+
+# Paths made only of these characters come out of requests' URL preparation unchanged.
+_PLAIN_PATH = re.compile(r"[A-Za-z0-9/_.~-]*\Z")
+
+
+class PreparedSender:
+    """Sends ``BaseClient`` requests without ``Session.request``'s per-call preparation.
+    
+    ``Session.request`` merges the session's settings into every request and re-reads the
+    proxy and CA bundle environment on each call, scanning all of ``os.environ`` twice.
+    This sender resolves those settings once, against the client's base URL, and builds each
+    ``PreparedRequest`` directly from the session headers, the URL and the encoded body.
+    
+    ``prepare`` returns None for anything it cannot build exactly as requests would (auth,
+    files, cookies, session hooks, paths that need quoting, JSON requests refuses to encode),
+    and the client then falls back to ``Session.request``. JSON bodies are encoded with the
+    same encoder and options as requests, so they are byte-for-byte what it would send. Changes to the proxy environment, ``session.verify`` or
+    ``session.proxies`` after the first request are not picked up.
+    """
+    
+    def __init__(self, session: requests.Session, base_url: str, timeout):
+        self.session = session
+        self.base_url = base_url
+        self.timeout = timeout
+        self._send_kwargs: Optional[dict] = None
+        probe = PreparedRequest()
+        probe.prepare_url(f"{base_url}/", None)
+        # A base URL requests would rewrite (IDNA host, missing path...) always takes the regular path.
+        self.enabled = probe.url == f"{base_url}/" and not (session.trust_env and get_netrc_auth(base_url))
+    
+    @property
+    def send_kwargs(self) -> dict:
+        if self._send_kwargs is None:
+            settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+            self._send_kwargs = {"timeout": self.timeout, "allow_redirects": True, **settings}
+        return self._send_kwargs
+    
+    def prepare(self, method: str, url: str, params: Optional[dict] = None, data: Optional[bytes] = None,
+                json=None, headers: Optional[dict] = None, **unsupported) -> Optional[PreparedRequest]:
+        session = self.session
+        if (unsupported or not self.enabled or not url.startswith(self.base_url)
+                or not _PLAIN_PATH.match(url, len(self.base_url))
+                or (data is not None and not isinstance(data, bytes))
+                or session.auth or session.cookies or session.hooks["response"]):
+            return None
+        if json is not None:
+            if data is not None:
+                return None
+            try:
+                data = complexjson.dumps(json, allow_nan=False)
+            except (TypeError, ValueError):
+                # e.g. NaN; requests raises its own InvalidJSONError for these.
+                return None
+            if not isinstance(data, bytes):
+                data = data.encode("utf-8")
+    
+        request = PreparedRequest()
+        request.method = method
+        if params:
+            query = urlencode([(key, value) for key, value in params.items() if value is not None], doseq=True)
+            request.url = f"{url}?{query}" if query else url
+        else:
+            request.url = url
+        request.headers = session.headers.copy()
+        if headers:
+            for name, value in headers.items():
+                if value is None:
+                    request.headers.pop(name, None)
+                else:
+                    request.headers[name] = value
+        request.body = data
+        if data is not None:
+            request.headers["Content-Length"] = str(len(data))
+        elif method not in ("GET", "HEAD"):
+            request.headers["Content-Length"] = "0"
+        request._cookies = RequestsCookieJar()
+        return request
+    
+    def send(self, request: PreparedRequest) -> requests.Response:
+        return self.session.send(request, **self.send_kwargs)
@@ -1,19 +1,53 @@
 import requests
-from typing import Optional
+from functools import partial
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, Optional, Union
+from config.settings import settings
 from clients.base_client import BaseClient
+from clients.batch import (
+    BatchResult, Chunk, bulk_mode, bulk_results, bulk_support, chunked, create_operation, decode,
+    delete_operation, failed_results, run_chunks, update_operation
+)
+from clients.models import Product
+from clients.pagination import PageSizer, iter_pages
+from clients.response import ApiResponse
+from clients.schemas import PRODUCT, PRODUCT_LIST, ResponseValidator, Schema
 
 
 class ProductsClient(BaseClient):
     
     ENDPOINT = "/products/"
+    BULK_ENDPOINT = "/products/bulk"
     
-    def get_products(self, skip: int = 0, limit: int = 100) -> requests.Response:
+    def __init__(self, *args, validator: Optional[ResponseValidator] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bulk_supported = bulk_mode(settings.BULK_ENDPOINTS)
+        self.validator = validator or ResponseValidator.from_settings()
+    
+    def _request(self, method: str, endpoint: str, use_cache: bool = True, **kwargs) -> requests.Response:
+        response = super()._request(method, endpoint, use_cache=use_cache, **kwargs)
+        if isinstance(response, ApiResponse):
+            response.model_type = Product
+        if self.validator is not None:
+            schema = self._schema_for(method, endpoint)
+            if schema is not None:
+                self.validator.check(schema, endpoint, response)
+        return response
+    
+    def _schema_for(self, method: str, endpoint: str) -> Optional[Schema]:
+        if endpoint == self.ENDPOINT:
+            return PRODUCT_LIST if method == "GET" else PRODUCT if method == "POST" else None
+        if endpoint.startswith(self.ENDPOINT) and method in ("GET", "PATCH", "PUT"):
+            return PRODUCT if endpoint[len(self.ENDPOINT):].isdigit() else None
+        return None
+    
+    def get_products(self, skip: int = 0, limit: int = 100, use_cache: bool = True) -> requests.Response:
         params = {"skip": skip, "limit": limit}
-        return self.get(self.ENDPOINT, params=params)
+        return self.get(self.ENDPOINT, params=params, use_cache=use_cache)
     
-    def get_product(self, product_id: int) -> requests.Response:
+    def get_product(self, product_id: int, use_cache: bool = True) -> requests.Response:
         endpoint = f"{self.ENDPOINT}{product_id}"
-        return self.get(endpoint)
+        return self.get(endpoint, use_cache=use_cache)
     
     def create_product(self, name: str, price: float, description: Optional[str] = None, 
                        stock: int = 0) -> requests.Response:
@@ -34,3 +68,87 @@ class ProductsClient(BaseClient):
     def delete_product(self, product_id: int) -> requests.Response:
         endpoint = f"{self.ENDPOINT}{product_id}"
         return self.delete(endpoint)
+    
+    def _fetch_page(self, skip: int, limit: int, typed: bool = False) -> list:
+        response = self.get_products(skip=skip, limit=limit)
+        response.raise_for_status()
+        return response.model if typed else response.json()
+    
+    def iter_products(self, skip: int = 0, page_size: Optional[int] = None, prefetch: Optional[int] = None,
+                      typed: bool = False) -> Iterator[Union[dict, Product]]:
+        """Streams the whole catalog page by page, prefetching upcoming pages in the background."""
+        fetch_page = partial(self._fetch_page, typed=typed)
+        for page in iter_pages(fetch_page, skip=skip, prefetch=prefetch, sizer=PageSizer(page_size)):
+            yield from page
+    
+    def create_products(self, products: Iterable[dict], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> Iterator[BatchResult]:
+        """Creates every product payload in ``products``. See ``_batch`` for how results are delivered."""
+        return self._batch(map(create_operation, products), ordered, concurrency)
+    
+    def update_products(self, products: Iterable[dict], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> Iterator[BatchResult]:
+        """Applies partial updates, each given as a dict with the product ``id`` and the fields to change."""
+        return self._batch(map(update_operation, products), ordered, concurrency)
+    
+    def delete_products(self, product_ids: Iterable[int], ordered: bool = True,
+                        concurrency: Optional[int] = None) -> Iterator[BatchResult]:
+        return self._batch(map(delete_operation, product_ids), ordered, concurrency)
+    
+    def _batch(self, operations: Iterable[dict], ordered: bool = True,
+               concurrency: Optional[int] = None) -> Iterator[BatchResult]:
+        """Streams one ``BatchResult`` per operation, in input order or as they complete.
+        
+        Operations go to the bulk endpoint in ``API_BATCH_SIZE`` chunks. When the server has no bulk
+        endpoint they fan out as single requests instead. Either way at most ``concurrency`` requests
+        are in flight. A failed item is reported in its result and never aborts the rest of the batch.
+        """
+        concurrency = concurrency or settings.BATCH_CONCURRENCY
+        operations = iter(operations)
+        start = 0
+        if self.bulk_supported is None:
+            probe = list(islice(operations, settings.BATCH_SIZE))
+            if not probe:
+                return
+            results = self._send_bulk((0, probe))
+            if self.bulk_supported is False:
+                operations = chain(probe, operations)
+            else:
+                yield from results
+                start = len(probe)
+        if self.bulk_supported is False:
+            yield from run_chunks(self._send_single, chunked(operations, 1, start), concurrency, ordered)
+        else:
+            yield from run_chunks(self._send_bulk, chunked(operations, settings.BATCH_SIZE, start), concurrency,
+                                  ordered)
+    
+    def _send_bulk(self, chunk: Chunk) -> List[BatchResult]:
+        start, operations = chunk
+        try:
+            response = self.post(self.BULK_ENDPOINT, data={"operations": operations})
+        except requests.RequestException as error:
+            return failed_results(start, operations, error)
+        if self.bulk_supported is None:
+            # A 5xx, 429 or auth error on the probe says nothing about the endpoint; the next chunk asks again.
+            self.bulk_supported = bulk_support(response.status_code)
+        if self.cache is not None:
+            for operation in operations:
+                if "id" in operation:
+                    self.cache.invalidate(f"{self.ENDPOINT}{operation['id']}")
+        return bulk_results(start, operations, response.status_code, decode(response))
+    
+    def _send_single(self, chunk: Chunk) -> List[BatchResult]:
+        index, (operation,) = chunk
+        try:
+            response = self._send_operation(operation)
+        except requests.RequestException as error:
+            return [BatchResult(index, error=error)]
+        return [BatchResult(index, response.status_code, decode(response))]
+    
+    def _send_operation(self, operation: dict) -> requests.Response:
+        if operation["op"] == "create":
+            return self.post(self.ENDPOINT, data=operation["data"])
+        endpoint = f"{self.ENDPOINT}{operation['id']}"
+        if operation["op"] == "update":
+            return self.patch(endpoint, data=operation["data"])
+        return self.delete(endpoint)
@@ -0,0 +1,182 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+_STATE = struct.Struct("<dd")
+
+# (method or None for any, path prefix, requests per second)
+Rule = Tuple[Optional[str], str, float]
+
+
+def parse_limits(spec: str) -> List[Rule]:
+    """Parses ``API_RATE_LIMITS`` (``[METHOD ]path-prefix=rps,...``), e.g. ``POST /products/=5,/products/bulk=1``."""
+    rules = []
+    for item in spec.split(","):
+        endpoint, _, rate = item.strip().rpartition("=")
+        if not endpoint:
+            continue
+        method, _, prefix = endpoint.strip().rpartition(" ")
+        rules.append((method.upper() or None, prefix, float(rate)))
+    return rules
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, holding at most ``burst``.
+    
+    ``reserve`` takes a token right away, letting the balance go negative, and returns how
+    long the caller must wait before using it. Waiters are therefore served in arrival
+    order at exactly ``rate`` per second, without polling.
+    """
+    
+    def __init__(self, rate: float, burst: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.clock = clock
+        self.tokens = self.burst
+        self.updated = clock()
+        self._lock = threading.Lock()
+    
+    def _take(self, tokens: float, updated: float, now: float, count: float) -> Tuple[float, float]:
+        """Returns the balance after taking ``count`` tokens and the delay until they are covered."""
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate) - count
+        return tokens, (-tokens / self.rate if tokens < 0 else 0.0)
+    
+    def reserve(self, count: float = 1.0) -> float:
+        with self._lock:
+            now = self.clock()
+            self.tokens, delay = self._take(self.tokens, self.updated, now, count)
+            self.updated = now
+        return delay
+
+
+class SharedTokenBucket(TokenBucket):
+    """``TokenBucket`` whose state lives in a 16-byte file, so every process using the file shares the budget.
+    
+    The file is memory-mapped and guarded by an ``flock``, so a reservation costs two system
+    calls and never touches the disk. Wall-clock time is used, as monotonic clocks of
+    different processes are not guaranteed to agree.
+    """
+    
+    def __init__(self, path: str, rate: float, burst: float = 1.0, clock: Callable[[], float] = time.time):
+        if fcntl is None:
+            raise RuntimeError("Cross-process rate limiting needs fcntl, which this platform does not have")
+        super().__init__(rate, burst, clock)
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.write(self._fd, _STATE.pack(self.burst, clock()))
+            self._mmap = mmap.mmap(self._fd, _STATE.size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def reserve(self, count: float = 1.0) -> float:
+        # flock excludes other processes only; threads of this one share the descriptor.
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                now = self.clock()
+                tokens, updated = _STATE.unpack_from(self._mmap)
+                tokens, delay = self._take(tokens, min(updated, now), now, count)
+                _STATE.pack_into(self._mmap, 0, tokens, now)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return delay
+    
+    def close(self):
+        self._mmap.close()
+        os.close(self._fd)
+
+
+class RateLimiter:
+    """Request budget shared by every client: a global bucket plus optional per-endpoint buckets.
+    
+    A request takes a token from the global bucket and from the bucket of the most specific
+    rule matching its method and path (longest prefix; a rule naming the method wins a tie),
+    then waits until both are available.
+    """
+    
+    def __init__(self, global_bucket: Optional[TokenBucket] = None,
+                 rules: Optional[List[Tuple[Optional[str], str, TokenBucket]]] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.global_bucket = global_bucket
+        self.rules = sorted(rules or [], key=lambda rule: (len(rule[1]), rule[0] is not None), reverse=True)
+        self.sleep = sleep
+        self.throttled = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls) -> Optional["RateLimiter"]:
+        """Returns the process-wide limiter, or ``None`` when no limit is configured.
+    
+        With ``API_RATE_LIMIT_DIR`` set, the buckets are files in that directory, shared by all
+        processes (e.g. xdist workers, or concurrent suites on one host) that point at it.
+        """
+        global _shared
+        rules = parse_limits(settings.RATE_LIMITS)
+        if settings.RATE_LIMIT <= 0 and not rules:
+            return None
+        if _shared is None:
+            bucket = _bucket_factory(settings.RATE_LIMIT_DIR, settings.RATE_LIMIT_BURST)
+            _shared = cls(
+                bucket("*", settings.RATE_LIMIT) if settings.RATE_LIMIT > 0 else None,
+                [(method, prefix, bucket(f"{method} {prefix}", rate)) for method, prefix, rate in rules],
+            )
+        return _shared
+    
+    def bucket_for(self, method: str, path: str) -> Optional[TokenBucket]:
+        for rule_method, prefix, bucket in self.rules:
+            if path.startswith(prefix) and rule_method in (None, method):
+                return bucket
+        return None
+    
+    def reserve(self, method: str, path: str) -> float:
+        """Takes the tokens for one request and returns how long to wait before sending it."""
+        delay = self.global_bucket.reserve() if self.global_bucket is not None else 0.0
+        bucket = self.bucket_for(method, path)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        if delay > 0:
+            with self._lock:
+                self.throttled += 1
+                self.waited += delay
+        return delay
+    
+    def acquire(self, method: str, path: str) -> float:
+        delay = self.reserve(method, path)
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {"throttled": self.throttled, "waited_seconds": round(self.waited, 3)}
+
+
+def _bucket_factory(directory: str, burst: float) -> Callable[[str, float], TokenBucket]:
+    if not directory:
+        return lambda name, rate: TokenBucket(rate, burst)
+    os.makedirs(directory, exist_ok=True)
+    
+    def shared(name: str, rate: float) -> TokenBucket:
+        digest = hashlib.sha1(name.encode()).hexdigest()[:16]
+        return SharedTokenBucket(os.path.join(directory, f"{digest}.bucket"), rate, burst)
+    return shared
+
+
+_shared: Optional[RateLimiter] = None
@@ -0,0 +1,259 @@
+import email.utils
+import random
+import threading
+import time
+from collections import Counter
+from datetime import timezone
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from config.settings import settings
+
+# Failures that say something about the host's health. Other ``RequestException``s (invalid
+# URLs, cassette misses...) neither open the circuit nor close it.
+TRANSPORT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Decides whether a failed attempt may be retried and how long to wait first.
+    
+    Idempotent requests are retried on connection errors, timeouts and the configured
+    statuses. Other requests (e.g. POST) are retried only when the server cannot have
+    acted on them: the connection was refused, timed out or never resolved, or the
+    server answered 429.
+    """
+    
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    
+    def __init__(self, max_retries: int = 2, backoff_factor: float = 0.2, max_backoff: float = 10.0,
+                 retry_statuses: Iterable[int] = (429, 502, 503, 504), max_retry_after: float = 60.0):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+    
+    def is_idempotent(self, method: str, headers: Optional[dict] = None) -> bool:
+        return method.upper() in self.IDEMPOTENT_METHODS or bool(headers and "Idempotency-Key" in headers)
+    
+    @staticmethod
+    def never_connected(exc: Exception) -> bool:
+        """True when no connection was established, so the server cannot have seen the request."""
+        if isinstance(exc, requests.exceptions.ConnectTimeout):
+            return True
+        if not isinstance(exc, requests.exceptions.ConnectionError) or not exc.args:
+            return False
+        reason = exc.args[0]
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        # Refused connections and failed DNS lookups; urllib3 raises both as NewConnectionError.
+        return isinstance(reason, NewConnectionError)
+    
+    def should_retry_exception(self, exc: Exception, idempotent: bool) -> bool:
+        if isinstance(exc, CircuitOpenError) or not isinstance(exc, TRANSPORT_ERRORS):
+            return False
+        return idempotent or self.never_connected(exc)
+    
+    def should_retry_status(self, status: int, idempotent: bool) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        return idempotent or status == 429
+    
+    def _retry_after(self, response: Optional[requests.Response]) -> Optional[float]:
+        value = response.headers.get("Retry-After") if response is not None else None
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                parsed = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if parsed.tzinfo is None:
+                # RFC 5322 "-0000" dates parse as naive datetimes; HTTP dates are always UTC.
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            seconds = parsed.timestamp() - time.time()
+        return max(0.0, min(seconds, self.max_retry_after))
+    
+    def backoff(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Exponential backoff with full jitter, but never shorter than the server's ``Retry-After``."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+        retry_after = self._retry_after(response)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+
+class CircuitBreaker:
+    """Per-host breaker: opens after ``failure_threshold`` consecutive failed calls, probes again after ``reset_timeout``."""
+    
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+    
+    def record_failure(self) -> bool:
+        """Counts a failure; returns True when this failure opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return opened
+            return False
+    
+    def release(self):
+        """Ends a half-open probe that neither failed nor succeeded; the next call probes again."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+
+class ResilienceStats:
+    """Process-wide counters showing how much retrying and circuit breaking is going on."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self.retry_reasons: Counter = Counter()
+    
+    def increment(self, name: str, reason: Optional[str] = None):
+        with self._lock:
+            self.counters[name] += 1
+            if reason is not None:
+                self.retry_reasons[reason] += 1
+    
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.counters, "retry_reasons": dict(self.retry_reasons)}
+    
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.retry_reasons.clear()
+
+
+class Resilience:
+    """Runs a request with retries, backoff and, with ``failure_threshold`` set, per-host circuit breaking."""
+    
+    def __init__(self, policy: RetryPolicy, failure_threshold: int = 0, reset_timeout: float = 30.0,
+                 stats: Optional[ResilienceStats] = None, sleep: Callable[[float], None] = time.sleep):
+        self.policy = policy
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats = stats or ResilienceStats()
+        self.sleep = sleep
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls) -> Optional["Resilience"]:
+        """Returns the process-wide resilience layer, so breakers and counters are shared by all clients."""
+        global _shared
+        if settings.MAX_RETRIES <= 0 and settings.CIRCUIT_FAILURE_THRESHOLD <= 0:
+            return None
+        if _shared is None:
+            _shared = cls(
+                RetryPolicy(
+                    max_retries=settings.MAX_RETRIES,
+                    backoff_factor=settings.BACKOFF_FACTOR,
+                    max_backoff=settings.MAX_BACKOFF,
+                    retry_statuses=settings.RETRY_STATUSES,
+                ),
+                failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=settings.CIRCUIT_RESET_TIMEOUT,
+            )
+        return _shared
+    
+    def breaker_for(self, url: str) -> Optional[CircuitBreaker]:
+        if self.failure_threshold <= 0:
+            return None
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(host, CircuitBreaker(self.failure_threshold, self.reset_timeout))
+        return breaker
+    
+    def _failure(self, breaker: Optional[CircuitBreaker]):
+        if breaker is not None and breaker.record_failure():
+            self.stats.increment("circuit_opened")
+    
+    def call(self, method: str, url: str, send: Callable[[], requests.Response],
+             idempotent: bool) -> requests.Response:
+        """Sends with retries. The breaker sees one outcome per call, once retrying is over."""
+        breaker = self.breaker_for(url)
+        if breaker is not None and not breaker.allow():
+            self.stats.increment("short_circuited")
+            raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}")
+        healthy = None
+        try:
+            response = self._attempts(send, idempotent)
+            healthy = response.status_code < 500
+            return response
+        except TRANSPORT_ERRORS:
+            healthy = False
+            raise
+        finally:
+            if breaker is not None:
+                if healthy is None:
+                    breaker.release()
+                elif healthy:
+                    breaker.record_success()
+                else:
+                    self._failure(breaker)
+    
+    def _attempts(self, send: Callable[[], requests.Response], idempotent: bool) -> requests.Response:
+        attempt = 0
+        while True:
+            self.stats.increment("attempts")
+            try:
+                response = send()
+            except requests.RequestException as exc:
+                if attempt < self.policy.max_retries and self.policy.should_retry_exception(exc, idempotent):
+                    self.stats.increment("retries", type(exc).__name__)
+                    self.sleep(self.policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                if attempt:
+                    self.stats.increment("gave_up")
+                raise
+    
+            if attempt < self.policy.max_retries and self.policy.should_retry_status(response.status_code, idempotent):
+                self.stats.increment("retries", str(response.status_code))
+                delay = self.policy.backoff(attempt, response)
+                response.close()
+                self.sleep(delay)
+                attempt += 1
+                continue
+            if attempt and self.policy.should_retry_status(response.status_code, idempotent):
+                self.stats.increment("gave_up")
+            return response
+
+_shared: Optional[Resilience] = None
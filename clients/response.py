@@ -0,0 +1,114 @@
+import json
+import requests
+from collections.abc import Sequence
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast backend
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+_MISSING = object()
+
+
+def loads(data: bytes) -> Any:
+    """Decodes JSON with orjson when it is installed, falling back to the standard library."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any) -> bytes:
+    """Encodes JSON with orjson when it is installed, falling back to the standard library."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), allow_nan=False).encode()
+
+
+class ModelList(Sequence):
+    """Read-only list of ``model_type`` records, each built from its decoded dict when it is read.
+    
+    Building every record up front made ``model`` about twice as slow as ``json()`` on a
+    1,000-item page. Built on access, a page costs one decode plus the records actually
+    read. Every read builds a fresh record, so changes to one are not kept.
+    """
+    
+    __slots__ = ("_items", "_model_type")
+    
+    def __init__(self, items: list, model_type: type):
+        self._items = items
+        self._model_type = model_type
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ModelList(self._items[index], self._model_type)
+        return self._model_type.from_dict(self._items[index])
+    
+    def __iter__(self):
+        return map(self._model_type.from_dict, self._items)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (ModelList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"ModelList({len(self)} {self._model_type.__name__})"
+
+
+class ApiResponse(requests.Response):
+    """``requests.Response`` whose JSON body is decoded lazily, once, and optionally as typed models.
+    
+    ``json()`` caches its result, so repeated calls cost nothing. ``model`` exposes the
+    same decoded body as ``model_type`` instances (e.g. ``Product``).
+    """
+    
+    model_type: Optional[type] = None
+    _json = _MISSING
+    _model = _MISSING
+    # Kept by ``copy.copy``; requests' pickle state (``__attrs__``) would drop them.
+    # ``_checked_schema`` is the ``ResponseValidator`` memo.
+    _COPIED = ("_json", "model_type", "_checked_schema")
+    
+    def __copy__(self) -> "ApiResponse":
+        """Shallow copy, e.g. a ``ResponseCache`` hit, that keeps the decoded body and ``model_type``."""
+        clone = type(self).__new__(type(self))
+        clone.__setstate__(self.__getstate__())
+        for name in self._COPIED:
+            if name in self.__dict__:
+                setattr(clone, name, self.__dict__[name])
+        return clone
+    
+    def json(self, **kwargs) -> Any:
+        """The decoded body. Every call returns the same object, so a caller that mutates it
+        changes what later callers (and ``model``) see; ``copy.deepcopy`` it before editing.
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        if self._json is _MISSING:
+            try:
+                self._json = loads(self.content)
+            except ValueError:
+                # Let requests raise its own JSONDecodeError with the usual message.
+                return super().json()
+        return self._json
+    
+    @property
+    def model(self) -> Any:
+        """The body as ``model_type`` instances (a ``ModelList`` for list bodies); None for non-2xx responses."""
+        if self._model is _MISSING:
+            if self.model_type is None or not self.ok:
+                self._model = None
+            else:
+                data = self.json()
+                if isinstance(data, list):
+                    self._model = ModelList(data, self.model_type)
+                else:
+                    self._model = self.model_type.from_dict(data)
+        return self._model
@@ -0,0 +1,237 @@
+import threading
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import settings
+
+TYPE_CHECKS = {
+    # Exact type checks: JSON decoders only produce these types, and bool must not pass for int.
+    "object": "type({value}) is dict",
+    "array": "type({value}) is list",
+    "string": "type({value}) is str",
+    "integer": "type({value}) is int",
+    "number": "type({value}) in (int, float)",
+    "boolean": "type({value}) is bool",
+    "null": "{value} is None",
+}
+# The keywords that constrain each kind of value; without ``type`` they only apply to values of that kind.
+KIND_KEYWORDS = (
+    ("object", {"properties", "required", "additionalProperties"}),
+    ("array", {"items"}),
+    ("number", {"minimum", "maximum", "exclusiveMinimum"}),
+    ("string", {"minLength", "maxLength"}),
+)
+KEYWORDS = {"type", "properties", "required", "additionalProperties", "items", "enum",
+            "minimum", "maximum", "exclusiveMinimum", "minLength", "maxLength"}
+
+PRODUCT_SCHEMA = {
+    "type": "object",
+    "required": ["id", "name", "price"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1},
+        "name": {"type": "string", "minLength": 1},
+        "description": {"type": ["string", "null"]},
+        "price": {"type": "number", "exclusiveMinimum": 0},
+        "stock": {"type": "integer", "minimum": 0},
+        "image_url": {"type": ["string", "null"]},
+    },
+}
+PRODUCT_LIST_SCHEMA = {"type": "array", "items": PRODUCT_SCHEMA}
+
+
+class SchemaViolationError(AssertionError):
+    """A response broke its schema; ``violations`` holds every ``path: problem`` found."""
+    
+    SHOWN = 20
+    
+    def __init__(self, schema: str, endpoint: str, violations: List[str]):
+        self.schema = schema
+        self.endpoint = endpoint
+        self.violations = violations
+        shown = "\n  ".join(violations[:self.SHOWN])
+        more = f"\n  ... and {len(violations) - self.SHOWN} more" if len(violations) > self.SHOWN else ""
+        super().__init__(f"{endpoint} response does not match {schema} ({len(violations)} violations):\n  {shown}{more}")
+
+
+class _Generator:
+    """Turns a JSON Schema subset into the source of one flat Python function.
+    
+    Each keyword becomes an inline check, so validating a product costs a few type and
+    dict lookups rather than a walk over the schema. The top-level array loop takes a
+    ``step``, which is how large list pages are sampled.
+    """
+    
+    def __init__(self):
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {}
+        self._names = count()
+    
+    def name(self, prefix: str) -> str:
+        return f"{prefix}{next(self._names)}"
+    
+    def constant(self, value: Any) -> str:
+        name = self.name("_c")
+        self.constants[name] = value
+        return name
+    
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+    
+    def error(self, indent: int, path: str, message: str):
+        self.emit(indent, f"errors.append(f\"{path}: {message}\")")
+    
+    def node(self, schema: dict, value: str, path: str, indent: int, top: bool = False):
+        unknown = set(schema) - KEYWORDS
+        if unknown:
+            raise ValueError(f"Unsupported schema keywords at {path}: {sorted(unknown)}")
+        if "enum" in schema:
+            self.emit(indent, f"if {value} not in {self.constant(list(schema['enum']))}:")
+            self.error(indent + 1, path, f"{{{value}!r}} is not one of {_escape(repr(schema['enum']))}")
+        types = schema.get("type")
+        if types is None:
+            for kind, keywords in KIND_KEYWORDS:
+                if keywords & set(schema):
+                    self.emit(indent, f"if {TYPE_CHECKS[kind].format(value=value)}:")
+                    emitted = len(self.lines)
+                    self.constraints(kind, schema, value, path, indent + 1, top)
+                    if len(self.lines) == emitted:
+                        self.emit(indent + 1, "pass")
+            return
+        types = [types] if isinstance(types, str) else list(types)
+        for position, kind in enumerate(types):
+            if kind not in TYPE_CHECKS:
+                raise ValueError(f"Unsupported schema type at {path}: {kind!r}")
+            self.emit(indent, f"{'if' if position == 0 else 'elif'} {TYPE_CHECKS[kind].format(value=value)}:")
+            emitted = len(self.lines)
+            self.constraints(kind, schema, value, path, indent + 1, top)
+            if len(self.lines) == emitted:
+                self.emit(indent + 1, "pass")
+        self.emit(indent, "else:")
+        self.error(indent + 1, path, f"expected {' or '.join(types)}, got {{type({value}).__name__}}")
+    
+    def constraints(self, kind: str, schema: dict, value: str, path: str, indent: int, top: bool):
+        if kind in ("integer", "number"):
+            for keyword, operator in (("minimum", "<"), ("exclusiveMinimum", "<="), ("maximum", ">")):
+                if keyword in schema:
+                    self.emit(indent, f"if {value} {operator} {schema[keyword]!r}:")
+                    self.error(indent + 1, path, f"{{{value}!r}} breaks {keyword} {schema[keyword]!r}")
+        elif kind == "string":
+            for keyword, operator in (("minLength", "<"), ("maxLength", ">")):
+                if keyword in schema:
+                    self.emit(indent, f"if len({value}) {operator} {schema[keyword]!r}:")
+                    self.error(indent + 1, path, f"length {{len({value})}} breaks {keyword} {schema[keyword]!r}")
+        elif kind == "object":
+            self.properties(schema, value, path, indent)
+        elif kind == "array" and "items" in schema:
+            index, item = self.name("i"), self.name("v")
+            step = "step" if top else "1"
+            self.emit(indent, f"for {index} in range(0, len({value}), {step}):")
+            self.emit(indent + 1, f"{item} = {value}[{index}]")
+            self.node(schema["items"], item, f"{path}[{{{index}}}]", indent + 1)
+    
+    def properties(self, schema: dict, value: str, path: str, indent: int):
+        properties = schema.get("properties", {})
+        for field in schema.get("required", []):
+            self.emit(indent, f"if {field!r} not in {value}:")
+            self.error(indent + 1, path, f"missing required property {_escape(repr(field))}")
+        for field, subschema in properties.items():
+            child = self.name("v")
+            self.emit(indent, f"{child} = {value}.get({field!r}, _MISSING)")
+            self.emit(indent, f"if {child} is not _MISSING:")
+            self.node(subschema, child, f"{path}.{_escape(field)}", indent + 1)
+        if schema.get("additionalProperties") is False:
+            key = self.name("k")
+            self.emit(indent, f"for {key} in {value}:")
+            self.emit(indent + 1, f"if {key} not in {self.constant(frozenset(properties))}:")
+            self.error(indent + 2, path, f"unexpected property {{{key}!r}}")
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+class Schema:
+    """A JSON Schema subset compiled, on first use, into a Python function.
+    
+    Supported keywords: ``type`` (a name or a list of names), ``properties``, ``required``,
+    ``additionalProperties: false``, ``items``, ``enum``, ``minimum``, ``maximum``,
+    ``exclusiveMinimum``, ``minLength`` and ``maxLength``. Anything else raises
+    ``ValueError`` at compile time instead of being silently ignored. As in JSON Schema,
+    a schema without ``type`` applies each keyword to values of the kind it describes
+    (``properties`` to objects, ``minLength`` to strings...) and accepts any other value.
+    """
+    
+    def __init__(self, name: str, definition: dict):
+        self.name = name
+        self.definition = definition
+        self.source: Optional[str] = None
+        self._validate: Optional[Callable[[Any, int], List[str]]] = None
+    
+    def compile(self) -> Callable[[Any, int], List[str]]:
+        generator = _Generator()
+        generator.emit(0, "def validate(data, step=1):")
+        generator.emit(1, "errors = []")
+        generator.node(self.definition, "data", "$", 1, top=True)
+        generator.emit(1, "return errors")
+        self.source = "\n".join(generator.lines)
+        namespace = {"_MISSING": object(), **generator.constants}
+        exec(compile(self.source, f"<schema {self.name}>", "exec"), namespace)
+        self._validate = namespace["validate"]
+        return self._validate
+    
+    def validate(self, data: Any, sample: int = 0) -> List[str]:
+        """Every violation in ``data``, as ``path: problem`` strings.
+    
+        With ``sample`` set, a top-level list longer than that is checked at evenly spaced
+        items only (about ``sample`` of them); the paths still carry the real indexes.
+        """
+        step = 1
+        if sample and type(data) is list and len(data) > sample:
+            step = -(-len(data) // sample)
+        return (self._validate or self.compile())(data, step)
+    
+    def __repr__(self) -> str:
+        return f"Schema({self.name!r})"
+
+
+PRODUCT = Schema("Product", PRODUCT_SCHEMA)
+PRODUCT_LIST = Schema("ProductList", PRODUCT_LIST_SCHEMA)
+
+
+class ResponseValidator:
+    """Checks 2xx JSON responses against their schema and raises ``SchemaViolationError`` on any violation."""
+    
+    def __init__(self, sample: int = 0):
+        self.sample = sample
+        self.checked = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls) -> Optional["ResponseValidator"]:
+        """Returns the process-wide validator when ``API_VALIDATE_SCHEMAS`` is on, otherwise None."""
+        global _shared
+        if not settings.VALIDATE_SCHEMAS:
+            return None
+        if _shared is None:
+            _shared = cls(settings.SCHEMA_SAMPLE)
+        return _shared
+    
+    def check(self, schema: Schema, endpoint: str, response) -> None:
+        if not response.ok or not response.content or getattr(response, "_checked_schema", None) is schema:
+            return
+        violations = schema.validate(response.json(), self.sample)
+        with self._lock:
+            self.checked += 1
+            self.failed += bool(violations)
+        if violations:
+            raise SchemaViolationError(schema.name, endpoint, violations)
+        # ``ApiResponse.__copy__`` carries this onto ``ResponseCache`` hits, so a cached body is checked once.
+        response._checked_schema = schema
+    
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"checked": self.checked, "failed": self.failed}
+
+
+_shared: Optional[ResponseValidator] = None
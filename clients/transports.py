@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING, Optional
+
+from requests.adapters import BaseAdapter
+
+from clients.adapters import ClientAdapter
+from config.settings import settings
+
+if TYPE_CHECKING:
+    import httpx
+
+TRANSPORTS = ("http", "http2", "record", "replay")
+
+# Everything but the default ``http`` transport is imported on first use, so a plain
+# requests-based run never loads httpx or the cassette store.
+
+
+def build_adapter(transport: Optional[str] = None) -> BaseAdapter:
+    """Returns the requests adapter ``BaseClient`` mounts for the selected transport (``API_TRANSPORT``)."""
+    transport = transport or settings.TRANSPORT
+    pool = {"pool_connections": settings.POOL_SIZE, "pool_maxsize": settings.POOL_SIZE}
+    if transport == "http":
+        return ClientAdapter(**pool)
+    if transport == "http2":
+        from clients.http2 import Http2Adapter
+        return Http2Adapter()
+    if transport == "record":
+        from clients.cassette import RecordingAdapter, shared_store
+        return RecordingAdapter(shared_store("record"), **pool)
+    if transport == "replay":
+        from clients.cassette import ReplayAdapter, shared_store
+        return ReplayAdapter(shared_store("replay"))
+    raise ValueError(f"Unknown transport '{transport}', expected one of {TRANSPORTS}")
+
+
+def build_async_transport(limits: "httpx.Limits", transport: Optional[str] = None) -> "httpx.AsyncBaseTransport":
+    """Returns the httpx transport ``AsyncBaseClient`` uses for the selected transport."""
+    import httpx
+    from clients.cassette import AsyncCassetteTransport, shared_store
+    from clients.http2 import ssl_context
+    
+    transport = transport or settings.TRANSPORT
+    if transport == "http":
+        return httpx.AsyncHTTPTransport(verify=ssl_context(), limits=limits)
+    if transport == "http2":
+        return httpx.AsyncHTTPTransport(verify=ssl_context(), limits=limits, http2=True)
+    if transport == "record":
+        return AsyncCassetteTransport(shared_store("record"),
+                                      httpx.AsyncHTTPTransport(verify=ssl_context(), limits=limits))
+    if transport == "replay":
+        return AsyncCassetteTransport(shared_store("replay"))
+    raise ValueError(f"Unknown transport '{transport}', expected one of {TRANSPORTS}")
@@ -1,10 +1,102 @@
 import os
+from typing import Any, Callable, Tuple, Union
+
+
+def flag(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+def status_codes(value: str) -> Tuple[int, ...]:
+    return tuple(int(code) for code in value.split(",") if code)
+
+
+class env:
+    """Setting backed by the environment variable ``name``.
+    
+    The variable is read and cast on first access and the value cached on the instance, so
+    importing ``config`` costs nothing and assigning a setting (e.g. from a fixture) still works.
+    ``default`` may be a callable taking the settings object, for defaults derived from other settings.
+    """
+    
+    def __init__(self, name: str, default: Union[str, Callable[[Any], Any]], cast: Callable[[Any], Any] = str):
+        self.name = name
+        self.default = default
+        self.cast = cast
+    
+    def __set_name__(self, owner, attribute: str):
+        self.attribute = attribute
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        raw = os.getenv(self.name)
+        if raw is None:
+            raw = self.default(instance) if callable(self.default) else self.default
+        value = instance.__dict__[self.attribute] = self.cast(raw)
+        return value
 
 
 class Settings:
-    BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000")
-    API_KEY = os.getenv("API_KEY", "NMI3Rvx-8WSUcQmhU_wEcWoRnEFOK55bKquPMy0l8bA")
-    TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))
+    BASE_URL = env("API_BASE_URL", "http://127.0.0.1:8000")
+    API_KEY = env("API_KEY", "NMI3Rvx-8WSUcQmhU_wEcWoRnEFOK55bKquPMy0l8bA")
+    TIMEOUT = env("API_TIMEOUT", "30", int)
+    CONNECT_TIMEOUT = env("API_CONNECT_TIMEOUT", "5", float)
+    READ_TIMEOUT = env("API_READ_TIMEOUT", lambda settings: settings.TIMEOUT, float)
+    # Off by default: tests that assert on 429/5xx statuses must see them. Turn on per environment.
+    MAX_RETRIES = env("API_MAX_RETRIES", "0", int)
+    BACKOFF_FACTOR = env("API_BACKOFF_FACTOR", "0.2", float)
+    MAX_BACKOFF = env("API_MAX_BACKOFF", "10", float)
+    RETRY_STATUSES = env("API_RETRY_STATUSES", "429,502,503,504", status_codes)
+    CIRCUIT_FAILURE_THRESHOLD = env("API_CIRCUIT_FAILURE_THRESHOLD", "0", int)
+    CIRCUIT_RESET_TIMEOUT = env("API_CIRCUIT_RESET_TIMEOUT", "30", float)
+    RATE_LIMIT = env("API_RATE_LIMIT", "0", float)
+    RATE_LIMITS = env("API_RATE_LIMITS", "")
+    RATE_LIMIT_BURST = env("API_RATE_LIMIT_BURST", "1", float)
+    RATE_LIMIT_DIR = env("API_RATE_LIMIT_DIR", "")
+    TRANSPORT = env("API_TRANSPORT", "http")
+    CASSETTE_DIR = env("API_CASSETTE_DIR", "cassettes")
+    CASSETTE_MATCH = env("API_CASSETTE_MATCH", "strict")
+    POOL_SIZE = env("API_POOL_SIZE", "100", int)
+    HOST_POOL_SIZES = env("API_HOST_POOL_SIZES", "")
+    KEEPALIVE_EXPIRY = env("API_KEEPALIVE_EXPIRY", "30", float)
+    MAX_CONCURRENCY = env("API_MAX_CONCURRENCY", "100", int)
+    PREPARED_REQUESTS = env("API_PREPARED_REQUESTS", "true", flag)
+    COMPRESS_REQUESTS = env("API_COMPRESS_REQUESTS", "")
+    COMPRESS_MIN_BYTES = env("API_COMPRESS_MIN_BYTES", "1024", int)
+    ACCEPT_ENCODING = env("API_ACCEPT_ENCODING", "auto")
+    CACHE_ENABLED = env("API_CACHE", "false", flag)
+    CACHE_TTL = env("API_CACHE_TTL", "30", float)
+    CACHE_MAX_ENTRIES = env("API_CACHE_MAX_ENTRIES", "1024", int)
+    CACHE_MAX_BYTES = env("API_CACHE_MAX_BYTES", str(64 * 1024 * 1024), int)
+    PAGE_SIZE = env("API_PAGE_SIZE", "100", int)
+    MAX_PAGE_SIZE = env("API_MAX_PAGE_SIZE", "1000", int)
+    PREFETCH_PAGES = env("API_PREFETCH_PAGES", "2", int)
+    PAGE_TARGET_LATENCY = env("API_PAGE_TARGET_LATENCY", "0.25", float)
+    BULK_ENDPOINTS = env("API_BULK_ENDPOINTS", "auto")
+    BATCH_SIZE = env("API_BATCH_SIZE", "500", int)
+    BATCH_CONCURRENCY = env("API_BATCH_CONCURRENCY", "16", int)
+    MOCK_SERVER = env("API_MOCK_SERVER", "false", flag)
+    TEST_NAMESPACE = env("API_TEST_NAMESPACE", "")
+    PRODUCT_POOL_SIZE = env("API_PRODUCT_POOL_SIZE", "20", int)
+    ALLURE_MODE = env("API_ALLURE_MODE", "full")
+    ALLURE_STEPS = env("API_ALLURE_STEPS", "")
+    ALLURE_MAX_ATTACHMENT_BYTES = env("API_ALLURE_MAX_ATTACHMENT_BYTES", str(64 * 1024), int)
+    ALLURE_SAMPLE_ITEMS = env("API_ALLURE_SAMPLE_ITEMS", "20", int)
+    PERF_RUNS = env("API_PERF_RUNS", "20", int)
+    PERF_WARMUP = env("API_PERF_WARMUP", "2", int)
+    PERF_SLO_SCALE = env("API_PERF_SLO_SCALE", "1.0", float)
+    CASES_LIMIT = env("API_CASES_LIMIT", "0", int)
+    VALIDATE_SCHEMAS = env("API_VALIDATE_SCHEMAS", "false", flag)
+    SCHEMA_SAMPLE = env("API_SCHEMA_SAMPLE", "0", int)
+    SHARD = env("API_SHARD", "")
+    SHARD_DIR = env("API_SHARD_DIR", "")
+    PROFILE = env("API_PROFILE", "")
+    PROFILE_DIR = env("API_PROFILE_DIR", "profiles")
+    PROFILE_INTERVAL_MS = env("API_PROFILE_INTERVAL_MS", "5", float)
+    PROFILE_TOP = env("API_PROFILE_TOP", "15", int)
+    INSTRUMENTATION = env("API_INSTRUMENTATION", "")
+    INSTRUMENTATION_JSONL_PATH = env("API_INSTRUMENTATION_JSONL_PATH", "api-requests.jsonl")
+    INSTRUMENTATION_PROMETHEUS_PATH = env("API_INSTRUMENTATION_PROMETHEUS_PATH", "api-metrics.prom")
 
 
 settings = Settings()
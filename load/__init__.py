@@ -0,0 +1,6 @@
+from clients.histogram import Histogram
+from load.runner import LoadRunner
+from load.scenario import Scenario
+from load.stats import LoadResult
+
+__all__ = ["Histogram", "LoadRunner", "Scenario", "LoadResult"]
@@ -0,0 +1,47 @@
+import argparse
+import json
+import sys
+
+from load.runner import LoadRunner
+from load.scenario import Scenario
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m load",
+        description="Drive the Products API with a weighted mix of ProductsClient calls."
+    )
+    parser.add_argument("--mix", default="get_products=70,create_product=20,delete_product=10",
+                        help="Weighted actions, e.g. get_products=70,create_product=20,delete_product=10")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rps", type=float, help="Open-loop: target requests per second")
+    mode.add_argument("--users", type=int, help="Closed-loop: number of virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run duration in seconds")
+    parser.add_argument("--workers", type=int, help="Open-loop worker threads (default: min(rps, 256))")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Closed-loop pause between requests")
+    parser.add_argument("--seed", type=int, help="Seed for the action mix")
+    parser.add_argument("--json", dest="json_path", help="Also write the result as JSON to this path")
+    parser.add_argument("--max-error-rate", type=float,
+                        help="Exit non-zero when the overall error rate exceeds this fraction")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    runner = LoadRunner(Scenario.from_mix(args.mix, seed=args.seed))
+    if args.rps:
+        result = runner.run_open(rps=args.rps, duration=args.duration, workers=args.workers)
+    else:
+        result = runner.run_closed(users=args.users, duration=args.duration, think_time=args.think_time)
+    
+    print(result.format())
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
+    if args.max_error_rate is not None and sum(result.error_rates().values()) > args.max_error_rate:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
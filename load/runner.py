@@ -0,0 +1,93 @@
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+from clients.products_client import ProductsClient
+from load.scenario import Scenario, SkipAction
+from load.stats import LoadResult, Recorder
+
+
+class LoadRunner:
+    """Drives a ``Scenario`` against the API, open-loop at a fixed rate or closed-loop with N users.
+    
+    Each worker thread owns its own client (and therefore its own connection pool)
+    and its own ``Recorder``; recorders are merged once the run is over.
+    """
+    
+    def __init__(self, scenario: Scenario, client_factory: Callable[[], ProductsClient] = ProductsClient):
+        self.scenario = scenario
+        self.client_factory = client_factory
+    
+    def _execute(self, client: ProductsClient, recorder: Recorder, intended_start: float):
+        action = self.scenario.pick()
+        started = time.perf_counter()
+        try:
+            response = action.call(client, self.scenario.ids)
+            status = str(response.status_code)
+        except SkipAction:
+            recorder.skipped[action.name] += 1
+            return
+        except Exception as exc:
+            status = type(exc).__name__
+        finished = time.perf_counter()
+        recorder.record(action.name, finished - intended_start, finished - started, status)
+    
+    def _run_workers(self, count: int, target: Callable[[ProductsClient, Recorder], None]) -> Recorder:
+        recorders = [Recorder() for _ in range(count)]
+        clients = [self.client_factory() for _ in range(count)]
+        threads = [
+            threading.Thread(target=target, args=(client, recorder), daemon=True)
+            for client, recorder in zip(clients, recorders)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        merged = Recorder()
+        for recorder in recorders:
+            merged.merge(recorder)
+        self.scenario.cleanup(clients[0])
+        for client in clients:
+            client.close()
+        return merged
+    
+    def run_open(self, rps: float, duration: float, workers: Optional[int] = None) -> LoadResult:
+        """Issues requests on a fixed schedule regardless of response times.
+        
+        Latency is measured from each request's intended send time, so queueing caused
+        by a slow server is reported instead of hidden (no coordinated omission).
+        """
+        workers = workers or max(1, min(int(rps), 256))
+        interval = 1.0 / rps
+        ticket = itertools.count()
+        start = time.perf_counter() + 0.05
+        deadline = start + duration
+        
+        def worker(client: ProductsClient, recorder: Recorder):
+            while True:
+                intended = start + next(ticket) * interval
+                if intended >= deadline:
+                    return
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                self._execute(client, recorder, intended)
+        
+        recorder = self._run_workers(workers, worker)
+        return LoadResult("open", recorder, elapsed=time.perf_counter() - start, target_rps=rps)
+    
+    def run_closed(self, users: int, duration: float, think_time: float = 0.0) -> LoadResult:
+        """Runs ``users`` virtual users, each issuing its next request once the previous one finished."""
+        start = time.perf_counter()
+        deadline = start + duration
+        
+        def worker(client: ProductsClient, recorder: Recorder):
+            while time.perf_counter() < deadline:
+                self._execute(client, recorder, time.perf_counter())
+                if think_time:
+                    time.sleep(think_time)
+        
+        recorder = self._run_workers(users, worker)
+        return LoadResult("closed", recorder, elapsed=time.perf_counter() - start, users=users)
@@ -0,0 +1,126 @@
+import itertools
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from clients.products_client import ProductsClient
+
+
+class ProductIdPool:
+    """Thread-safe pool of product ids created during a run, shared by all actions."""
+    
+    def __init__(self):
+        self._ids = deque()
+        self._lock = threading.Lock()
+    
+    def add(self, product_id: int):
+        with self._lock:
+            self._ids.append(product_id)
+    
+    def peek(self) -> Optional[int]:
+        with self._lock:
+            return self._ids[random.randrange(len(self._ids))] if self._ids else None
+    
+    def take(self) -> Optional[int]:
+        with self._lock:
+            return self._ids.popleft() if self._ids else None
+    
+    def drain(self) -> List[int]:
+        with self._lock:
+            ids = list(self._ids)
+            self._ids.clear()
+            return ids
+
+
+class SkipAction(Exception):
+    """Raised by an action that cannot run yet (e.g. nothing left to delete)."""
+
+
+@dataclass
+class Action:
+    name: str
+    weight: float
+    call: Callable[[ProductsClient, ProductIdPool], object]
+
+
+_counter = itertools.count(1)
+
+
+def _get_products(client: ProductsClient, ids: ProductIdPool):
+    return client.get_products()
+
+
+def _get_product(client: ProductsClient, ids: ProductIdPool):
+    product_id = ids.peek()
+    if product_id is None:
+        raise SkipAction("get_product")
+    return client.get_product(product_id)
+
+
+def _create_product(client: ProductsClient, ids: ProductIdPool):
+    response = client.create_product(
+        name=f"Load Product {next(_counter)}",
+        price=round(random.uniform(1, 500), 2),
+        description="Created by the load runner",
+        stock=random.randint(0, 1000)
+    )
+    if response.status_code == 201:
+        ids.add(response.json()["id"])
+    return response
+
+
+def _update_product(client: ProductsClient, ids: ProductIdPool):
+    product_id = ids.peek()
+    if product_id is None:
+        raise SkipAction("update_product")
+    return client.update_product(product_id, stock=random.randint(0, 1000))
+
+
+def _delete_product(client: ProductsClient, ids: ProductIdPool):
+    product_id = ids.take()
+    if product_id is None:
+        raise SkipAction("delete_product")
+    return client.delete_product(product_id)
+
+
+ACTIONS: Dict[str, Callable[[ProductsClient, ProductIdPool], object]] = {
+    "get_products": _get_products,
+    "get_product": _get_product,
+    "create_product": _create_product,
+    "update_product": _update_product,
+    "delete_product": _delete_product,
+}
+
+
+class Scenario:
+    """A weighted mix of ``ProductsClient`` actions, e.g. ``70/20/10`` reads/creates/deletes."""
+    
+    def __init__(self, actions: List[Action], seed: Optional[int] = None):
+        if not actions:
+            raise ValueError("A scenario needs at least one action")
+        self.actions = actions
+        self.ids = ProductIdPool()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cum_weights = list(itertools.accumulate(action.weight for action in actions))
+    
+    @classmethod
+    def from_mix(cls, mix: str, seed: Optional[int] = None) -> "Scenario":
+        """Builds a scenario from a spec such as ``get_products=70,create_product=20,delete_product=10``."""
+        actions = []
+        for part in mix.split(","):
+            name, _, weight = part.strip().partition("=")
+            if name not in ACTIONS:
+                raise ValueError(f"Unknown action '{name}', expected one of {sorted(ACTIONS)}")
+            actions.append(Action(name=name, weight=float(weight or 1), call=ACTIONS[name]))
+        return cls(actions, seed=seed)
+    
+    def pick(self) -> Action:
+        with self._lock:
+            return self._random.choices(self.actions, cum_weights=self._cum_weights)[0]
+    
+    def cleanup(self, client: ProductsClient):
+        for product_id in self.ids.drain():
+            client.delete_product(product_id)
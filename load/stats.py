@@ -0,0 +1,112 @@
+from collections import Counter
+from typing import Dict, Optional
+
+from clients.histogram import Histogram
+
+PERCENTILES = (50, 95, 99, 99.9)
+
+
+class Recorder:
+    """Per-worker latency and outcome counters. Workers never share a recorder, so no locking."""
+    
+    def __init__(self):
+        self.latency = Histogram()
+        self.service_time = Histogram()
+        self.by_action: Dict[str, Histogram] = {}
+        self.status_counts: Counter = Counter()
+        self.action_counts: Counter = Counter()
+        self.skipped: Counter = Counter()
+    
+    def record(self, action: str, latency: float, service_time: float, status: str):
+        self.latency.record_seconds(latency)
+        self.service_time.record_seconds(service_time)
+        histogram = self.by_action.get(action)
+        if histogram is None:
+            histogram = self.by_action[action] = Histogram()
+        histogram.record_seconds(latency)
+        self.status_counts[status] += 1
+        self.action_counts[action] += 1
+    
+    def merge(self, other: "Recorder"):
+        self.latency.merge(other.latency)
+        self.service_time.merge(other.service_time)
+        for action, histogram in other.by_action.items():
+            self.by_action.setdefault(action, Histogram()).merge(histogram)
+        self.status_counts.update(other.status_counts)
+        self.action_counts.update(other.action_counts)
+        self.skipped.update(other.skipped)
+
+
+class LoadResult:
+    
+    def __init__(self, mode: str, recorder: Recorder, elapsed: float, target_rps: Optional[float] = None,
+                 users: Optional[int] = None):
+        self.mode = mode
+        self.recorder = recorder
+        self.elapsed = elapsed
+        self.target_rps = target_rps
+        self.users = users
+    
+    @property
+    def total_requests(self) -> int:
+        return self.recorder.latency.total_count
+    
+    @property
+    def throughput(self) -> float:
+        return self.total_requests / self.elapsed if self.elapsed else 0.0
+    
+    def error_rates(self) -> Dict[str, float]:
+        """Fraction of requests per non-2xx status code (or exception name)."""
+        total = self.total_requests or 1
+        return {
+            status: count / total
+            for status, count in sorted(self.recorder.status_counts.items())
+            if not status.startswith("2")
+        }
+    
+    def to_dict(self) -> dict:
+        def summary(histogram: Histogram) -> dict:
+            return {
+                "count": histogram.total_count,
+                "mean_ms": histogram.mean / 1000,
+                "max_ms": histogram.max_value / 1000,
+                **{f"p{p:g}_ms": value / 1000 for p, value in histogram.percentiles(*PERCENTILES).items()}
+            }
+        
+        return {
+            "mode": self.mode,
+            "target_rps": self.target_rps,
+            "users": self.users,
+            "elapsed_s": self.elapsed,
+            "requests": self.total_requests,
+            "throughput_rps": self.throughput,
+            "latency": summary(self.recorder.latency),
+            "service_time": summary(self.recorder.service_time),
+            "actions": {name: summary(h) for name, h in sorted(self.recorder.by_action.items())},
+            "status_codes": dict(sorted(self.recorder.status_counts.items())),
+            "error_rates": self.error_rates(),
+            "skipped": dict(self.recorder.skipped),
+        }
+    
+    def format(self) -> str:
+        data = self.to_dict()
+        target = f"target {self.target_rps:g} rps" if self.target_rps else f"{self.users} users"
+        lines = [
+            f"Mode: {self.mode} ({target}), elapsed {self.elapsed:.2f}s",
+            f"Requests: {self.total_requests}, throughput {self.throughput:.1f} rps",
+            "",
+            f"{'action':<16}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'p99.9':>10}{'max':>10}  (ms)",
+        ]
+        rows = [("all", data["latency"])] + list(data["actions"].items())
+        for name, row in rows:
+            lines.append(
+                f"{name:<16}{row['count']:>8}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+                f"{row['p99_ms']:>10.2f}{row['p99.9_ms']:>10.2f}{row['max_ms']:>10.2f}"
+            )
+        lines.append("")
+        lines.append("Status codes: " + ", ".join(f"{k}={v}" for k, v in data["status_codes"].items()))
+        if data["error_rates"]:
+            lines.append("Error rates: " + ", ".join(f"{k}={v:.2%}" for k, v in data["error_rates"].items()))
+        if data["skipped"]:
+            lines.append("Skipped: " + ", ".join(f"{k}={v}" for k, v in data["skipped"].items()))
+        return "\n".join(lines)
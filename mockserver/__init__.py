@@ -0,0 +1,15 @@
+from mockserver.app import ProductsApp
+from mockserver.server import MockServer
+from mockserver.store import ProductStore
+
+__all__ = ["ProductsApp", "MockServer", "ProductStore", "start_mock_server"]
+
+
+def start_mock_server(api_key: str, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                      error_rate: float = 0.0, extra_payload_bytes: int = 0, seed_products: int = 0,
+                      max_limit=None, compress_min_bytes=None) -> MockServer:
+    """Starts an in-process mock Products API in a background thread and returns it."""
+    store = ProductStore(extra_payload_bytes=extra_payload_bytes)
+    store.seed(seed_products)
+    app = ProductsApp(api_key, store=store, latency=latency, error_rate=error_rate, max_limit=max_limit)
+    return MockServer(app, host=host, port=port, compress_min_bytes=compress_min_bytes).start()
@@ -0,0 +1,35 @@
+import argparse
+
+from config.settings import settings
+from mockserver.app import ProductsApp
+from mockserver.server import MockServer
+from mockserver.store import ProductStore
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m mockserver", description="Serve a mock Products API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--api-key", default=settings.API_KEY, help="Key accepted in x-api-key")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--payload-bytes", type=int, default=0, help="Extra bytes added to every product")
+    parser.add_argument("--seed-products", type=int, default=0, help="Products to create at startup")
+    parser.add_argument("--max-limit", type=int, help="Server-side cap on the list page size")
+    parser.add_argument("--gzip-min-bytes", type=int, help="Gzip responses at least this large when the client accepts it")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    store = ProductStore(extra_payload_bytes=args.payload_bytes)
+    store.seed(args.seed_products)
+    app = ProductsApp(args.api_key, store=store, latency=args.latency_ms / 1000,
+                      error_rate=args.error_rate, max_limit=args.max_limit)
+    server = MockServer(app, host=args.host, port=args.port, compress_min_bytes=args.gzip_min_bytes)
+    print(f"Mock Products API on http://{args.host}:{args.port} ({len(store)} products)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
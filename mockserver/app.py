@@ -0,0 +1,196 @@
+import random
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from mockserver.store import ProductStore, dumps, loads
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+FIELDS = {
+    "name": (str,),
+    "description": (str, type(None)),
+    "price": (int, float),
+    "stock": (int,),
+    "image_url": (str, type(None)),
+}
+REQUIRED = ("name", "price")
+MAX_BULK_OPERATIONS = 1000
+
+
+def _error(status: int, detail) -> Response:
+    return status, JSON_HEADERS, dumps({"detail": detail})
+
+
+def _violation(location: str, field: str, message: str, kind: str) -> dict:
+    return {"loc": [location, field], "msg": message, "type": kind}
+
+
+def validate_product(body: bytes, partial: bool) -> Tuple[Optional[dict], list]:
+    """Validates a create (``partial=False``) or update payload the way the real API does."""
+    try:
+        data = loads(body) if body else None
+    except ValueError:
+        return None, [_violation("body", "__root__", "Invalid JSON body", "value_error.jsondecode")]
+    return validate_fields(data, partial)
+
+
+def validate_fields(data, partial: bool) -> Tuple[Optional[dict], list]:
+    if not isinstance(data, dict):
+        return None, [_violation("body", "__root__", "Body must be a JSON object", "type_error.dict")]
+    
+    errors = []
+    if not partial:
+        errors += [_violation("body", field, "Field required", "missing") for field in REQUIRED if field not in data]
+    fields = {}
+    for field, value in data.items():
+        types = FIELDS.get(field)
+        if types is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, types):
+            errors.append(_violation("body", field, f"Invalid type for {field}", "type_error"))
+        elif field == "price" and value <= 0:
+            errors.append(_violation("body", field, "Input should be greater than 0", "greater_than"))
+        elif field == "stock" and value < 0:
+            errors.append(_violation("body", field, "Input should be greater than or equal to 0", "greater_than_equal"))
+        elif field == "name" and not value.strip():
+            errors.append(_violation("body", field, "String should have at least 1 character", "string_too_short"))
+        else:
+            fields[field] = value
+    return fields, errors
+
+
+class ProductsApp:
+    """Implements the ``/products/`` contract the test suites assume.
+    
+    An invalid ``x-api-key`` gets 403 (a missing one is allowed), create returns 201,
+    delete returns 204, unknown ids return 404 and invalid payloads 422. Latency, error
+    rate and payload size can be injected to shape benchmark and load scenarios.
+    
+    ``POST /products/bulk`` applies a list of create/update/delete operations and answers
+    200 with one ``{"status", "body"}`` result per operation, in order.
+    """
+    
+    PREFIX = "/products"
+    
+    def __init__(self, api_key: str, store: Optional[ProductStore] = None, latency: float = 0.0,
+                 error_rate: float = 0.0, max_limit: Optional[int] = None, seed: Optional[int] = None):
+        self.api_key = api_key
+        self.store = store or ProductStore()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.max_limit = max_limit
+        self._random = random.Random(seed)
+    
+    def handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Response:
+        path, _, query = target.partition("?")
+        if path != self.PREFIX and not path.startswith(self.PREFIX + "/"):
+            return _error(404, "Not Found")
+        key = headers.get("x-api-key")
+        if key and key != self.api_key:
+            return _error(403, "Invalid API key")
+        if self.error_rate and self._random.random() < self.error_rate:
+            return 503, {**JSON_HEADERS, "Retry-After": "0"}, dumps({"detail": "Injected failure"})
+        
+        rest = path[len(self.PREFIX):].strip("/")
+        if not rest:
+            if method == "GET":
+                return self.list_products(query, headers)
+            if method == "POST":
+                return self.create_product(body)
+            return _error(405, "Method Not Allowed")
+        if rest == "bulk":
+            return self.bulk(body) if method == "POST" else _error(405, "Method Not Allowed")
+        
+        try:
+            product_id = int(rest)
+        except ValueError:
+            return _error(422, [_violation("path", "product_id", "Input should be a valid integer", "int_parsing")])
+        if method == "GET":
+            return self.get_product(product_id, headers)
+        if method in ("PATCH", "PUT"):
+            return self.update_product(product_id, body)
+        if method == "DELETE":
+            return self.delete_product(product_id)
+        return _error(405, "Method Not Allowed")
+    
+    def list_products(self, query: str, headers: Dict[str, str]) -> Response:
+        params = dict(parse_qsl(query))
+        try:
+            skip = int(params.get("skip", 0))
+            limit = int(params.get("limit", 100))
+        except ValueError:
+            return _error(422, [_violation("query", "skip/limit", "Input should be a valid integer", "int_parsing")])
+        if skip < 0 or limit < 0:
+            return _error(422, [_violation("query", "skip/limit", "Input should be >= 0", "greater_than_equal")])
+        if self.max_limit:
+            limit = min(limit, self.max_limit)
+        etag = f'"{self.store.version}-{skip}-{limit}"'
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {**JSON_HEADERS, "ETag": etag}, self.store.page(skip, limit)
+    
+    def get_product(self, product_id: int, headers: Dict[str, str]) -> Response:
+        encoded = self.store.get(product_id)
+        if encoded is None:
+            return _error(404, "Product not found")
+        etag = f'"{self.store.version}"'
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {**JSON_HEADERS, "ETag": etag}, encoded
+    
+    def create_product(self, body: bytes) -> Response:
+        return self._create(*validate_product(body, partial=False))
+    
+    def _create(self, fields: Optional[dict], errors: list) -> Response:
+        if errors:
+            return _error(422, errors)
+        return 201, JSON_HEADERS, self.store.create(fields)
+    
+    def update_product(self, product_id: int, body: bytes) -> Response:
+        return self._update(product_id, *validate_product(body, partial=True))
+    
+    def _update(self, product_id: int, fields: Optional[dict], errors: list) -> Response:
+        if errors:
+            return _error(422, errors)
+        encoded = self.store.update(product_id, fields)
+        if encoded is None:
+            return _error(404, "Product not found")
+        return 200, JSON_HEADERS, encoded
+    
+    def delete_product(self, product_id: int) -> Response:
+        if not self.store.delete(product_id):
+            return _error(404, "Product not found")
+        return 204, {}, b""
+    
+    def bulk(self, body: bytes) -> Response:
+        try:
+            data = loads(body) if body else None
+        except ValueError:
+            return _error(422, [_violation("body", "__root__", "Invalid JSON body", "value_error.jsondecode")])
+        operations = data.get("operations") if isinstance(data, dict) else None
+        if not isinstance(operations, list):
+            return _error(422, [_violation("body", "operations", "Input should be a valid list", "list_type")])
+        if len(operations) > MAX_BULK_OPERATIONS:
+            return _error(422, [_violation("body", "operations",
+                                           f"List should have at most {MAX_BULK_OPERATIONS} items", "too_long")])
+        results = []
+        for operation in operations:
+            status, _, encoded = self._apply(operation)
+            results.append(b'{"status":%d,"body":%s}' % (status, encoded or b"null"))
+        return 200, JSON_HEADERS, b'{"results":[' + b",".join(results) + b"]}"
+    
+    def _apply(self, operation) -> Response:
+        if not isinstance(operation, dict):
+            return _error(422, [_violation("body", "operation", "Input should be a valid dictionary", "dict_type")])
+        op = operation.get("op")
+        if op == "create":
+            return self._create(*validate_fields(operation.get("data"), partial=False))
+        product_id = operation.get("id")
+        if isinstance(product_id, bool) or not isinstance(product_id, int):
+            return _error(422, [_violation("body", "id", "Input should be a valid integer", "int_type")])
+        if op == "update":
+            return self._update(product_id, *validate_fields(operation.get("data"), partial=True))
+        if op == "delete":
+            return self.delete_product(product_id)
+        return _error(422, [_violation("body", "op", "Input should be 'create', 'update' or 'delete'", "enum")])
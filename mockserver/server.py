@@ -0,0 +1,193 @@
+import asyncio
+import gzip
+import threading
+import zlib
+from http import HTTPStatus
+from typing import Dict, Optional
+
+from mockserver.app import ProductsApp, Response, _error
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional faster event loop
+    uvloop = None
+
+MAX_HEADER_BYTES = 64 * 1024
+# Large enough that a burst of concurrent connects never overflows the accept queue
+# (an overflow costs the client a 1s SYN retransmit).
+LISTEN_BACKLOG = 4096
+
+
+_DECODERS = {"gzip": gzip.decompress, "deflate": zlib.decompress}
+
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def _decode_body(headers: Dict[str, str], body: bytes):
+    """Undoes the request's ``Content-Encoding``; returns ``(body, None)`` or ``(None, error response)``."""
+    encoding = headers.get("content-encoding", "identity").lower()
+    if encoding == "identity" or not body:
+        return body, None
+    decoder = _DECODERS.get(encoding)
+    if decoder is None:
+        return None, _error(415, f"Unsupported Content-Encoding '{encoding}'")
+    try:
+        return decoder(body), None
+    except (OSError, EOFError, zlib.error):
+        return None, _error(400, f"Body is not valid {encoding}")
+
+
+def _accepts_gzip(headers: Dict[str, str]) -> bool:
+    for item in headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() == "gzip":
+            name, _, weight = params.replace(" ", "").partition("=")
+            return name != "q" or float(weight or 1) > 0
+    return False
+
+
+class MockServer:
+    """Minimal keep-alive HTTP/1.1 server for ``ProductsApp`` on its own event loop.
+    
+    ``start()`` runs it in a background thread of the current process; ``serve_forever()``
+    runs it in the foreground (see ``python -m mockserver``). Port 0 picks a free port.
+    
+    Request bodies sent with ``Content-Encoding: gzip`` or ``deflate`` are decoded before
+    the app sees them. With ``compress_min_bytes`` set, responses at least that large are
+    gzipped for clients that accept it.
+    """
+    
+    def __init__(self, app: ProductsApp, host: str = "127.0.0.1", port: int = 0,
+                 compress_min_bytes: Optional[int] = None):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.compress_min_bytes = compress_min_bytes
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._connections = {}
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        app = self.app
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    writer.write(b"HTTP/1.1 431 Request Header Fields Too Large\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    return
+    
+                lines = head.decode("latin-1").split("\r\n")
+                headers = {}
+                for line in lines[1:]:
+                    if line:
+                        name, _, value = line.partition(":")
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(f"Negative Content-Length {length}")
+                except ValueError:
+                    # A malformed request line or Content-Length leaves the stream unframed, so the connection ends.
+                    writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                    return
+                body = await reader.readexactly(length) if length else b""
+    
+                if app.latency:
+                    await asyncio.sleep(app.latency)
+                status, response_headers, payload = self._respond(method, target, headers, body)
+    
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                out = [f"HTTP/1.1 {status} {_reason(status)}\r\nContent-Length: {len(payload)}\r\n"]
+                for name, value in response_headers.items():
+                    out.append(f"{name}: {value}\r\n")
+                if not keep_alive:
+                    out.append("Connection: close\r\n")
+                out.append("\r\n")
+                writer.write("".join(out).encode("latin-1") + payload)
+                if not keep_alive:
+                    return
+                if writer.transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+    
+    def _respond(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Response:
+        body, error = _decode_body(headers, body)
+        if error is not None:
+            return error
+        status, response_headers, payload = self.app.handle(method, target, headers, body)
+        if self.compress_min_bytes and len(payload) >= self.compress_min_bytes and _accepts_gzip(headers):
+            response_headers = {**response_headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            payload = gzip.compress(payload, compresslevel=1, mtime=0)
+        return status, response_headers, payload
+    
+    async def _start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER_BYTES,
+                                                  reuse_address=True, backlog=LISTEN_BACKLOG)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def _shutdown(self):
+        self._server.close()
+        # Closing the transports makes idle keep-alive handlers see EOF and return.
+        for writer in list(self._connections.values()):
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+    
+    def _new_loop(self) -> asyncio.AbstractEventLoop:
+        return uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    
+    def _run(self):
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._start())
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(self._shutdown())
+            loop.close()
+    
+    def start(self) -> "MockServer":
+        self._loop = self._new_loop()
+        self._thread = threading.Thread(target=self._run, name="mock-products-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+    
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+    
+    def serve_forever(self):
+        self._loop = self._new_loop()
+        try:
+            self._run()
+        except KeyboardInterrupt:
+            pass
+    
+    def __enter__(self) -> "MockServer":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,100 @@
+import bisect
+import threading
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+
+    def dumps(value) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(data: bytes):
+        return orjson.loads(data)
+except ImportError:  # pragma: no cover - optional fast backend
+    import json
+
+    def dumps(value) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(data: bytes):
+        return json.loads(data)
+
+
+class ProductStore:
+    """In-memory product table.
+    
+    Products live in a dict keyed by id next to a sorted id list, so ``skip``/``limit``
+    pages are a slice. Each product's JSON encoding is cached, so list responses are
+    built by joining pre-encoded bytes instead of re-serialising dicts.
+    """
+    
+    def __init__(self, extra_payload_bytes: int = 0):
+        self.extra_payload_bytes = extra_payload_bytes
+        self.version = 0
+        self._products: Dict[int, dict] = {}
+        self._encoded: Dict[int, bytes] = {}
+        self._ids: List[int] = []
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def _encode(self, product: dict) -> bytes:
+        if self.extra_payload_bytes:
+            product = {**product, "notes": "x" * self.extra_payload_bytes}
+        return dumps(product)
+    
+    def create(self, fields: dict) -> bytes:
+        with self._lock:
+            product_id = self._next_id
+            self._next_id += 1
+            product = {
+                "id": product_id,
+                "name": fields["name"],
+                "description": fields.get("description"),
+                "price": fields["price"],
+                "stock": fields.get("stock", 0),
+                "image_url": fields.get("image_url"),
+            }
+            self._products[product_id] = product
+            self._encoded[product_id] = encoded = self._encode(product)
+            self._ids.append(product_id)
+            self.version += 1
+            return encoded
+    
+    def get(self, product_id: int) -> Optional[bytes]:
+        return self._encoded.get(product_id)
+    
+    def update(self, product_id: int, fields: dict) -> Optional[bytes]:
+        with self._lock:
+            product = self._products.get(product_id)
+            if product is None:
+                return None
+            product.update(fields)
+            self._encoded[product_id] = encoded = self._encode(product)
+            self.version += 1
+            return encoded
+    
+    def delete(self, product_id: int) -> bool:
+        with self._lock:
+            if self._products.pop(product_id, None) is None:
+                return False
+            del self._encoded[product_id]
+            del self._ids[bisect.bisect_left(self._ids, product_id)]
+            self.version += 1
+            return True
+    
+    def page(self, skip: int, limit: int) -> bytes:
+        ids = self._ids[skip:skip + limit]
+        encoded = self._encoded
+        return b"[" + b",".join(encoded[product_id] for product_id in ids) + b"]"
+    
+    def seed(self, count: int):
+        for index in range(count):
+            self.create({
+                "name": f"Seed Product {index + 1}",
+                "price": round(1 + (index % 500) * 0.5, 2),
+                "description": "Seeded by the mock server",
+                "stock": index % 100,
+            })
+    
+    def __len__(self) -> int:
+        return len(self._ids)
@@ -0,0 +1,144 @@
+import atexit
+import csv
+import json
+import mmap
+import os
+import threading
+from array import array
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from config.settings import settings
+
+FORMATS = (".jsonl", ".csv")
+
+_files: Dict[str, "CaseFile"] = {}
+_files_lock = threading.Lock()
+
+
+def _cell(value: str) -> Any:
+    """CSV cells holding JSON (numbers, objects, lists, ``true``/``false``/``null``) are decoded; the rest stay strings."""
+    if value == "":
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+class CaseFile:
+    """Random access to the rows of a JSONL or CSV case file.
+    
+    Opening the file only memory-maps it and records the byte offset of every non-blank
+    line (a single pass, ~2 µs per row), so the rows are never held in memory as parsed
+    objects. ``row(index)`` parses a single line on demand. CSV files
+    need a header line, and quoted values must not span lines.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.format = os.path.splitext(path)[1].lower()
+        if self.format not in FORMATS:
+            raise ValueError(f"Unsupported case file '{path}', expected one of {FORMATS}")
+        self.fields: Optional[List[str]] = None
+        self._mmap = None
+        self._offsets = array("q")
+        if os.path.getsize(path):
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index()
+    
+    def _index(self):
+        data, size, position = self._mmap, len(self._mmap), 0
+        while position < size:
+            end = data.find(b"\n", position)
+            if end == -1:
+                end = size
+            if data[position:end].strip():
+                self._offsets.append(position)
+            position = end + 1
+        if self.format == ".csv" and self._offsets:
+            self.fields = next(csv.reader([self._line(self._offsets[0])]))
+            self._offsets = self._offsets[1:]
+    
+    def _line(self, offset: int) -> str:
+        end = self._mmap.find(b"\n", offset)
+        return self._mmap[offset:end if end != -1 else len(self._mmap)].decode("utf-8-sig").rstrip("\r")
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def row(self, index: int) -> dict:
+        line = self._line(self._offsets[index])
+        try:
+            if self.format == ".jsonl":
+                return json.loads(line)
+            return dict(zip(self.fields, map(_cell, next(csv.reader([line])))))
+        except ValueError as error:
+            raise ValueError(f"{self.path}: case {index + 1} is not valid {self.format[1:].upper()}: {error}") from None
+    
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def case_file(path: str) -> CaseFile:
+    """Returns the process-wide index of a case file, so each file is scanned once per process."""
+    path = os.path.abspath(path)
+    with _files_lock:
+        cases = _files.get(path)
+        if cases is None:
+            cases = _files[path] = CaseFile(path)
+            atexit.register(cases.close)
+        return cases
+
+
+class Case:
+    """One row of a case file, parsed the first time it is read."""
+    
+    __slots__ = ("file", "index", "_row")
+    
+    def __init__(self, file: CaseFile, index: int):
+        self.file = file
+        self.index = index
+        self._row = None
+    
+    @property
+    def row(self) -> dict:
+        if self._row is None:
+            self._row = self.file.row(self.index)
+        return self._row
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.row[key]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.row.get(key, default)
+    
+    def __repr__(self) -> str:
+        return f"Case({os.path.basename(self.file.path)}, {self.index + 1})"
+
+
+class CasesPlugin:
+    """Data-driven tests: the ``cases`` marker.
+    
+    ``@pytest.mark.cases("cases/products.jsonl")`` on a test that takes a ``case`` argument
+    generates one test per row, with ids ``case1``, ``case2``, ... The path is relative to
+    the test module. Collection only indexes the file; each row is parsed when its test
+    runs, so selecting a few cases with ``-k`` never parses the others.
+    """
+    
+    def pytest_generate_tests(self, metafunc):
+        marker = metafunc.definition.get_closest_marker("cases")
+        if marker is None:
+            return
+        if "case" not in metafunc.fixturenames:
+            raise pytest.UsageError(f"{metafunc.definition.nodeid}: the cases marker needs a 'case' argument")
+        path = os.path.join(os.path.dirname(str(metafunc.definition.fspath)), *marker.args)
+        cases = case_file(path)
+        limit = marker.kwargs.get("limit") or settings.CASES_LIMIT or len(cases)
+        count = min(limit, len(cases))
+        metafunc.parametrize("case", [Case(cases, index) for index in range(count)],
+                             ids=[f"case{index + 1}" for index in range(count)])
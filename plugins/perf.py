@@ -0,0 +1,182 @@
+import json
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import allure
+import pytest
+
+from clients.histogram import Histogram
+from config.settings import settings
+
+SLO_PERCENTILES = {"p50_ms": 50, "p90_ms": 90, "p95_ms": 95, "p99_ms": 99}
+SLO_KEYS = tuple(SLO_PERCENTILES) + ("max_ms", "mean_ms")
+OPTION_KEYS = SLO_KEYS + ("runs", "concurrency", "warmup", "max_error_rate")
+
+
+def _outcome(result: Any) -> Optional[str]:
+    """Classifies one call: ``None`` for success, otherwise the status code or exception name."""
+    status_code = getattr(result, "status_code", None)
+    if status_code is not None and not 200 <= status_code < 400:
+        return str(status_code)
+    return None
+
+
+def _timed(call: Callable[[], Any], runs: int, raise_errors: bool = False) -> List[Tuple[float, Optional[str]]]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        try:
+            outcome = _outcome(call())
+        except Exception as error:
+            if raise_errors:
+                raise
+            outcome = type(error).__name__
+        samples.append((time.perf_counter() - started, outcome))
+    return samples
+
+
+class PerfResult:
+    """Latency distribution and outcome counts of one ``perf.measure`` run, checked against its SLO."""
+    
+    def __init__(self, name: str, histogram: Histogram, errors: Counter, elapsed: float, options: Dict[str, Any]):
+        self.name = name
+        self.histogram = histogram
+        self.errors = errors
+        self.elapsed = elapsed
+        self.options = options
+    
+    @property
+    def runs(self) -> int:
+        return self.histogram.total_count
+    
+    @property
+    def error_rate(self) -> float:
+        return sum(self.errors.values()) / self.runs if self.runs else 0.0
+    
+    @property
+    def latency_ms(self) -> Dict[str, float]:
+        latency = {key: self.histogram.percentile(percentile) / 1000 for key, percentile in SLO_PERCENTILES.items()}
+        latency["max_ms"] = self.histogram.max_value / 1000
+        latency["mean_ms"] = self.histogram.mean / 1000
+        return latency
+    
+    @property
+    def slo(self) -> Dict[str, float]:
+        """Latency limits from the options, scaled by ``API_PERF_SLO_SCALE``."""
+        return {key: self.options[key] * settings.PERF_SLO_SCALE for key in SLO_KEYS if self.options.get(key)}
+    
+    def breaches(self) -> List[str]:
+        latency = self.latency_ms
+        breaches = [
+            f"{key[:-3]} {latency[key]:.2f} ms > {limit:.2f} ms"
+            for key, limit in self.slo.items() if latency[key] > limit
+        ]
+        max_error_rate = self.options.get("max_error_rate", 0.0)
+        if self.error_rate > max_error_rate:
+            breaches.append(f"error rate {self.error_rate:.2%} > {max_error_rate:.2%} ({dict(self.errors)})")
+        return breaches
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "concurrency": self.options["concurrency"],
+            "throughput_rps": round(self.runs / self.elapsed, 1) if self.elapsed else None,
+            "latency_ms": {key: round(value, 3) for key, value in self.latency_ms.items()},
+            "slo_ms": self.slo,
+            "errors": dict(self.errors),
+            "breaches": self.breaches(),
+        }
+
+
+class PerfMeter:
+    """What the ``perf`` fixture returns; options come from the test's ``perf`` marker unless overridden."""
+    
+    def __init__(self, item, options: Dict[str, Any]):
+        self.item = item
+        self.options = options
+        self.results: List[PerfResult] = []
+    
+    def measure(self, call: Callable[[], Any], name: Optional[str] = None, check: bool = True,
+                raise_errors: bool = False, **overrides) -> PerfResult:
+        """Calls ``call`` ``runs`` times on ``concurrency`` threads and fails the test if the SLO is breached.
+    
+        A call counts as an error when it returns a response with a 4xx/5xx status, or when it
+        raises (unless ``raise_errors`` is set, in which case the exception propagates).
+        """
+        unknown = set(overrides) - set(OPTION_KEYS)
+        if unknown:
+            raise TypeError(f"Unknown perf options: {sorted(unknown)}")
+        options = {**self.options, **overrides}
+        runs, concurrency = options["runs"], max(1, options["concurrency"])
+        _timed(call, options["warmup"], raise_errors)
+    
+        started = time.perf_counter()
+        if concurrency == 1:
+            batches = [_timed(call, runs, raise_errors)]
+        else:
+            shares = [runs // concurrency + (index < runs % concurrency) for index in range(concurrency)]
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                batches = list(executor.map(lambda share: _timed(call, share, raise_errors), shares))
+        elapsed = time.perf_counter() - started
+    
+        histogram, errors = Histogram(), Counter()
+        for batch in batches:
+            for seconds, outcome in batch:
+                histogram.record_seconds(seconds)
+                if outcome is not None:
+                    errors[outcome] += 1
+        result = PerfResult(name or self.item.name, histogram, errors, elapsed, options)
+        self._report(result)
+        if check:
+            breaches = result.breaches()
+            if breaches:
+                pytest.fail(f"Latency SLO breached for {result.name}: " + "; ".join(breaches), pytrace=False)
+        return result
+    
+    def _report(self, result: PerfResult):
+        self.results.append(result)
+        summary = json.dumps(result.to_dict(), indent=2)
+        self.item.user_properties.append(("perf", summary))
+        allure.attach(summary, name=f"Latency: {result.name}", attachment_type=allure.attachment_type.JSON)
+
+
+class PerfPlugin:
+    """Latency SLO assertions: the ``perf`` marker and fixture.
+    
+    ``@pytest.mark.perf(p95_ms=..., runs=N, concurrency=C)`` on its own repeats the whole
+    test body. Tests that request the ``perf`` fixture instead measure one call with
+    ``perf.measure(lambda: client.get_products())``, with the marker supplying defaults.
+    """
+    
+    def _options(self, item) -> Dict[str, Any]:
+        options = {
+            "runs": settings.PERF_RUNS,
+            "concurrency": 1,
+            "warmup": settings.PERF_WARMUP,
+            "max_error_rate": 0.0,
+        }
+        marker = item.get_closest_marker("perf")
+        if marker is not None:
+            unknown = set(marker.kwargs) - set(OPTION_KEYS)
+            if unknown:
+                raise pytest.UsageError(f"{item.nodeid}: unknown perf marker options {sorted(unknown)}")
+            options.update(marker.kwargs)
+        return options
+    
+    @pytest.fixture
+    def perf(self, request) -> PerfMeter:
+        return PerfMeter(request.node, self._options(request.node))
+    
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        if pyfuncitem.get_closest_marker("perf") is None or "perf" in pyfuncitem.fixturenames:
+            return None
+        funcargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+        meter = PerfMeter(pyfuncitem, self._options(pyfuncitem))
+    
+        # The test's own assertions still fail it, with their usual report, on the first broken run.
+        meter.measure(lambda: pyfuncitem.obj(**funcargs), raise_errors=True)
+        return True
@@ -0,0 +1,292 @@
+import fnmatch
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import sysconfig
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pytest
+
+from config.settings import settings
+
+METRICS = ("wall", "cpu")
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Stack (outermost frame first) -> [wall seconds, CPU seconds]
+Samples = Dict[Tuple[str, ...], List[float]]
+
+_LABEL = re.compile(r"^(.*) \((.*):(\d+)\)$")
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+def _cpu_clock(thread_id: int) -> Optional[int]:
+    try:
+        return time.pthread_getcpuclockid(thread_id)
+    except (AttributeError, OSError):  # pragma: no cover - not available on Windows / macOS
+        return None
+
+
+class StackSampler:
+    """Samples one thread's stack every ``interval`` seconds from a background thread.
+    
+    Each sample is weighted by the wall time and by the thread's CPU time since the previous
+    one, so the same stacks give a wall-clock profile (network waits and sleeps included) and
+    a CPU profile. Only frames below ``root`` are kept. The sampled thread runs untouched;
+    the cost is one stack walk per sample, taken while the sampler holds the GIL.
+    """
+    
+    def __init__(self, interval: float = 0.005, root_dir: Optional[str] = None):
+        self.interval = interval
+        self.root_dir = root_dir or os.getcwd()
+        self.samples: Samples = defaultdict(lambda: [0.0, 0.0])
+        self._labels: Dict[object, str] = {}
+        self._lock = threading.Lock()
+        self._target = None
+        self._last = (0.0, 0.0)
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._prefixes = tuple(sorted({
+            path + os.sep for path in (sysconfig.get_paths()["purelib"], sysconfig.get_paths()["stdlib"]) if path
+        }, key=len, reverse=True))
+    
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            for prefix in self._prefixes + (self.root_dir + os.sep,):
+                if path.startswith(prefix):
+                    path = path[len(prefix):]
+                    break
+            label = self._labels[code] = f"{code.co_name} ({path}:{code.co_firstlineno})"
+        return label
+    
+    def start(self, root, prefix: Tuple[str, ...] = ()):
+        """Samples the calling thread, keeping frames called (directly or not) from ``root``."""
+        thread_id = threading.get_ident()
+        clock = _cpu_clock(thread_id)
+        with self._lock:
+            self._target = (thread_id, root, prefix, clock)
+            self._last = (time.perf_counter(), time.clock_gettime(clock) if clock is not None else 0.0)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        with self._lock:
+            self._target = None
+    
+    def take(self) -> Samples:
+        """Returns the samples collected so far and starts afresh."""
+        with self._lock:
+            samples, self.samples = dict(self.samples), defaultdict(lambda: [0.0, 0.0])
+        return samples
+    
+    def close(self):
+        self._stopped = True
+    
+    def _run(self):
+        while not self._stopped:
+            time.sleep(self.interval)
+            with self._lock:
+                if self._target is not None:
+                    self._sample(*self._target)
+    
+    def _sample(self, thread_id: int, root, prefix: Tuple[str, ...], clock: Optional[int]):
+        frame = sys._current_frames().get(thread_id)
+        now = time.perf_counter(), time.clock_gettime(clock) if clock is not None else 0.0
+        wall, cpu = now[0] - self._last[0], now[1] - self._last[1]
+        self._last = now
+        stack = []
+        while frame is not None and frame is not root:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        if frame is None:
+            # The thread has already left ``root``, e.g. between the end of a phase and ``stop``.
+            return
+        weights = self.samples[prefix + tuple(reversed(stack))]
+        weights[0] += wall
+        weights[1] += cpu
+
+
+def collapsed(samples: Samples, metric: str) -> str:
+    """The ``frame;frame;frame weight`` lines flamegraph.pl, inferno and speedscope read; weights are µs."""
+    position = METRICS.index(metric)
+    lines = []
+    for stack, weights in sorted(samples.items()):
+        weight = round(weights[position] * 1e6)
+        if weight > 0:
+            lines.append(f"{';'.join(stack)} {weight}\n")
+    return "".join(lines)
+
+
+def read_collapsed(path: str, metric: str, samples: Samples):
+    """Adds the weights of a collapsed-stack file to ``samples``."""
+    position = METRICS.index(metric)
+    with open(path) as f:
+        for line in f:
+            stack, _, weight = line.rstrip("\n").rpartition(" ")
+            if stack:
+                samples.setdefault(tuple(stack.split(";")), [0.0, 0.0])[position] += int(weight) / 1e6
+
+
+def speedscope(name: str, samples: Samples) -> dict:
+    """A speedscope document with one wall-time and one CPU-time profile of the same samples."""
+    frames, index = [], {}
+    
+    def frame_index(label: str) -> int:
+        position = index.get(label)
+        if position is None:
+            match = _LABEL.match(label)
+            frame = {"name": match.group(1), "file": match.group(2), "line": int(match.group(3))} if match \
+                else {"name": label}
+            position = index[label] = len(frames)
+            frames.append(frame)
+        return position
+    
+    profiles = []
+    for position, metric in enumerate(METRICS):
+        stacks, weights = [], []
+        for stack, values in sorted(samples.items()):
+            weight = round(values[position] * 1e6)
+            if weight > 0:
+                stacks.append([frame_index(label) for label in stack])
+                weights.append(weight)
+        profiles.append({
+            "type": "sampled",
+            "name": f"{name} ({metric} time)",
+            "unit": "microseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": stacks,
+            "weights": weights,
+        })
+    return {"$schema": SPEEDSCOPE_SCHEMA, "name": name, "exporter": "plugins.profiling",
+            "shared": {"frames": frames}, "profiles": profiles}
+
+
+def hottest_frames(samples: Samples, top: int) -> List[Tuple[str, float, float]]:
+    """``(frame, wall, cpu)`` self times, summed over the stacks each frame is the innermost of."""
+    totals = defaultdict(lambda: [0.0, 0.0])
+    for stack, (wall, cpu) in samples.items():
+        frame = totals[stack[-1]]
+        frame[0] += wall
+        frame[1] += cpu
+    ranked = sorted(totals.items(), key=lambda item: -item[1][0])[:top]
+    return [(label, wall, cpu) for label, (wall, cpu) in ranked]
+
+
+def write_profile(directory: str, name: str, samples: Samples) -> str:
+    """Writes ``<name>.wall.collapsed``, ``<name>.cpu.collapsed`` and ``<name>.speedscope.json``; returns the base path."""
+    os.makedirs(directory, exist_ok=True)
+    base = os.path.join(directory, name)
+    for metric in METRICS:
+        with open(f"{base}.{metric}.collapsed", "w") as f:
+            f.write(collapsed(samples, metric))
+    with open(f"{base}.speedscope.json", "w") as f:
+        json.dump(speedscope(name, samples), f, separators=(",", ":"))
+    return base
+
+
+def profile_name(nodeid: str) -> str:
+    name = _UNSAFE.sub("_", nodeid).strip("_")
+    if len(name) > 120:
+        name = f"{name[:100]}-{hashlib.sha1(nodeid.encode()).hexdigest()[:12]}"
+    return name
+
+
+class ProfilingPlugin:
+    """Sampling profiler for selected tests: the ``profile`` marker and ``API_PROFILE``.
+    
+    Tests marked ``@pytest.mark.profile``, or whose node id matches one of the comma-separated
+    ``API_PROFILE`` patterns (``fnmatch``, e.g. ``tests/with_reports/*``), have their stack
+    sampled through setup, call and teardown. The phase is the root frame. Each profiled
+    test gets wall and CPU flame graphs in ``API_PROFILE_DIR``, as collapsed stacks and
+    speedscope JSON. At the end of the session they are summed into ``all.*``, and the
+    hottest frames are listed in the terminal summary.
+    """
+    
+    def __init__(self, patterns: Iterable[str] = (), directory: str = "profiles", interval: float = 0.005,
+                 top: int = 15):
+        self.patterns = [pattern for pattern in patterns if pattern]
+        self.directory = directory
+        self.interval = interval
+        self.top = top
+        self.sampler: Optional[StackSampler] = None
+        self.profiles: List[str] = []
+        self.summary: Optional[Samples] = None
+    
+    @classmethod
+    def from_settings(cls) -> "ProfilingPlugin":
+        return cls([pattern.strip() for pattern in settings.PROFILE.split(",")], settings.PROFILE_DIR,
+                   settings.PROFILE_INTERVAL_MS / 1000, settings.PROFILE_TOP)
+    
+    def _enabled(self, item) -> bool:
+        return item.get_closest_marker("profile") is not None or \
+            any(fnmatch.fnmatch(item.nodeid, pattern) for pattern in self.patterns)
+    
+    def _profile(self, item, phase: str):
+        if not self._enabled(item):
+            yield
+            return
+        if self.sampler is None:
+            self.sampler = StackSampler(self.interval, str(item.config.rootpath))
+        # The wrappers are suspended generators while the phase runs; the first plain function
+        # above them (pluggy's hook caller) stays on the stack and roots the sampled frames.
+        root = sys._getframe(1)
+        while root.f_code.co_flags & inspect.CO_GENERATOR:
+            root = root.f_back
+        self.sampler.start(root, (phase,))
+        try:
+            yield
+        finally:
+            self.sampler.stop()
+        if phase == "teardown":
+            base = write_profile(self.directory, profile_name(item.nodeid), self.sampler.take())
+            item.user_properties.append(("profile", base))
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        yield from self._profile(item, "setup")
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        yield from self._profile(item, "call")
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield from self._profile(item, "teardown")
+    
+    def pytest_runtest_logreport(self, report):
+        if report.when == "teardown":
+            self.profiles += [value for name, value in report.user_properties if name == "profile"]
+    
+    def pytest_sessionfinish(self, session):
+        """Sums the per-test profiles (under xdist, those of every worker) into ``all.*``."""
+        if self.sampler is not None:
+            self.sampler.close()
+        if not self.profiles or hasattr(session.config, "workerinput"):
+            return
+        samples: Samples = {}
+        for base in self.profiles:
+            for metric in METRICS:
+                read_collapsed(f"{base}.{metric}.collapsed", metric, samples)
+        write_profile(self.directory, "all", samples)
+        self.summary = samples
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.summary:
+            return
+        wall = sum(weights[0] for weights in self.summary.values())
+        cpu = sum(weights[1] for weights in self.summary.values())
+        terminalreporter.write_sep("-", f"profile: {len(self.profiles)} tests, {wall:.2f}s wall, {cpu:.2f}s CPU")
+        terminalreporter.write_line(f"{'wall ms':>10} {'wall %':>7} {'CPU ms':>10}  frame (self time)")
+        for label, frame_wall, frame_cpu in hottest_frames(self.summary, self.top):
+            terminalreporter.write_line(f"{frame_wall * 1000:>10.1f} {frame_wall / wall:>7.1%} {frame_cpu * 1000:>10.1f}  {label}")
+        terminalreporter.write_line(f"Flame graphs: {os.path.join(self.directory, 'all')}.{{wall,cpu}}.collapsed, "
+                                    f"all.speedscope.json and one set per test")
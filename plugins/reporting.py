@@ -0,0 +1,215 @@
+import json
+import queue
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, List, Optional, Tuple
+
+import allure
+import allure_commons
+import pytest
+from allure_commons import hookimpl
+from allure_commons.logger import AllureFileLogger
+
+from config.settings import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast backend
+    orjson = None
+
+MODES = ("full", "lite")
+STEP_LEVELS = ("all", "failures", "none")
+
+_reporter: Optional["Reporter"] = None
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+class AsyncAllureFileLogger(AllureFileLogger):
+    """``AllureFileLogger`` that serialises results and writes files on a background thread.
+    
+    Reporting hooks only enqueue work, so JSON encoding and file I/O no longer count
+    towards test wall time. ``close`` drains the queue before the session ends.
+    """
+    
+    def __init__(self, report_dir):
+        super().__init__(report_dir, clean=False)
+        self.errors: List[OSError] = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="allure-writer", daemon=True)
+        self._thread.start()
+    
+    def _drain(self):
+        while True:
+            write = self._queue.get()
+            if write is None:
+                return
+            try:
+                write()
+            except OSError as error:
+                self.errors.append(error)
+    
+    @hookimpl
+    def report_result(self, result):
+        self._queue.put(partial(self._report_item, result))
+    
+    @hookimpl
+    def report_container(self, container):
+        self._queue.put(partial(self._report_item, container))
+    
+    @hookimpl
+    def report_attached_file(self, source, file_name):
+        self._queue.put(partial(AllureFileLogger.report_attached_file, self, source, file_name))
+    
+    @hookimpl
+    def report_attached_data(self, body, file_name):
+        self._queue.put(partial(AllureFileLogger.report_attached_data, self, body, file_name))
+    
+    @hookimpl
+    def report_globals(self, globals_item):
+        self._queue.put(partial(self._report_item, globals_item))
+    
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self.errors:
+            warnings.warn(f"{len(self.errors)} Allure result file(s) could not be written: {self.errors[0]}")
+
+
+class Reporter:
+    """Reporting policy behind ``step`` and ``attach_json``.
+    
+    ``steps`` decides the step granularity: ``all`` reports every step and attachment as
+    it happens, ``failures`` buffers them and only reports them for failed tests, and
+    ``none`` drops them. In ``lite`` mode large JSON attachments are sampled and truncated.
+    """
+    
+    def __init__(self, mode: Optional[str] = None, steps: Optional[str] = None,
+                 max_attachment_bytes: Optional[int] = None, sample_items: Optional[int] = None):
+        self.mode = mode or settings.ALLURE_MODE
+        self.steps = steps or settings.ALLURE_STEPS or ("failures" if self.mode == "lite" else "all")
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown Allure mode '{self.mode}', expected one of {MODES}")
+        if self.steps not in STEP_LEVELS:
+            raise ValueError(f"Unknown Allure step level '{self.steps}', expected one of {STEP_LEVELS}")
+        self.max_attachment_bytes = max_attachment_bytes or settings.ALLURE_MAX_ATTACHMENT_BYTES
+        self.sample_items = sample_items or settings.ALLURE_SAMPLE_ITEMS
+        self.trail: List[Tuple[str, float, Optional[str]]] = []
+        self.attachments: List[Tuple[str, Any]] = []
+    
+    def encode(self, data: Any) -> bytes:
+        """Encodes ``data`` as JSON; in ``lite`` mode long lists are sampled and oversized bodies truncated."""
+        if self.mode == "full":
+            return _dumps(data)
+        if isinstance(data, list) and len(data) > self.sample_items:
+            data = {"truncated": True, "total_items": len(data), "items": data[:self.sample_items]}
+        body = _dumps(data)
+        if len(body) > self.max_attachment_bytes:
+            preview = body[:self.max_attachment_bytes].decode("utf-8", errors="ignore")
+            body = _dumps({"truncated": True, "size_bytes": len(body), "preview": preview})
+        return body
+    
+    def report_failure(self):
+        """Reports the buffered step trail and attachments of the failing test."""
+        if self.trail:
+            lines = []
+            for title, seconds, error in self.trail:
+                lines.append(f"{'FAILED' if error else 'passed'}  {seconds * 1000:8.2f} ms  {title}")
+                if error:
+                    lines.append(f"    {error}")
+            allure.attach("\n".join(lines), name="Steps", attachment_type=allure.attachment_type.TEXT)
+        for name, data in self.attachments:
+            allure.attach(self.encode(data), name=name, attachment_type=allure.attachment_type.JSON)
+    
+    def reset(self):
+        self.trail = []
+        self.attachments = []
+
+
+@contextmanager
+def step(title: str):
+    """Drop-in replacement for ``allure.step`` that follows the configured step granularity."""
+    reporter = _reporter
+    if reporter is None or reporter.steps == "all":
+        with allure.step(title):
+            yield
+        return
+    if reporter.steps == "none":
+        yield
+        return
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as exc:
+        error = f"{type(exc).__name__}: {str(exc).partition(chr(10))[0]}"
+        raise
+    finally:
+        reporter.trail.append((title, time.perf_counter() - started, error))
+
+
+def attach_json(data: Any, name: str):
+    """Attaches ``data`` as real JSON (not its Python repr), subject to the configured granularity and limits."""
+    reporter = _reporter
+    if reporter is None:
+        allure.attach(_dumps(data), name=name, attachment_type=allure.attachment_type.JSON)
+    elif reporter.steps == "all":
+        allure.attach(reporter.encode(data), name=name, attachment_type=allure.attachment_type.JSON)
+    elif reporter.steps == "failures":
+        reporter.attachments.append((name, data))
+
+
+class ReportingPlugin:
+    """Applies ``API_ALLURE_*`` settings to a pytest session.
+    
+    In ``lite`` mode allure-pytest's file logger is swapped for ``AsyncAllureFileLogger``.
+    Buffered steps and attachments are reported when a test fails and discarded otherwise.
+    """
+    
+    def __init__(self, reporter: Optional[Reporter] = None):
+        self.reporter = reporter or Reporter()
+        self.logger: Optional[AsyncAllureFileLogger] = None
+        self._replaced: Optional[AllureFileLogger] = None
+    
+    def pytest_configure(self, config):
+        global _reporter
+        _reporter = self.reporter
+    
+    def pytest_sessionstart(self, session):
+        if self.reporter.mode != "lite":
+            return
+        for plugin in allure_commons.plugin_manager.get_plugins():
+            if type(plugin) is AllureFileLogger:
+                self._replaced = plugin
+                allure_commons.plugin_manager.unregister(plugin)
+                self.logger = AsyncAllureFileLogger(plugin._report_dir)
+                allure_commons.plugin_manager.register(self.logger)
+                session.config.add_cleanup(self._close_logger)
+                return
+    
+    def _close_logger(self):
+        allure_commons.plugin_manager.unregister(self.logger)
+        self.logger.close()
+        # allure-pytest's own cleanup, which runs after this one, unregisters the logger it created.
+        allure_commons.plugin_manager.register(self._replaced)
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed and self.reporter.steps == "failures":
+            self.reporter.report_failure()
+        if report.when == "teardown" or report.failed:
+            self.reporter.reset()
+    
+    def pytest_unconfigure(self, config):
+        global _reporter
+        if _reporter is self.reporter:
+            _reporter = None
@@ -0,0 +1,277 @@
+import argparse
+import heapq
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+from config.settings import settings
+
+# Weight of the latest measurement when folding it into the stored duration.
+SMOOTHING = 0.5
+# Estimate for tests never timed, when nothing at all has been timed yet.
+DEFAULT_DURATION = 1.0
+JUNIT_COUNTERS = ("tests", "errors", "failures", "skipped")
+
+
+def parse_shard(spec: str) -> Optional[Tuple[int, int]]:
+    """Parses ``API_SHARD`` (``index/count``, 1-based), e.g. ``2/4``; returns None when sharding is off."""
+    if not spec:
+        return None
+    index, _, count = spec.partition("/")
+    try:
+        shard = int(index), int(count)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}', expected INDEX/COUNT, e.g. 2/4") from None
+    if not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Invalid shard '{spec}', INDEX must be between 1 and COUNT")
+    return shard
+
+
+def shard_label(index: int, count: int) -> str:
+    return f"{index}-of-{count}"
+
+
+def _write_json(path: str, data) -> None:
+    """Writes ``data`` next to ``path`` and renames it into place, so readers never see a partial file."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f, separators=(",", ":"), sort_keys=True)
+    os.replace(temporary, path)
+
+
+def _read_json(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+class DurationStore:
+    """Per-test durations from past runs: one compact JSON object of node id -> seconds.
+    
+    New measurements are folded in as an exponential moving average, so one slow run
+    shifts the estimate without replacing it.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.durations: Dict[str, float] = _read_json(path)
+    
+    def estimates(self, nodeids: Sequence[str]) -> List[float]:
+        """Known durations, with the median of the known ones standing in for new tests."""
+        known = sorted(self.durations[nodeid] for nodeid in nodeids if nodeid in self.durations)
+        default = known[len(known) // 2] if known else DEFAULT_DURATION
+        return [self.durations.get(nodeid, default) for nodeid in nodeids]
+    
+    def update(self, measured: Dict[str, float]):
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            seconds = seconds if previous is None else previous + SMOOTHING * (seconds - previous)
+            self.durations[nodeid] = round(seconds, 4)
+    
+    def save(self):
+        _write_json(self.path, self.durations)
+
+
+def plan_shards(durations: Sequence[float], count: int) -> Tuple[List[int], List[float]]:
+    """Longest-processing-time bin packing: the shard of each test and the estimated total of each shard.
+    
+    Tests are placed longest first, each on the shard with the least work so far. Ties are
+    broken by position, so every node computes the same plan from the same inputs.
+    """
+    loads = [(0.0, shard) for shard in range(count)]
+    assignment = [0] * len(durations)
+    for position in sorted(range(len(durations)), key=lambda position: (-durations[position], position)):
+        load, shard = heapq.heappop(loads)
+        assignment[position] = shard
+        heapq.heappush(loads, (load + durations[position], shard))
+    totals = [0.0] * count
+    for load, shard in loads:
+        totals[shard] = load
+    return assignment, totals
+
+
+class ShardingPlugin:
+    """Splits the selected tests into ``API_SHARD`` balanced shards and records how long each test took.
+    
+    With ``API_SHARD_DIR`` set, the directory is all the nodes share. ``durations.json``
+    holds the durations of past runs, which every shard reads to compute the same plan.
+    Each shard writes its Allure results, JUnit XML and measured durations to
+    ``shards/<index>-of-<count>/``, and ``python -m plugins.sharding merge`` combines them
+    into one report and folds the durations into the store.
+    """
+    
+    def __init__(self, shard: Optional[Tuple[int, int]] = None, directory: Optional[str] = None):
+        self.shard = shard
+        self.directory = directory
+        self.store = DurationStore(os.path.join(directory, "durations.json")) if directory else None
+        self.measured: Dict[str, float] = defaultdict(float)
+        self.summary: Optional[str] = None
+    
+    @classmethod
+    def from_settings(cls) -> "ShardingPlugin":
+        shard = parse_shard(settings.SHARD)
+        return cls(shard if shard and shard[1] > 1 else None, settings.SHARD_DIR or None)
+    
+    @property
+    def shard_dir(self) -> Optional[str]:
+        if self.directory is None or self.shard is None:
+            return None
+        return os.path.join(self.directory, "shards", shard_label(*self.shard))
+    
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_configure(self, config):
+        # Runs before the junitxml and allure plugins read their output paths.
+        if self.shard_dir is None or config.option.collectonly:
+            return
+        if not hasattr(config, "workerinput"):
+            shutil.rmtree(self.shard_dir, ignore_errors=True)
+            os.makedirs(self.shard_dir)
+        config.option.xmlpath = os.path.join(self.shard_dir, "junit.xml")
+        config.option.allure_report_dir = os.path.join(self.shard_dir, "allure")
+    
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        """Keeps this shard's part of whatever selection ``-k``, ``-m`` and other plugins left."""
+        if self.shard is None or not items:
+            return
+        index, count = self.shard
+        nodeids = [item.nodeid for item in items]
+        estimates = self.store.estimates(nodeids) if self.store is not None else [DEFAULT_DURATION] * len(items)
+        assignment, totals = plan_shards(estimates, count)
+        selected = [item for item, shard in zip(items, assignment) if shard == index - 1]
+        deselected = [item for item, shard in zip(items, assignment) if shard != index - 1]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+        self.summary = (f"shard {index}/{count}: {len(selected)} of {len(nodeids)} tests, "
+                        f"estimated {totals[index - 1]:.1f}s (slowest shard {max(totals):.1f}s)")
+    
+    def pytest_report_collectionfinish(self, config, items):
+        return self.summary
+    
+    def pytest_runtest_logreport(self, report):
+        self.measured[report.nodeid] += report.duration
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Saves the measured durations; under xdist only the controller, which sees every report, does."""
+        config = session.config
+        if self.store is None or not self.measured or config.option.collectonly or hasattr(config, "workerinput"):
+            return
+        if self.shard_dir is not None:
+            _write_json(os.path.join(self.shard_dir, "durations.json"), self.measured)
+        else:
+            self.store.update(self.measured)
+            self.store.save()
+
+
+def merge_junit(paths: Sequence[str], output: str) -> Dict[str, int]:
+    """Combines the ``<testsuite>`` elements of several JUnit files under one ``<testsuites>`` root."""
+    import xml.etree.ElementTree as ET
+    
+    root = ET.Element("testsuites")
+    totals = dict.fromkeys(JUNIT_COUNTERS, 0)
+    elapsed = 0.0
+    for path in paths:
+        tree = ET.parse(path).getroot()
+        for suite in ([tree] if tree.tag == "testsuite" else tree.iter("testsuite")):
+            suite.set("name", f"{suite.get('name', 'pytest')} ({os.path.basename(os.path.dirname(path))})")
+            for counter in JUNIT_COUNTERS:
+                totals[counter] += int(suite.get(counter, 0))
+            elapsed = max(elapsed, float(suite.get("time", 0)))
+            root.append(suite)
+    for counter, value in totals.items():
+        root.set(counter, str(value))
+    root.set("time", f"{elapsed:.3f}")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    ET.ElementTree(root).write(output, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def merge_allure(directories: Sequence[str], output: str) -> int:
+    """Copies every shard's Allure results into one directory; result files have unique names already."""
+    os.makedirs(output, exist_ok=True)
+    copied = 0
+    for directory in directories:
+        for entry in os.scandir(directory):
+            if entry.is_file():
+                shutil.copy2(entry.path, os.path.join(output, entry.name))
+                copied += 1
+    return copied
+
+
+def merge_shards(directory: str, allure_output: Optional[str] = None, junit_output: Optional[str] = None,
+                 keep: bool = False) -> dict:
+    """Merges the shard outputs found under ``directory`` and folds their durations into the store."""
+    root = os.path.join(directory, "shards")
+    shards = sorted(os.listdir(root)) if os.path.isdir(root) else []
+    paths = [os.path.join(root, shard) for shard in shards]
+    counts = {int(shard.rpartition("-of-")[2]) for shard in shards}
+    if len(counts) > 1:
+        raise ValueError(f"{root} holds shards of runs split {sorted(counts)} ways; merge one run at a time")
+    expected = {shard_label(index, count) for count in counts for index in range(1, count + 1)}
+    result = {"shards": shards, "missing": sorted(expected - set(shards))}
+    
+    if junit_output:
+        junit = [os.path.join(path, "junit.xml") for path in paths if os.path.isfile(os.path.join(path, "junit.xml"))]
+        result["junit"] = merge_junit(junit, junit_output)
+    if allure_output:
+        allure = [os.path.join(path, "allure") for path in paths if os.path.isdir(os.path.join(path, "allure"))]
+        result["allure_files"] = merge_allure(allure, allure_output)
+    
+    measured = {}
+    for path in paths:
+        measured.update(_read_json(os.path.join(path, "durations.json")))
+    if measured:
+        store = DurationStore(os.path.join(directory, "durations.json"))
+        store.update(measured)
+        store.save()
+    result["tests_timed"] = len(measured)
+    
+    if not keep:
+        for path in paths:
+            shutil.rmtree(path)
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m plugins.sharding",
+                                     description="Merge the outputs of a sharded run from its shared directory.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge = commands.add_parser("merge", help="Merge shard reports and update the duration store")
+    merge.add_argument("directory", nargs="?", default=settings.SHARD_DIR or None,
+                       help="Shared shard directory (default: API_SHARD_DIR)")
+    merge.add_argument("--allure", metavar="DIR", help="Write the combined Allure results here")
+    merge.add_argument("--junit", metavar="PATH", help="Write the combined JUnit XML here")
+    merge.add_argument("--keep", action="store_true", help="Keep the per-shard outputs after merging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.directory:
+        print("No shard directory given and API_SHARD_DIR is not set")
+        return 2
+    result = merge_shards(args.directory, args.allure, args.junit, args.keep)
+    print(f"Merged {len(result['shards'])} shards, timed {result['tests_timed']} tests")
+    if "junit" in result:
+        print(f"JUnit: {args.junit} ({', '.join(f'{value} {key}' for key, value in result['junit'].items())})")
+    if "allure_files" in result:
+        print(f"Allure: {args.allure} ({result['allure_files']} files)")
+    if result["missing"]:
+        print(f"MISSING: {', '.join(result['missing'])} - their tests are not in the report")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,192 @@
+import os
+import tempfile
+import uuid
+from typing import TYPE_CHECKING
 import pytest
-import allure
-from clients.products_client import ProductsClient
+from config.settings import settings
+from plugins.cases import CasesPlugin
+from plugins.perf import PerfPlugin
+from plugins.profiling import ProfilingPlugin
+from plugins.reporting import ReportingPlugin, attach_json, step
+
+# The clients (and requests under them), the product pool and the sharding plugin are imported
+# where they are first needed, so collecting or listing tests does not pay for them up front.
+# Marker-driven plugins (cases, perf, profile) must be registered before collection.
+if TYPE_CHECKING:
+    from clients.products_client import ProductsClient
+
+
+def _run_id(config) -> str:
+    """Identifier shared by the xdist controller and every worker of one run.
+    
+    The controller picks the id and hands it to xdist as ``--testrunuid``, which passes it
+    on to each worker, so the controller's sweep prefix matches the workers' namespaces.
+    """
+    if settings.TEST_NAMESPACE:
+        return settings.TEST_NAMESPACE
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        return workerinput["testrunuid"][:12]
+    if getattr(config.option, "testrunuid", None) is None:
+        config.option.testrunuid = uuid.uuid4().hex
+    return config.option.testrunuid[:12]
+
+
+def _is_xdist_controller(config) -> bool:
+    return not hasattr(config, "workerinput") and config.getoption("dist", "no") != "no"
+
+
+def sweep_products(client: "ProductsClient", prefix: str) -> int:
+    """Deletes every product whose name starts with ``prefix``. Returns the number deleted."""
+    leftovers = [
+        product["id"] for product in client.iter_products()
+        if str(product.get("name", "")).startswith(prefix)
+    ]
+    for _ in client.delete_products(leftovers, ordered=False):
+        pass
+    return len(leftovers)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # tryfirst: the sharding plugin redirects the JUnit and Allure output before those plugins configure.
+    config.pluginmanager.register(ReportingPlugin(), "api_reporting")
+    config.pluginmanager.register(PerfPlugin(), "api_perf")
+    config.pluginmanager.register(CasesPlugin(), "api_cases")
+    if settings.SHARD or settings.SHARD_DIR:
+        from plugins.sharding import ShardingPlugin
+        config.pluginmanager.register(ShardingPlugin.from_settings(), "api_sharding")
+    config.pluginmanager.register(ProfilingPlugin.from_settings(), "api_profiling")
+    if _is_xdist_controller(config):
+        # Before xdist starts the workers, which take their testrunuid from this option.
+        _run_id(config)
+    if hasattr(config, "workerinput") and not settings.RATE_LIMIT_DIR:
+        # xdist workers share one request budget (API_RATE_LIMIT / API_RATE_LIMITS) unless told otherwise.
+        settings.RATE_LIMIT_DIR = os.path.join(tempfile.gettempdir(), "api-rate-limit")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """With API_MOCK_SERVER set, every process that runs tests gets its own in-process mock Products API.
+    
+    The server is started here rather than at configure time, so ``--collect-only`` runs, runs
+    that deselect everything and the xdist controller never start one.
+    """
+    config = session.config
+    if not settings.MOCK_SERVER or not session.items or config.option.collectonly or _is_xdist_controller(config):
+        return
+    from mockserver import start_mock_server
+    
+    config._mock_server = start_mock_server(settings.API_KEY)
+    settings.BASE_URL = config._mock_server.url
+
+
+def pytest_runtest_setup(item):
+    if settings.TRANSPORT == "replay" and item.get_closest_marker("live") is not None:
+        pytest.skip("Needs real network I/O, which a replay run does not do")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Replay skips live tests, so a recording must not hold their traffic either, or the
+    # identical requests of later tests would replay the live tests' responses.
+    store = None
+    if settings.TRANSPORT == "record" and item.get_closest_marker("live") is not None:
+        from clients.cassette import shared_store
+        store = shared_store("record")
+        store.paused = True
+    yield
+    if store is not None:
+        store.paused = False
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_mock_server", None)
+    if server is not None:
+        server.stop()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Under xdist, the controller sweeps the whole run's namespace, catching products left by crashed workers.
+    
+    Nothing to sweep when nothing ran, or when each worker had its own mock server.
+    """
+    if exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED or session.config.option.collectonly:
+        return
+    if _is_xdist_controller(session.config) and not settings.MOCK_SERVER:
+        import requests
+        from clients.products_client import ProductsClient
+        client = ProductsClient()
+        try:
+            sweep_products(client, f"[{_run_id(session.config)}-")
+        except requests.RequestException:
+            pass
+        finally:
+            client.close()
 
 
 @pytest.fixture(scope="session")
-def products_client():
-    """Provides a shared ProductsClient instance for the test session."""
-    with allure.step("Initialize Products API client"):
+def test_namespace(request):
+    """Name prefix unique to this run and xdist worker, so parallel workers never touch each other's products."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return f"[{_run_id(request.config)}-{worker}]"
+
+
+@pytest.fixture(scope="session")
+def product_name(test_namespace):
+    """Builds namespaced product names, e.g. ``product_name("Test Product")``."""
+    def build(name: str) -> str:
+        return f"{test_namespace} {name}"
+    return build
+
+
+@pytest.fixture(scope="session")
+def products_client(test_namespace):
+    """Provides a ProductsClient (with its own connection pool) per test session / xdist worker."""
+    import requests
+    from clients.products_client import ProductsClient
+    
+    with step("Initialize Products API client"):
         client = ProductsClient()
     yield client
-    with allure.step("Close Products API client"):
+    with step(f"Sweep leftover products in namespace {test_namespace}"):
+        try:
+            sweep_products(client, test_namespace)
+        except requests.RequestException:
+            pass
+    with step("Close Products API client"):
         client.close()
 
 
+@pytest.fixture(scope="session")
+def product_pool(products_client, product_name):
+    """Session-wide pool of pre-provisioned products, deleted in one batch at the end."""
+    from tests.product_pool import ProductPool
+    
+    pool = ProductPool(name=product_name, client=products_client)
+    yield pool
+    with step("Delete pooled products"):
+        pool.teardown()
+
+
 @pytest.fixture(scope="function")
-def created_product(products_client):
-    """Creates a test product and cleans it up after the test."""
-    with allure.step("Create test product"):
-        response = products_client.create_product(
-            name="Test Product",
-            price=99.99,
-            description="Test product for automated testing",
-            stock=10
-        )
+def created_product(product_pool):
+    """Hands out a fresh product the test may modify or delete; it is deleted at session end."""
+    with step("Acquire test product"):
+        product = product_pool.acquire()
     
-    if response.status_code == 201:
-        product = response.json()
-        allure.attach(
-            str(product),
-            name="Created Product",
-            attachment_type=allure.attachment_type.JSON
-        )
+    if product is not None:
+        attach_json(product, name="Created Product")
         yield product
-        with allure.step(f"Cleanup: Delete product {product['id']}"):
-            products_client.delete_product(product["id"])
+        product_pool.retire(product["id"])
     else:
         yield None
+
+
+@pytest.fixture(scope="function")
+def pooled_product(product_pool):
+    """Hands out a product for read-only use; it goes back to the pool afterwards."""
+    product = product_pool.acquire()
+    yield product
+    if product is not None:
+        product_pool.release(product)
@@ -0,0 +1,47 @@
+from typing import Callable
+
+import pytest
+import requests
+
+from clients.products_client import ProductsClient
+from plugins.cases import Case
+from tests.product_pool import ProductPool
+
+# ``product_id`` value that stands for a fresh product from the pool.
+PRODUCT_PLACEHOLDER = "$product"
+
+ACTIONS = {
+    "list": lambda client, product_id, payload, params: client.get_products(**params),
+    "get": lambda client, product_id, payload, params: client.get_product(product_id),
+    "create": lambda client, product_id, payload, params: client.post(client.ENDPOINT, data=payload),
+    "update": lambda client, product_id, payload, params: client.update_product(product_id, **payload),
+    "delete": lambda client, product_id, payload, params: client.delete_product(product_id),
+}
+
+
+def run_case(case: Case, client: ProductsClient, pool: ProductPool, name: Callable[[str], str]) -> requests.Response:
+    """Makes the ``ProductsClient`` call a case-file row describes and returns the response.
+    
+    Rows have an ``action`` (``list``, ``get``, ``create``, ``update`` or ``delete``), an
+    ``expected_status`` and, depending on the action, a ``product_id`` (``$product`` for a
+    fresh pooled product), a JSON ``payload`` and list ``params``. Product names in payloads
+    are namespaced, and every product a case creates or touches is deleted at session end.
+    """
+    action = ACTIONS.get(case["action"])
+    if action is None:
+        raise ValueError(f"{case}: unknown action '{case['action']}', expected one of {tuple(ACTIONS)}")
+    payload = dict(case.get("payload") or {})
+    if isinstance(payload.get("name"), str) and payload["name"].strip():
+        payload["name"] = name(payload["name"])
+    product_id = case.get("product_id")
+    if product_id == PRODUCT_PLACEHOLDER:
+        product = pool.acquire()
+        if product is None:
+            pytest.skip("Product creation failed")
+        product_id = product["id"]
+        pool.retire(product_id)
+    
+    response = action(client, product_id, payload, case.get("params") or {})
+    if case["action"] == "create" and response.status_code == 201:
+        pool.retire(response.json()["id"])
+    return response
@@ -0,0 +1,67 @@
+import threading
+from collections import deque
+from typing import Callable, List, Optional
+
+from clients.products_client import ProductsClient
+from config.settings import settings
+
+
+class ProductPool:
+    """Pre-provisions test products in batches and hands them out to tests.
+    
+    Products returned with ``release`` are reused by later tests. Products that a
+    test may have changed or deleted are ``retire``-d instead, and everything is
+    deleted in one batch by ``teardown`` at the end of the session. Batches use the
+    bulk endpoint when the server has one and concurrent single requests otherwise.
+    """
+    
+    TEMPLATE = {
+        "price": 99.99,
+        "description": "Test product for automated testing",
+        "stock": 10,
+    }
+    
+    def __init__(self, name: Callable[[str], str], batch_size: Optional[int] = None,
+                 client: Optional[ProductsClient] = None):
+        self.name = name
+        self.batch_size = batch_size or settings.PRODUCT_POOL_SIZE
+        self.client = client or ProductsClient()
+        self._available = deque()
+        self._retired: List[int] = []
+        self._lock = threading.Lock()
+    
+    def provision(self, count: Optional[int] = None) -> int:
+        """Creates ``count`` products in one batch and adds them to the pool. Returns how many were created."""
+        payloads = ({"name": self.name("Test Product"), **self.TEMPLATE} for _ in range(count or self.batch_size))
+        products = [result.data for result in self.client.create_products(payloads) if result.status_code == 201]
+        with self._lock:
+            self._available.extend(products)
+        return len(products)
+    
+    def acquire(self) -> Optional[dict]:
+        """Returns a provisioned product, creating a new batch when the pool is empty."""
+        with self._lock:
+            if self._available:
+                return self._available.popleft()
+        if not self.provision():
+            return None
+        with self._lock:
+            return self._available.popleft() if self._available else None
+    
+    def release(self, product: dict):
+        """Returns an unmodified product to the pool for reuse."""
+        with self._lock:
+            self._available.append(product)
+    
+    def retire(self, product_id: int):
+        """Schedules a product for deletion at teardown instead of deleting it inline."""
+        with self._lock:
+            self._retired.append(product_id)
+    
+    def teardown(self):
+        with self._lock:
+            product_ids = [product["id"] for product in self._available] + self._retired
+            self._available.clear()
+            self._retired = []
+        for _ in self.client.delete_products(product_ids, ordered=False):
+            pass
@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+from clients.async_products_client import AsyncProductsClient
+
+
+class TestAsyncProducts:
+
+    @pytest.mark.smoke
+    def test_concurrent_get_products_returns_200(self):
+        async def run():
+            async with AsyncProductsClient() as client:
+                return await asyncio.gather(*(client.get_products() for _ in range(20)))
+        
+        responses = asyncio.run(run())
+        
+        assert all(response.status_code == 200 for response in responses), \
+            f"Expected all 200, got {[response.status_code for response in responses]}"
+
+    @pytest.mark.regression
+    def test_concurrent_create_and_delete_products(self, product_name):
+        async def run():
+            async with AsyncProductsClient(max_concurrency=5) as client:
+                created = await asyncio.gather(*(
+                    client.create_product(name=product_name(f"Async Product {i}"), price=10.0 + i, stock=i)
+                    for i in range(10)
+                ))
+                ids = [response.json()["id"] for response in created if response.status_code == 201]
+                deleted = await asyncio.gather(*(client.delete_product(product_id) for product_id in ids))
+                return created, deleted
+        
+        created, deleted = asyncio.run(run())
+        
+        assert all(response.status_code == 201 for response in created), \
+            f"Expected all 201, got {[response.status_code for response in created]}"
+        assert all(response.status_code == 204 for response in deleted), \
+            f"Expected all 204, got {[response.status_code for response in deleted]}"
+
+    @pytest.mark.regression
+    def test_async_get_product_not_found_returns_404(self):
+        async def run():
+            async with AsyncProductsClient() as client:
+                return await client.get_product(product_id=999999)
+        
+        response = asyncio.run(run())
+        
+        assert response.status_code == 404, f"Expected 404, got {response.status_code}"
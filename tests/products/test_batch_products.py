@@ -0,0 +1,139 @@
+import asyncio
+import pytest
+from config.settings import settings
+from clients.async_products_client import AsyncProductsClient
+from clients.products_client import ProductsClient
+from mockserver import start_mock_server
+
+
+@pytest.fixture
+def single_request_client():
+    client = ProductsClient()
+    client.bulk_supported = False
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def failing_server():
+    server = start_mock_server(settings.API_KEY, error_rate=1.0)
+    yield server
+    server.stop()
+
+
+class TestBatchProducts:
+
+    @pytest.mark.smoke
+    def test_create_products_returns_results_in_order(self, products_client: ProductsClient, product_pool,
+                                                      product_name):
+        payloads = [{"name": product_name(f"Batch Product {i}"), "price": 10.0 + i, "stock": i} for i in range(5)]
+        
+        results = list(products_client.create_products(payloads))
+        for result in results:
+            if result.ok:
+                product_pool.retire(result.data["id"])
+        
+        assert [result.index for result in results] == list(range(5)), "Results should follow input order"
+        assert all(result.status_code == 201 for result in results), \
+            f"Expected all 201, got {[result.status_code for result in results]}"
+        assert [result.data["name"] for result in results] == [payload["name"] for payload in payloads]
+
+    @pytest.mark.regression
+    def test_invalid_item_does_not_abort_batch(self, products_client: ProductsClient, product_pool, product_name):
+        payloads = [
+            {"name": product_name("Valid Batch Product"), "price": 5.0},
+            {"name": product_name("Invalid Batch Product"), "price": -1},
+            {"name": product_name("Another Valid Batch Product"), "price": 6.0},
+        ]
+        
+        results = list(products_client.create_products(payloads))
+        for result in results:
+            if result.ok:
+                product_pool.retire(result.data["id"])
+        
+        assert [result.status_code for result in results] == [201, 422, 201], \
+            f"Expected [201, 422, 201], got {[result.status_code for result in results]}"
+
+    @pytest.mark.regression
+    def test_update_and_delete_products(self, products_client: ProductsClient, product_pool):
+        products = [product_pool.acquire() for _ in range(3)]
+        if None in products:
+            pytest.skip("Product creation failed")
+        ids = [product["id"] for product in products]
+        
+        updated = list(products_client.update_products({"id": product_id, "stock": 42} for product_id in ids))
+        deleted = list(products_client.delete_products(ids + [999999]))
+        for product_id in ids:
+            product_pool.retire(product_id)
+        
+        assert all(result.status_code == 200 and result.data["stock"] == 42 for result in updated), \
+            f"Expected all 200 with stock 42, got {[(r.status_code, r.data) for r in updated]}"
+        assert [result.status_code for result in deleted] == [204, 204, 204, 404], \
+            f"Expected [204, 204, 204, 404], got {[result.status_code for result in deleted]}"
+
+    @pytest.mark.regression
+    def test_single_request_fallback_streams_every_result(self, single_request_client: ProductsClient,
+                                                          product_pool, product_name):
+        payloads = [{"name": product_name(f"Fan-out Product {i}"), "price": 1.0 + i} for i in range(8)]
+        
+        results = list(single_request_client.create_products(payloads, ordered=False, concurrency=4))
+        for result in results:
+            if result.ok:
+                product_pool.retire(result.data["id"])
+        
+        assert sorted(result.index for result in results) == list(range(8)), "Every item should get a result"
+        assert all(result.status_code == 201 for result in results), \
+            f"Expected all 201, got {[result.status_code for result in results]}"
+
+    @pytest.mark.regression
+    def test_async_create_and_delete_products(self, product_name):
+        async def run():
+            async with AsyncProductsClient() as client:
+                created = [result async for result in client.create_products(
+                    {"name": product_name(f"Async Batch Product {i}"), "price": 2.0 + i} for i in range(5)
+                )]
+                ids = [result.data["id"] for result in created if result.ok]
+                deleted = [result async for result in client.delete_products(ids)]
+                return created, deleted
+        
+        created, deleted = asyncio.run(run())
+        
+        assert all(result.status_code == 201 for result in created), \
+            f"Expected all 201, got {[result.status_code for result in created]}"
+        assert all(result.status_code == 204 for result in deleted), \
+            f"Expected all 204, got {[result.status_code for result in deleted]}"
+
+    @pytest.mark.regression
+    def test_failed_bulk_probe_is_asked_again(self, failing_server, product_name):
+        client = ProductsClient(base_url=failing_server.url)
+        payloads = [{"name": product_name(f"Probe Product {i}"), "price": 1.0 + i} for i in range(3)]
+        try:
+            failed = list(client.create_products(payloads))
+            undecided = client.bulk_supported
+            failing_server.app.error_rate = 0.0
+            created = list(client.create_products(payloads))
+        finally:
+            client.close()
+        
+        assert [result.status_code for result in failed] == [503] * 3
+        assert undecided is None, "A 503 probe must not settle whether the bulk endpoint exists"
+        assert [result.status_code for result in created] == [201] * 3
+        assert client.bulk_supported is True
+
+    @pytest.mark.regression
+    def test_async_failed_bulk_probe_is_asked_again(self, failing_server, product_name):
+        payloads = [{"name": product_name(f"Async Probe Product {i}"), "price": 1.0 + i} for i in range(3)]
+        
+        async def run():
+            async with AsyncProductsClient(base_url=failing_server.url) as client:
+                failed = [result async for result in client.create_products(payloads)]
+                undecided = client.bulk_supported
+                failing_server.app.error_rate = 0.0
+                created = [result async for result in client.create_products(payloads)]
+                return failed, undecided, created, client.bulk_supported
+        
+        failed, undecided, created, decided = asyncio.run(run())
+        
+        assert [result.status_code for result in failed] == [503] * 3
+        assert (undecided, decided) == (None, True)
+        assert [result.status_code for result in created] == [201] * 3
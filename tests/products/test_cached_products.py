@@ -0,0 +1,73 @@
+import pytest
+from clients.cache import ResponseCache
+from clients.models import Product
+from clients.products_client import ProductsClient
+from clients.response import ApiResponse
+
+
+@pytest.fixture
+def cached_client():
+    client = ProductsClient(cache=ResponseCache(ttl=60))
+    yield client
+    client.close()
+
+
+def _response(body: bytes) -> ApiResponse:
+    response = ApiResponse()
+    response.status_code = 200
+    response._content = body
+    response.model_type = Product
+    return response
+
+
+class TestCachedProducts:
+
+    @pytest.mark.regression
+    def test_repeated_get_product_is_served_from_cache(self, cached_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Product creation failed")
+        
+        first = cached_client.get_product(pooled_product["id"])
+        second = cached_client.get_product(pooled_product["id"])
+        
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert cached_client.cache.stats["hits"] == 1, "Second GET should be a cache hit"
+
+    @pytest.mark.regression
+    def test_update_product_invalidates_cached_product(self, cached_client: ProductsClient, created_product,
+                                                        product_name):
+        if created_product is None:
+            pytest.skip("Product creation failed")
+        
+        cached_client.get_product(created_product["id"])
+        name = product_name("Cached Then Updated")
+        update_response = cached_client.update_product(created_product["id"], name=name)
+        response = cached_client.get_product(created_product["id"])
+        
+        assert update_response.status_code == 200, f"Expected 200, got {update_response.status_code}"
+        assert response.json()["name"] == name, "Update should invalidate the cached product"
+
+    @pytest.mark.regression
+    def test_use_cache_false_bypasses_cache(self, cached_client: ProductsClient):
+        cached_client.get_products()
+        response = cached_client.get_products(use_cache=False)
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert cached_client.cache.stats["hits"] == 0, "Bypassed GET should not be served from the cache"
+
+    @pytest.mark.regression
+    def test_cache_hit_keeps_the_decoded_body_and_model_type(self, monkeypatch):
+        cache = ResponseCache(ttl=60)
+        miss = cache.get("/products/7", None, lambda headers: _response(b'{"id": 7, "name": "Cached", "price": 1.5}'))
+        miss.json()
+        decodes = []
+        monkeypatch.setattr("clients.response.loads", decodes.append)
+        
+        hit = cache.get("/products/7", None, lambda headers: pytest.fail("A fresh entry should not be fetched again"))
+        
+        assert hit is not miss
+        assert hit.json() == {"id": 7, "name": "Cached", "price": 1.5}
+        assert decodes == [], "A hit should reuse the decoded body instead of parsing it again"
+        assert hit.model_type is Product and hit.model.name == "Cached"
+        assert dict(cache.stats) == {"misses": 1, "hits": 1}
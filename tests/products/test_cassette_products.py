@@ -0,0 +1,108 @@
+import pytest
+from config.settings import settings
+from clients.cassette import CassetteMissError, CassetteStore, RecordingAdapter, ReplayAdapter
+from clients.products_client import ProductsClient
+from mockserver import start_mock_server
+
+# Nothing listens here; replayed clients must never reach the network.
+UNREACHABLE_URL = "http://127.0.0.1:9"
+
+
+@pytest.fixture(scope="module")
+def recording_server():
+    server = start_mock_server(settings.API_KEY)
+    yield server
+    server.stop()
+
+
+def _client(base_url: str, adapter) -> ProductsClient:
+    client = ProductsClient(base_url=base_url)
+    client.session.mount("http://", adapter)
+    return client
+
+
+@pytest.fixture
+def recorded(recording_server, tmp_path, product_name):
+    """Records a create, two reads around an update, and a list into a cassette; returns what was seen."""
+    store = CassetteStore(str(tmp_path), mode="record")
+    client = _client(recording_server.url, RecordingAdapter(store))
+    try:
+        created = client.create_product(name=product_name("Cassette Product"), price=3.5, stock=1)
+        product_id = created.json()["id"]
+        before = client.get_product(product_id, use_cache=False)
+        client.update_product(product_id, stock=7)
+        after = client.get_product(product_id, use_cache=False)
+        page = client.get_products(limit=5, use_cache=False)
+    finally:
+        client.close()
+        store.close()
+    return str(tmp_path), product_id, [before.json(), after.json()], page.json()
+
+
+class TestCassetteProducts:
+
+    @pytest.mark.regression
+    def test_replay_returns_the_recorded_responses_in_order(self, recorded, product_name):
+        directory, product_id, reads, page = recorded
+        store = CassetteStore(directory, mode="replay")
+        client = _client(UNREACHABLE_URL, ReplayAdapter(store))
+        try:
+            created = client.create_product(name=product_name("Cassette Product"), price=3.5, stock=1)
+            first = client.get_product(product_id, use_cache=False)
+            client.update_product(product_id, stock=7)
+            second = client.get_product(product_id, use_cache=False)
+            replayed_page = client.get_products(limit=5, use_cache=False)
+        finally:
+            client.close()
+            store.close()
+        
+        assert (created.status_code, created.json()["id"]) == (201, product_id)
+        assert [first.json(), second.json()] == reads
+        assert [read["stock"] for read in reads] == [1, 7], "Identical requests replay their recordings in order"
+        assert replayed_page.json() == page
+
+    @pytest.mark.regression
+    def test_strict_replay_misses_but_lenient_replay_repeats(self, recorded):
+        directory, product_id, reads, _ = recorded
+        strict, lenient = CassetteStore(directory, mode="replay"), CassetteStore(directory, mode="replay", match="lenient")
+        strict_client = _client(UNREACHABLE_URL, ReplayAdapter(strict))
+        lenient_client = _client(UNREACHABLE_URL, ReplayAdapter(lenient))
+        try:
+            with pytest.raises(CassetteMissError):
+                strict_client.get_products(limit=6, use_cache=False)
+            lenient_reads = [lenient_client.get_product(product_id, use_cache=False).json() for _ in range(3)]
+        finally:
+            strict_client.close()
+            lenient_client.close()
+            strict.close()
+            lenient.close()
+        
+        assert lenient_reads == reads + [reads[-1]]
+
+    @pytest.mark.regression
+    def test_replaying_a_missing_cassette_says_how_to_record_one(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="API_TRANSPORT=record.*API_CASSETTE_DIR"):
+            CassetteStore(str(tmp_path / "missing"), mode="replay")
+
+    @pytest.mark.regression
+    def test_paused_recording_leaves_requests_out(self, recording_server, tmp_path):
+        store = CassetteStore(str(tmp_path), mode="record")
+        client = _client(recording_server.url, RecordingAdapter(store))
+        try:
+            store.paused = True
+            client.get_products(limit=3, use_cache=False)
+            store.paused = False
+            client.get_products(limit=4, use_cache=False)
+        finally:
+            client.close()
+            store.close()
+        
+        replay = CassetteStore(str(tmp_path), mode="replay")
+        client = _client(UNREACHABLE_URL, ReplayAdapter(replay))
+        try:
+            assert client.get_products(limit=4, use_cache=False).status_code == 200
+            with pytest.raises(CassetteMissError):
+                client.get_products(limit=3, use_cache=False)
+        finally:
+            client.close()
+            replay.close()
@@ -0,0 +1,65 @@
+import pytest
+from config.settings import settings
+from clients.compression import Compression
+from clients.instrumentation import InMemorySink, Instrumentation
+from clients.products_client import ProductsClient
+from mockserver import start_mock_server
+
+
+@pytest.fixture(scope="module")
+def gzip_server():
+    server = start_mock_server(settings.API_KEY, extra_payload_bytes=2048, seed_products=5, compress_min_bytes=256)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def compressed_client(gzip_server):
+    client = ProductsClient(base_url=gzip_server.url, compression=Compression("gzip", min_bytes=256),
+                            instrumentation=Instrumentation([InMemorySink()]))
+    yield client
+    client.close()
+
+
+def _totals(client: ProductsClient, method: str) -> dict:
+    rows = client.instrumentation.sink(InMemorySink).summary()
+    return next(row for row in rows if row["method"] == method)
+
+
+class TestCompressedProducts:
+
+    @pytest.mark.regression
+    def test_large_body_is_sent_gzipped(self, compressed_client: ProductsClient):
+        description = "Compressible description. " * 100
+        response = compressed_client.create_product(name="Gzipped Product", price=9.99, description=description)
+        
+        assert response.status_code == 201
+        assert response.request.headers["Content-Encoding"] == "gzip"
+        assert response.json()["description"] == description, "Server should store the decompressed body"
+        totals = _totals(compressed_client, "POST")
+        assert totals["bytes_sent"] < totals["uncompressed_bytes_sent"] / 5
+
+    @pytest.mark.regression
+    def test_small_body_is_sent_as_is(self, compressed_client: ProductsClient):
+        response = compressed_client.create_product(name="Small Product", price=1.5)
+        
+        assert response.status_code == 201
+        assert "Content-Encoding" not in response.request.headers
+        totals = _totals(compressed_client, "POST")
+        assert totals["bytes_sent"] == totals["uncompressed_bytes_sent"]
+
+    @pytest.mark.regression
+    @pytest.mark.live
+    def test_gzipped_response_is_decoded(self, compressed_client: ProductsClient):
+        response = compressed_client.get_products(limit=5, use_cache=False)
+        
+        assert response.status_code == 200
+        assert "gzip" in response.request.headers["Accept-Encoding"]
+        assert len(response.json()) == 5
+        totals = _totals(compressed_client, "GET")
+        assert totals["bytes_received"] < totals["uncompressed_bytes_received"] / 5
+
+    @pytest.mark.regression
+    def test_unknown_encoding_is_rejected(self):
+        with pytest.raises(ValueError, match="Unsupported request encoding"):
+            Compression("lz4")
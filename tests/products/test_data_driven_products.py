@@ -0,0 +1,24 @@
+import pytest
+from clients.products_client import ProductsClient
+from tests.product_cases import run_case
+
+
+class TestDataDrivenProducts:
+
+    @pytest.mark.regression
+    @pytest.mark.cases("cases/products.jsonl")
+    def test_jsonl_case_returns_expected_status(self, products_client: ProductsClient, product_pool, product_name,
+                                                case):
+        response = run_case(case, products_client, product_pool, product_name)
+        
+        assert response.status_code == case["expected_status"], \
+            f"{case}: expected {case['expected_status']}, got {response.status_code}"
+
+    @pytest.mark.regression
+    @pytest.mark.cases("cases/products.csv")
+    def test_csv_case_returns_expected_status(self, products_client: ProductsClient, product_pool, product_name,
+                                              case):
+        response = run_case(case, products_client, product_pool, product_name)
+        
+        assert response.status_code == case["expected_status"], \
+            f"{case}: expected {case['expected_status']}, got {response.status_code}"
@@ -6,19 +6,11 @@ class TestDeleteProduct:
 
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_delete_product_returns_200(self, products_client: ProductsClient):
-        # Create a product to delete
-        create_response = products_client.post("/products/", data={
-            "name": "Product to Delete",
-            "price": 50.00,
-            "stock": 5,
-            "description": "Test product for deletion",
-            "image_url": "https://example.com/image.jpg"
-        })
+    def test_delete_product_returns_200(self, products_client: ProductsClient, created_product):
+        if created_product is None:
+            pytest.skip("Product creation failed")
         
-        assert create_response.status_code == 201, f"Setup failed: Expected 201, got {create_response.status_code}"
-        
-        product_id = create_response.json()["id"]
+        product_id = created_product["id"]
         
         response = products_client.delete_product(product_id)
         
@@ -1,4 +1,5 @@
 import pytest
+from clients.models import Product
 from clients.products_client import ProductsClient
 
 
@@ -14,6 +15,30 @@ class TestGetProducts:
         response_data = response.json()
         assert isinstance(response_data, list), "Response should be a list of products"
 
+    @pytest.mark.regression
+    def test_get_products_model_returns_typed_products(self, products_client: ProductsClient):
+        response = products_client.get_products()
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert all(isinstance(product, Product) for product in response.model), \
+            "Response model should be a list of Product records"
+        assert [product.id for product in response.model] == [item["id"] for item in response.json()]
+
+    @pytest.mark.regression
+    def test_get_products_model_matches_the_json_body(self, products_client: ProductsClient):
+        response = products_client.get_products(limit=5, use_cache=False)
+        items = response.json()
+        
+        assert len(response.model) == len(items)
+        for product, item in zip(response.model, items):
+            assert (product.id, product.name, product.price, product.stock) == \
+                (item["id"], item["name"], item["price"], item.get("stock", 0))
+            assert product.description == item.get("description")
+        assert response.model[:2] == [Product.from_dict(item) for item in items[:2]]
+        if items:
+            with pytest.raises(TypeError):
+                hash(response.model[0])
+
     @pytest.mark.regression
     def test_get_products_without_api_key_returns_200(self):
         client = ProductsClient(api_key="")
@@ -35,6 +60,27 @@ class TestGetProducts:
         
         client.close()
 
+    @pytest.mark.regression
+    def test_get_product_returns_200(self, products_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Product creation failed")
+        
+        response = products_client.get_product(product_id=pooled_product["id"])
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert response.json()["id"] == pooled_product["id"]
+
+    @pytest.mark.regression
+    def test_iter_products_streams_whole_catalog(self, products_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Product creation failed")
+        
+        products = list(products_client.iter_products(page_size=10, typed=True))
+        
+        ids = [product.id for product in products]
+        assert len(ids) == len(set(ids)), "Paginated products should not repeat"
+        assert pooled_product["id"] in ids, "Paginated products should include every product"
+
     @pytest.mark.regression
     def test_get_product_not_found_returns_404(self, products_client: ProductsClient):
         response = products_client.get_product(product_id=999999)
@@ -0,0 +1,68 @@
+import pytest
+import requests
+from config.settings import settings
+from clients.http2 import Http2Adapter
+from clients.products_client import ProductsClient
+from mockserver import start_mock_server
+
+# Nothing listens here, so a request routed through it can only fail to connect.
+UNREACHABLE_PROXY = "http://127.0.0.1:9"
+
+
+@pytest.fixture(scope="module")
+def gzip_server():
+    server = start_mock_server(settings.API_KEY, extra_payload_bytes=2048, seed_products=5, compress_min_bytes=256)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def http2_client(gzip_server):
+    client = ProductsClient(base_url=gzip_server.url)
+    client.session.mount("http://", Http2Adapter())
+    yield client
+    client.close()
+
+
+class TestHttp2Products:
+
+    @pytest.mark.regression
+    def test_compressed_response_is_decoded_and_headers_describe_the_body(self, http2_client: ProductsClient):
+        response = http2_client.get_products(use_cache=False)
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+        assert len(response.json()) == 5
+        assert response.headers["Content-Type"].startswith("application/json")
+        assert "Content-Encoding" not in response.headers, "httpx already decoded the body"
+        assert "Content-Length" not in response.headers, "The wire length no longer matches the decoded body"
+        assert response.wire_bytes < len(response.content)
+        assert response.request.headers["X-API-Key"] == settings.API_KEY
+
+    @pytest.mark.regression
+    def test_uncompressed_response_keeps_its_headers(self, http2_client: ProductsClient):
+        response = http2_client.get_product(999999, use_cache=False)
+        
+        assert (response.status_code, response.reason) == (404, "Not Found")
+        assert int(response.headers["Content-Length"]) == len(response.content) == response.wire_bytes
+
+    @pytest.mark.regression
+    def test_proxy_is_used(self, http2_client: ProductsClient):
+        http2_client.session.proxies = {"http": UNREACHABLE_PROXY}
+        
+        with pytest.raises(requests.ConnectionError):
+            http2_client.get_products(use_cache=False)
+
+    @pytest.mark.regression
+    def test_client_cert_is_loaded_for_https_only(self, gzip_server):
+        adapter = Http2Adapter()
+        http_request = requests.Request("GET", f"{gzip_server.url}/products/",
+                                        headers={"X-API-Key": settings.API_KEY}).prepare()
+        https_request = requests.Request("GET", "https://127.0.0.1:9/products/").prepare()
+        try:
+            response = adapter.send(http_request, cert="/missing/client.pem")
+            with pytest.raises(FileNotFoundError):
+                adapter.send(https_request, cert="/missing/client.pem")
+        finally:
+            adapter.close()
+        
+        assert response.status_code == 200
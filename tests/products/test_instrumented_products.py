@@ -0,0 +1,81 @@
+import json
+import pytest
+from config.settings import settings
+from clients.instrumentation import InMemorySink, Instrumentation, JsonlSink, PrometheusSink
+from clients.products_client import ProductsClient
+from mockserver import start_mock_server
+
+
+@pytest.fixture(scope="module")
+def metrics_server():
+    server = start_mock_server(settings.API_KEY, seed_products=3)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def instrumented_client(metrics_server, tmp_path):
+    sinks = [InMemorySink(), JsonlSink(str(tmp_path / "requests.jsonl")),
+             PrometheusSink(str(tmp_path / "metrics.prom"))]
+    client = ProductsClient(base_url=metrics_server.url, instrumentation=Instrumentation(sinks))
+    for _ in range(3):
+        client.get_products(limit=2, use_cache=False)
+    for _ in range(2):
+        client.get_product(999999, use_cache=False)
+    client.close()
+    client.instrumentation.close()
+    return client
+
+
+def _records(tmp_path) -> list:
+    with open(tmp_path / "requests.jsonl") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestInstrumentedProducts:
+
+    @pytest.mark.regression
+    def test_memory_sink_counts_requests_per_endpoint(self, instrumented_client: ProductsClient):
+        rows = instrumented_client.instrumentation.sink(InMemorySink).summary()
+        
+        counts = {(row["method"], row["endpoint"]): (row["count"], row["statuses"], row["errors"]) for row in rows}
+        assert counts == {
+            ("GET", "/products/"): (3, {200: 3}, 0),
+            ("GET", "/products/{id}"): (2, {404: 2}, 0),
+        }
+        assert all(row["bytes_received"] > 0 for row in rows)
+
+    @pytest.mark.regression
+    def test_jsonl_sink_writes_one_record_per_request(self, instrumented_client: ProductsClient, tmp_path):
+        records = _records(tmp_path)
+        
+        assert [(record["endpoint"], record["status"]) for record in records] == \
+            [("/products/", 200)] * 3 + [("/products/{id}", 404)] * 2
+        assert sum(record["bytes_received"] for record in records) == \
+            sum(row["bytes_received"] for row in instrumented_client.instrumentation.sink(InMemorySink).summary())
+
+    @pytest.mark.live
+    @pytest.mark.regression
+    def test_ttfb_excludes_connect_time(self, instrumented_client: ProductsClient, tmp_path):
+        records = _records(tmp_path)
+        
+        assert records[0]["connect_time"] > 0, "The first request should open a connection"
+        for record in records:
+            assert record["connect_time"] + record["ttfb"] <= record["total_time"], \
+                f"Connect time should not be counted again in the TTFB: {record}"
+
+    @pytest.mark.regression
+    def test_prometheus_sink_renders_counters_and_histograms(self, instrumented_client: ProductsClient, tmp_path):
+        with open(tmp_path / "metrics.prom") as f:
+            text = f.read()
+        
+        assert text == instrumented_client.instrumentation.sink(PrometheusSink).render()
+        lines = text.splitlines()
+        assert 'api_client_requests_total{method="GET",endpoint="/products/",status="200"} 3' in lines
+        assert 'api_client_requests_total{method="GET",endpoint="/products/{id}",status="404"} 2' in lines
+        assert 'api_client_bytes_total{method="GET",endpoint="/products/",direction="sent"} 0' in lines
+        for phase in ("connect", "ttfb", "total", "decode"):
+            labels = f'method="GET",endpoint="/products/",phase="{phase}"'
+            assert f'api_client_request_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+            assert f"api_client_request_seconds_count{{{labels}}} 3" in lines
+        assert "# TYPE api_client_request_seconds histogram" in lines
@@ -0,0 +1,36 @@
+import pytest
+from clients.products_client import ProductsClient
+
+
+class TestProductsLatency:
+
+    @pytest.mark.perf(p95_ms=500, runs=30)
+    def test_get_products_latency(self, products_client: ProductsClient):
+        response = products_client.get_products(use_cache=False)
+        
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}"
+
+    @pytest.mark.perf(p95_ms=500, p99_ms=1000, runs=40, concurrency=4)
+    def test_get_product_latency_under_concurrency(self, products_client: ProductsClient, pooled_product, perf):
+        if pooled_product is None:
+            pytest.skip("Product creation failed")
+        
+        result = perf.measure(lambda: products_client.get_product(pooled_product["id"], use_cache=False))
+        
+        assert result.runs == 40
+
+    @pytest.mark.perf(p95_ms=1000, runs=10, warmup=0)
+    def test_create_product_latency(self, products_client: ProductsClient, product_pool, product_name, perf):
+        created = []
+        
+        def create():
+            response = products_client.create_product(name=product_name("Latency Product"), price=9.99)
+            if response.status_code == 201:
+                created.append(response.json()["id"])
+            return response
+        
+        try:
+            perf.measure(create)
+        finally:
+            for product_id in created:
+                product_pool.retire(product_id)
@@ -0,0 +1,91 @@
+import time
+import pytest
+from config.settings import settings
+from clients.histogram import Histogram
+from clients.products_client import ProductsClient
+from load import LoadRunner, Scenario
+from load.scenario import Action
+from mockserver import start_mock_server
+
+
+@pytest.fixture(scope="module")
+def load_server():
+    server = start_mock_server(settings.API_KEY)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def runner_for(load_server):
+    def build(scenario: Scenario) -> LoadRunner:
+        return LoadRunner(scenario, client_factory=lambda: ProductsClient(base_url=load_server.url))
+    return build
+
+
+def _slow_call(client: ProductsClient, ids):
+    time.sleep(0.02)
+    return client.get_products(limit=1, use_cache=False)
+
+
+class TestLoadProducts:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("percentile, expected_us", [(50, 1_000), (99.9, 1_000), (100, 100_000)])
+    def test_histogram_percentiles(self, percentile, expected_us):
+        histogram = Histogram()
+        for _ in range(999):
+            histogram.record_seconds(0.001)
+        histogram.record_seconds(0.1)
+        
+        assert histogram.percentile(percentile) == pytest.approx(expected_us, rel=2 ** -7)
+
+    @pytest.mark.regression
+    def test_merged_histograms_match_a_single_histogram(self):
+        single, left, right = Histogram(), Histogram(), Histogram()
+        for value_us in range(1, 10_001, 7):
+            single.record(value_us)
+            (left if value_us % 2 else right).record(value_us)
+        
+        left.merge(right)
+        
+        assert left.percentiles(50, 95, 99) == single.percentiles(50, 95, 99)
+        assert (left.total_count, left.min_value, left.max_value) == (single.total_count, 1, single.max_value)
+
+    @pytest.mark.live
+    @pytest.mark.regression
+    def test_open_loop_issues_requests_on_schedule(self, runner_for):
+        runner = runner_for(Scenario.from_mix("get_products=1", seed=1))
+        
+        result = runner.run_open(rps=50, duration=0.4, workers=2)
+        
+        assert result.total_requests == 20, "Open loop should send one request per tick, whatever the latency"
+        assert dict(result.recorder.status_counts) == {"200": 20}
+        assert result.to_dict()["latency"]["count"] == 20
+        assert result.format().startswith("Mode: open (target 50 rps)")
+
+    @pytest.mark.live
+    @pytest.mark.regression
+    def test_open_loop_latency_includes_queueing(self, runner_for):
+        runner = runner_for(Scenario([Action(name="slow", weight=1, call=_slow_call)]))
+        
+        result = runner.run_open(rps=100, duration=0.1, workers=1)
+        
+        assert result.total_requests == 10
+        assert result.recorder.latency.max_value > 2 * result.recorder.service_time.max_value, \
+            "Latency should be measured from the intended send time, not from when the late request went out"
+
+    @pytest.mark.live
+    @pytest.mark.regression
+    def test_closed_loop_users_wait_for_each_response(self, runner_for):
+        scenario = Scenario.from_mix("create_product=2,get_product=1,delete_product=1", seed=7)
+        runner = runner_for(scenario)
+        
+        result = runner.run_closed(users=2, duration=0.2, think_time=0.05)
+        
+        attempts = result.total_requests + sum(result.recorder.skipped.values())
+        
+        assert 2 <= attempts <= 8, "Each user waits for its response and the think time before the next action"
+        assert all(status.startswith("2") for status in result.recorder.status_counts), \
+            f"Unexpected statuses {dict(result.recorder.status_counts)}"
+        assert result.to_dict()["users"] == 2
+        assert scenario.ids.drain() == [], "Products created by the run should be deleted afterwards"
@@ -0,0 +1,38 @@
+import socket
+import pytest
+from config.settings import settings
+from mockserver import start_mock_server
+
+
+@pytest.fixture(scope="module")
+def raw_server():
+    server = start_mock_server(settings.API_KEY)
+    yield server
+    server.stop()
+
+
+def _exchange(server, raw: bytes) -> bytes:
+    """Sends raw bytes and returns everything the server writes before closing the connection."""
+    with socket.create_connection((server.host, server.port), timeout=5) as sock:
+        sock.sendall(raw)
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+class TestMalformedRequestsProducts:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("raw", [
+        b"GARBAGE\r\n\r\n",
+        b"POST /products/ HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+        b"POST /products/ HTTP/1.1\r\nContent-Length: -3\r\n\r\n",
+    ], ids=["request-line", "content-length", "negative-length"])
+    def test_malformed_request_gets_400_and_close(self, raw_server, raw):
+        response = _exchange(raw_server, raw)
+        
+        assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+        assert b"Connection: close\r\n" in response
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A run that reuses the suite's conftest: each worker writes its namespace, the controller its sweep prefix.
+PROBE_CONFTEST = '''
+import os
+from tests.conftest import *
+from tests.conftest import _run_id
+
+
+def pytest_terminal_summary(config):
+    with open(os.path.join(os.environ["PROBE_DIR"], "controller"), "w") as f:
+        f.write(f"[{_run_id(config)}-")
+'''
+PROBE_TEST = '''
+import os
+
+
+def test_probe(test_namespace):
+    with open(os.path.join(os.environ["PROBE_DIR"], os.environ["PYTEST_XDIST_WORKER"]), "w") as f:
+        f.write(test_namespace)
+'''
+
+
+class TestNamespaceProducts:
+
+    @pytest.mark.regression
+    def test_controller_sweep_prefix_matches_worker_namespaces(self, tmp_path):
+        probe = tmp_path / "probe"
+        probe.mkdir()
+        (probe / "conftest.py").write_text(PROBE_CONFTEST)
+        (probe / "test_probe.py").write_text(PROBE_TEST)
+        env = {key: value for key, value in os.environ.items()
+               if key != "API_TEST_NAMESPACE" and not key.startswith("PYTEST_XDIST")}
+        env.update(PYTHONPATH=ROOT, PROBE_DIR=str(tmp_path), API_MOCK_SERVER="1")
+        
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-n", "1", "-p", "no:cacheprovider", str(probe)],
+            cwd=str(tmp_path), env=env, capture_output=True, text=True, timeout=120,
+        )
+        
+        assert result.returncode == 0, result.stdout + result.stderr
+        prefix = (tmp_path / "controller").read_text()
+        namespace = (tmp_path / "gw0").read_text()
+        assert namespace.startswith(prefix), f"Controller sweeps {prefix!r}, worker creates {namespace!r}"
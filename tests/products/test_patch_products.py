@@ -6,22 +6,22 @@ class TestUpdateProduct:
 
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_update_product_returns_200(self, products_client: ProductsClient, created_product):
+    def test_update_product_returns_200(self, products_client: ProductsClient, created_product, product_name):
         if created_product is None:
             pytest.skip("Product creation failed")
         
-        update_data = {"name": "Updated Product Name", "price": 149.99}
+        update_data = {"name": product_name("Updated Product Name"), "price": 149.99}
         
         response = products_client.update_product(
             product_id=created_product["id"],
-            name="Updated Product Name",
+            name=update_data["name"],
             price=149.99
         )
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
         response_data = response.json()
-        assert response_data["name"] == "Updated Product Name"
+        assert response_data["name"] == update_data["name"]
         assert response_data["price"] == 149.99
 
     @pytest.mark.regression
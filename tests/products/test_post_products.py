@@ -6,9 +6,9 @@ class TestCreateProduct:
 
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_create_product_returns_201(self, products_client: ProductsClient):
+    def test_create_product_returns_201(self, products_client: ProductsClient, product_pool, product_name):
         payload = {
-            "name": "Test Product",
+            "name": product_name("Test Product"),
             "price": 99.99,
             "description": "Test product for automated testing",
             "stock": 10
@@ -24,14 +24,14 @@ class TestCreateProduct:
         assert response.status_code == 201, f"Expected 201, got {response.status_code}"
         
         response_data = response.json()
-        assert response_data["name"] == "Test Product"
+        assert response_data["name"] == payload["name"]
         assert response_data["price"] == 99.99
         assert response_data["description"] == "Test product for automated testing"
         assert response_data["stock"] == 10
         assert "id" in response_data
         
-        # Cleanup: Delete created product
-        products_client.delete_product(response_data["id"])
+        # Cleanup: Delete created product with the pool's bulk teardown
+        product_pool.retire(response_data["id"])
 
     @pytest.mark.regression
     def test_create_product_without_required_fields_returns_422(self, products_client: ProductsClient):
@@ -40,9 +40,9 @@ class TestCreateProduct:
         assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
     @pytest.mark.regression
-    def test_create_product_with_invalid_price_returns_422(self, products_client: ProductsClient):
+    def test_create_product_with_invalid_price_returns_422(self, products_client: ProductsClient, product_name):
         response = products_client.post("/products/", data={
-            "name": "Invalid Product",
+            "name": product_name("Invalid Product"),
             "price": "invalid_price",
             "stock": 10
         })
@@ -50,9 +50,10 @@ class TestCreateProduct:
         assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
     @pytest.mark.regression
-    def test_create_product_with_negative_price_returns_200(self, products_client: ProductsClient):
+    def test_create_product_with_negative_price_returns_200(self, products_client: ProductsClient, product_pool,
+                                                            product_name):
         response = products_client.create_product(
-            name="Negative Price Product",
+            name=product_name("Negative Price Product"),
             price=-10.00,
             stock=5
         )
@@ -60,6 +61,6 @@ class TestCreateProduct:
         # Cleanup if needed
         if response.status_code == 200:
             response_data = response.json()
-            products_client.delete_product(response_data["id"])
+            product_pool.retire(response_data["id"])
         
         assert response.status_code in [200, 422], f"Expected 200 or 422, got {response.status_code}"
@@ -0,0 +1,55 @@
+import pytest
+from requests import Request
+from clients.products_client import ProductsClient
+
+
+def _regular(client: ProductsClient, method: str, endpoint: str, **kwargs):
+    return client.session.prepare_request(Request(method, client._build_url(endpoint), **kwargs))
+
+
+class TestPreparedProducts:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("method, endpoint, kwargs", [
+        ("GET", "/products/", {"params": {"skip": 0, "limit": 10}}),
+        ("GET", "/products/42", {"headers": {"If-None-Match": '"abc"'}}),
+        ("POST", "/products/", {"json": {"name": "Prepared Product", "price": 9.99, "stock": 1}}),
+        ("PATCH", "/products/42", {"json": {"stock": 5}}),
+        ("POST", "/products/", {"json": {"name": "Crème brûlée", "description": "日本語", "stock": 2 ** 70}}),
+        ("PATCH", "/products/42", {"json": {1: "non-str key", "nested": [None, True, 1.5]}}),
+        ("DELETE", "/products/42", {}),
+    ])
+    def test_prepared_request_matches_requests(self, products_client: ProductsClient, method, endpoint, kwargs):
+        prepared = products_client.sender.prepare(method, products_client._build_url(endpoint), **kwargs)
+        regular = _regular(products_client, method, endpoint, **kwargs)
+        
+        assert prepared is not None, "ProductsClient endpoints should take the prepared path"
+        assert (prepared.method, prepared.url) == (regular.method, regular.url)
+        assert prepared.body == regular.body, "The fast path must send the bytes requests would"
+        assert dict(prepared.headers) == dict(regular.headers)
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("endpoint, kwargs", [
+        ("/products/a b", {}),
+        ("/products/", {"files": {"file": b"data"}}),
+        ("/products/", {"data": {"form": "field"}}),
+        ("/products/", {"json": {"price": float("nan")}}),
+    ])
+    def test_unusual_requests_fall_back_to_requests(self, products_client: ProductsClient, endpoint, kwargs):
+        assert products_client.sender.prepare("POST", products_client._build_url(endpoint), **kwargs) is None
+
+    @pytest.mark.smoke
+    def test_crud_round_trip_on_prepared_path(self, product_name):
+        client = ProductsClient()
+        try:
+            created = client.create_product(name=product_name("Prepared Product"), price=12.5)
+            product_id = created.json()["id"]
+            updated = client.update_product(product_id, stock=3)
+            fetched = client.get_product(product_id, use_cache=False)
+            deleted = client.delete_product(product_id)
+        finally:
+            client.close()
+        
+        assert (created.status_code, updated.status_code, fetched.status_code, deleted.status_code) == (201, 200, 200, 204)
+        assert fetched.json()["stock"] == 3
+        assert fetched.request.url.endswith(f"/products/{product_id}")
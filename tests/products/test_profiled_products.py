@@ -0,0 +1,79 @@
+import json
+import sys
+import time
+import pytest
+from plugins.profiling import StackSampler, hottest_frames, profile_name, read_collapsed, write_profile
+
+
+def _samples_of(label: str, samples: dict) -> list:
+    return [weights for stack, weights in samples.items() if any(frame.startswith(label) for frame in stack)]
+
+
+def _weights_of(label: str, samples: dict) -> list:
+    return [sum(weights) for weights in zip(*_samples_of(label, samples))] or [0.0, 0.0]
+
+
+def _spin(cpu_seconds: float):
+    # Bounded by this thread's CPU time, so a busy machine stretches the loop instead of shrinking the sample.
+    deadline = time.thread_time() + cpu_seconds
+    while time.thread_time() < deadline:
+        pass
+
+
+def _wait(seconds: float):
+    time.sleep(seconds)
+
+
+class TestProfiledProducts:
+
+    @pytest.mark.regression
+    def test_sampler_splits_wall_and_cpu_time(self):
+        sampler = StackSampler(interval=0.001)
+        sampler.start(sys._getframe(), ("call",))
+        try:
+            _spin(0.1)
+            _wait(0.1)
+        finally:
+            sampler.stop()
+            sampler.close()
+        samples = sampler.take()
+        
+        assert all(stack[0] == "call" for stack in samples), "The prefix should root every stack"
+        spin_wall, spin_cpu = _weights_of("_spin (tests/products/test_profiled_products.py", samples)
+        wait_wall, wait_cpu = _weights_of("_wait (tests/products/test_profiled_products.py", samples)
+        assert spin_cpu >= 0.05 and spin_wall >= spin_cpu, "A busy loop should cost CPU time in its own frame"
+        assert wait_wall >= 0.05 and wait_cpu < min(wait_wall, spin_cpu) / 2, \
+            "A sleep should cost wall time, and next to no CPU time, in its own frame"
+        assert sampler.take() == {}
+
+    @pytest.mark.regression
+    def test_profiles_are_written_as_collapsed_stacks_and_speedscope(self, tmp_path):
+        samples = {
+            ("call", "test_x (tests/test_x.py:3)", "_send (clients/base_client.py:67)"): [0.030, 0.002],
+            ("call", "test_x (tests/test_x.py:3)"): [0.010, 0.010],
+            ("setup", "products_client (tests/conftest.py:90)"): [0.005, 0.0],
+        }
+        name = profile_name("tests/test_x.py::TestX::test_x[a b]")
+        base = write_profile(str(tmp_path), name, samples)
+        
+        assert name == "tests_test_x.py_TestX_test_x_a_b"
+        assert (tmp_path / f"{name}.wall.collapsed").read_text().splitlines() == [
+            "call;test_x (tests/test_x.py:3) 10000",
+            "call;test_x (tests/test_x.py:3);_send (clients/base_client.py:67) 30000",
+            "setup;products_client (tests/conftest.py:90) 5000",
+        ]
+        assert len((tmp_path / f"{name}.cpu.collapsed").read_text().splitlines()) == 2, "Zero weights are left out"
+        
+        document = json.loads((tmp_path / f"{name}.speedscope.json").read_text())
+        frames = document["shared"]["frames"]
+        wall, cpu = document["profiles"]
+        assert (wall["unit"], wall["endValue"], cpu["endValue"]) == ("microseconds", 45000, 12000)
+        assert [[frames[index]["name"] for index in stack] for stack in wall["samples"]][1] == ["call", "test_x", "_send"]
+        assert frames[2] == {"name": "_send", "file": "clients/base_client.py", "line": 67}
+        
+        merged = {}
+        for metric in ("wall", "cpu"):
+            read_collapsed(f"{base}.{metric}.collapsed", metric, merged)
+        assert merged == samples
+        assert hottest_frames(merged, 2) == [("_send (clients/base_client.py:67)", 0.03, 0.002),
+                                             ("test_x (tests/test_x.py:3)", 0.01, 0.01)]
@@ -0,0 +1,90 @@
+import multiprocessing
+import time
+import pytest
+from clients.products_client import ProductsClient
+from clients.ratelimit import RateLimiter, SharedTokenBucket, TokenBucket
+
+
+class FakeClock:
+    """Time that only moves when the limiter sleeps, so pacing does not depend on server speed."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def _reserve_shared(path: str, count: int) -> list:
+    """Runs in a child process: takes ``count`` tokens from the shared bucket, returns the delays handed out."""
+    bucket = SharedTokenBucket(path, rate=0.1)
+    try:
+        return [bucket.reserve() for _ in range(count)]
+    finally:
+        bucket.close()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limited_client(clock):
+    client = ProductsClient(rate_limiter=RateLimiter(TokenBucket(rate=50, clock=clock), sleep=clock.sleep))
+    yield client
+    client.close()
+
+
+class TestRateLimitedProducts:
+
+    @pytest.mark.regression
+    def test_requests_are_paced_to_the_rate_limit(self, limited_client: ProductsClient, clock):
+        responses = [limited_client.get_products(limit=1, use_cache=False) for _ in range(11)]
+        
+        assert all(response.status_code == 200 for response in responses)
+        assert clock.now == pytest.approx(0.2), f"11 requests at 50/s should wait 0.2s in total, waited {clock.now:.3f}s"
+        assert limited_client.rate_limiter.snapshot() == {"throttled": 10, "waited_seconds": 0.2}
+
+    @pytest.mark.regression
+    def test_endpoint_limit_only_applies_to_matching_requests(self, clock):
+        limiter = RateLimiter(rules=[("DELETE", "/products/", TokenBucket(rate=1, clock=clock))], sleep=clock.sleep)
+        client = ProductsClient(rate_limiter=limiter)
+        try:
+            for _ in range(5):
+                client.get_products(limit=1, use_cache=False)
+            client.delete_product(999999)
+        finally:
+            client.close()
+        
+        assert limiter.snapshot()["throttled"] == 0, "GETs and the first DELETE should not wait"
+        assert limiter.reserve("DELETE", "/products/1") == 1.0, "The DELETE bucket should now be empty"
+
+    @pytest.mark.regression
+    def test_shared_bucket_splits_budget_between_clients(self, tmp_path):
+        path = str(tmp_path / "products.bucket")
+        clients = [ProductsClient(rate_limiter=RateLimiter(SharedTokenBucket(path, rate=50))) for _ in range(2)]
+        try:
+            started = time.perf_counter()
+            for _ in range(6):
+                for client in clients:
+                    client.get_products(limit=1, use_cache=False)
+            elapsed = time.perf_counter() - started
+        finally:
+            for client in clients:
+                client.close()
+        
+        assert elapsed >= 0.2, f"12 requests sharing 50/s should take about 0.22s, took {elapsed:.3f}s"
+
+    @pytest.mark.regression
+    def test_shared_bucket_splits_budget_between_processes(self, tmp_path):
+        path = str(tmp_path / "products.bucket")
+        with multiprocessing.get_context("spawn").Pool(2) as pool:
+            delays = pool.starmap(_reserve_shared, [(path, 5), (path, 5)])
+        
+        # At 0.1 tokens/s the 10 reservations are 10s apart, far more than process start-up can blur.
+        assert sorted(delays[0] + delays[1]) == pytest.approx([10.0 * i for i in range(10)], abs=2), \
+            f"Both processes should draw from one budget, got {delays}"
@@ -0,0 +1,153 @@
+import email.utils
+import socket
+import time
+import pytest
+import requests
+from config.settings import Settings, settings
+from clients.cassette import CassetteMissError
+from clients.products_client import ProductsClient
+from clients.resilience import CircuitBreaker, CircuitOpenError, Resilience, RetryPolicy
+from mockserver import start_mock_server
+
+
+@pytest.fixture(scope="module")
+def flaky_server():
+    server = start_mock_server(settings.API_KEY, seed_products=5)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_client(flaky_server):
+    clients = []
+    
+    def make(resilience: Resilience, base_url: str = flaky_server.url) -> ProductsClient:
+        client = ProductsClient(base_url=base_url, resilience=resilience)
+        clients.append(client)
+        return client
+    
+    flaky_server.app.error_rate = 0.0
+    yield make
+    flaky_server.app.error_rate = 0.0
+    for client in clients:
+        client.close()
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _response(retry_after: str) -> requests.Response:
+    response = requests.Response()
+    response.headers["Retry-After"] = retry_after
+    return response
+
+
+class TestResilientProducts:
+
+    @pytest.mark.regression
+    def test_get_is_retried_until_the_server_recovers(self, make_client, flaky_server):
+        delays = []
+        
+        def recover(delay: float):
+            delays.append(delay)
+            flaky_server.app.error_rate = 0.0
+        
+        client = make_client(Resilience(RetryPolicy(max_retries=2, backoff_factor=0), sleep=recover))
+        flaky_server.app.error_rate = 1.0
+        response = client.get_products(limit=1)
+        
+        assert response.status_code == 200
+        assert delays == [0.0], "The injected 503 carries Retry-After: 0"
+        stats = client.resilience.stats.snapshot()
+        assert (stats["attempts"], stats["retries"], stats["retry_reasons"]) == (2, 1, {"503": 1})
+
+    @pytest.mark.regression
+    def test_post_is_not_retried_after_a_server_error(self, make_client, flaky_server, product_name):
+        client = make_client(Resilience(RetryPolicy(max_retries=2, backoff_factor=0), sleep=lambda delay: None))
+        flaky_server.app.error_rate = 1.0
+        response = client.create_product(name=product_name("Resilient Product"), price=1.0)
+        
+        assert response.status_code == 503, "The server may have acted on the POST, so it is not repeated"
+        assert client.resilience.stats.snapshot()["attempts"] == 1
+
+    @pytest.mark.regression
+    @pytest.mark.live
+    def test_post_is_retried_when_the_connection_is_refused(self, make_client, product_name):
+        client = make_client(Resilience(RetryPolicy(max_retries=2, backoff_factor=0), sleep=lambda delay: None),
+                             base_url=f"http://127.0.0.1:{_closed_port()}")
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.create_product(name=product_name("Resilient Product"), price=1.0)
+        stats = client.resilience.stats.snapshot()
+        assert (stats["attempts"], stats["retry_reasons"], stats["gave_up"]) == (3, {"ConnectionError": 2}, 1)
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("retry_after, expected", [
+        (lambda: "3", 3.0),
+        (lambda: "120", 60.0),
+        (lambda: email.utils.formatdate(time.time() + 30), 30.0),
+        (lambda: email.utils.formatdate(time.time() + 30, usegmt=True), 30.0),
+        (lambda: "soon", 0.0),
+        (lambda: "", 0.0),
+    ], ids=["seconds", "capped", "naive-date", "gmt-date", "invalid", "empty"])
+    def test_backoff_honours_retry_after(self, retry_after, expected):
+        policy = RetryPolicy(backoff_factor=0, max_retry_after=60)
+        
+        assert policy.backoff(0, _response(retry_after())) == pytest.approx(expected, abs=2)
+
+    @pytest.mark.regression
+    def test_breaker_opens_and_closes_again(self, make_client, flaky_server):
+        client = make_client(Resilience(RetryPolicy(max_retries=0), failure_threshold=2, reset_timeout=0.05))
+        flaky_server.app.error_rate = 1.0
+        statuses = [client.get_products(limit=1).status_code for _ in range(2)]
+        
+        with pytest.raises(CircuitOpenError):
+            client.get_products(limit=1)
+        stats = client.resilience.stats.snapshot()
+        assert statuses == [503, 503]
+        assert (stats["attempts"], stats["short_circuited"], stats["circuit_opened"]) == (2, 1, 1)
+        
+        flaky_server.app.error_rate = 0.0
+        time.sleep(0.1)
+        assert client.get_products(limit=1).status_code == 200, "After the reset timeout a probe goes through"
+        assert client.resilience.breaker_for(client.base_url).state == CircuitBreaker.CLOSED
+
+    @pytest.mark.regression
+    def test_breaker_counts_one_failure_per_call(self, make_client, flaky_server):
+        client = make_client(Resilience(RetryPolicy(max_retries=2, backoff_factor=0), failure_threshold=3,
+                                        sleep=lambda delay: None))
+        flaky_server.app.error_rate = 1.0
+        response = client.get_products(limit=1)
+        breaker = client.resilience.breaker_for(client.base_url)
+        
+        assert response.status_code == 503
+        assert client.resilience.stats.snapshot()["attempts"] == 3
+        assert (breaker.failures, breaker.state) == (1, CircuitBreaker.CLOSED)
+
+    @pytest.mark.regression
+    def test_non_transport_errors_leave_the_breaker_alone(self):
+        resilience = Resilience(RetryPolicy(), failure_threshold=1, reset_timeout=0)
+        url = "http://products.invalid/products/"
+        breaker = resilience.breaker_for(url)
+        
+        def miss():
+            raise CassetteMissError("no recording")
+        
+        with pytest.raises(CassetteMissError):
+            resilience.call("GET", url, miss, idempotent=True)
+        assert (breaker.failures, breaker.state) == (0, CircuitBreaker.CLOSED)
+        
+        breaker.record_failure()
+        with pytest.raises(CassetteMissError):
+            resilience.call("GET", url, miss, idempotent=True)
+        assert breaker.state == CircuitBreaker.OPEN, "The half-open probe is released, not left in flight"
+        assert breaker.allow()
+
+    @pytest.mark.regression
+    def test_retries_are_off_unless_configured(self, monkeypatch):
+        monkeypatch.delenv("API_MAX_RETRIES", raising=False)
+        
+        assert Settings().MAX_RETRIES == 0, "Tests asserting on 429/5xx responses must see them by default"
@@ -0,0 +1,94 @@
+import pytest
+from clients.cache import ResponseCache
+from clients.products_client import ProductsClient
+from clients.schemas import PRODUCT, PRODUCT_LIST, PRODUCT_SCHEMA, ResponseValidator, Schema, SchemaViolationError
+
+
+@pytest.fixture
+def validating_client():
+    client = ProductsClient(validator=ResponseValidator())
+    yield client
+    client.close()
+
+
+class TestSchemaProducts:
+
+    @pytest.mark.smoke
+    def test_product_responses_match_their_schemas(self, validating_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Could not acquire a test product")
+        
+        list_response = validating_client.get_products(limit=10, use_cache=False)
+        item_response = validating_client.get_product(pooled_product["id"], use_cache=False)
+        
+        assert list_response.status_code == 200 and item_response.status_code == 200
+        assert validating_client.validator.snapshot() == {"checked": 2, "failed": 0}
+
+    @pytest.mark.regression
+    def test_cached_response_is_checked_once(self, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Could not acquire a test product")
+        client = ProductsClient(validator=ResponseValidator(), cache=ResponseCache(ttl=60))
+        try:
+            responses = [client.get_product(pooled_product["id"]) for _ in range(3)]
+        finally:
+            client.close()
+        
+        assert [response.status_code for response in responses] == [200] * 3
+        assert client.cache.stats["hits"] == 2
+        assert client.validator.snapshot() == {"checked": 1, "failed": 0}, "Cache hits should reuse the passing check"
+
+    @pytest.mark.regression
+    def test_every_violation_is_reported_with_its_path(self, products_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Could not acquire a test product")
+        product = products_client.get_product(pooled_product["id"]).json()
+        
+        broken = [product, {**product, "price": "free", "stock": -1}, {"id": 0}]
+        
+        assert PRODUCT_LIST.validate(broken) == [
+            "$[1].price: expected number, got str",
+            "$[1].stock: -1 breaks minimum 0",
+            "$[2]: missing required property 'name'",
+            "$[2]: missing required property 'price'",
+            "$[2].id: 0 breaks minimum 1",
+        ]
+        assert PRODUCT.validate(broken) == ["$: expected object, got list"]
+
+    @pytest.mark.regression
+    def test_large_pages_are_sampled(self, products_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Could not acquire a test product")
+        product = products_client.get_product(pooled_product["id"]).json()
+        page = [product] * 1000
+        page[500] = page[501] = {**product, "name": ""}
+        
+        assert PRODUCT_LIST.validate(page, sample=100) == ["$[500].name: length 0 breaks minLength 1"], \
+            "Every 10th item should be checked, with its real index"
+        assert len(PRODUCT_LIST.validate(page)) == 2
+
+    @pytest.mark.regression
+    def test_violation_fails_the_call(self, products_client: ProductsClient, pooled_product):
+        if pooled_product is None:
+            pytest.skip("Could not acquire a test product")
+        strict = Schema("StrictProduct", {**PRODUCT_SCHEMA, "required": ["id", "name", "sku"]})
+        response = products_client.get_product(pooled_product["id"], use_cache=False)
+        
+        with pytest.raises(SchemaViolationError, match=r"\$: missing required property 'sku'") as error:
+            ResponseValidator().check(strict, f"/products/{pooled_product['id']}", response)
+        assert error.value.violations == ["$: missing required property 'sku'"]
+
+    @pytest.mark.regression
+    def test_keywords_apply_without_a_type(self):
+        untyped = Schema("Untyped", {
+            "properties": {"a": {"type": "integer"}, "tags": {"items": {"minLength": 2}}},
+            "required": ["a"],
+            "additionalProperties": False,
+        })
+        
+        assert untyped.validate({}) == ["$: missing required property 'a'"]
+        assert untyped.validate({"a": 1, "tags": ["ok", "x", 3], "b": 0}) == [
+            "$.tags[1]: length 1 breaks minLength 2",
+            "$: unexpected property 'b'",
+        ]
+        assert untyped.validate("not an object") == [], "Object keywords do not apply to other values"
@@ -0,0 +1,102 @@
+import json
+import os
+import xml.etree.ElementTree as ET
+import pytest
+from plugins.sharding import (
+    DEFAULT_DURATION, DurationStore, main, merge_junit, merge_shards, parse_shard, plan_shards, shard_label
+)
+
+JUNIT = ('<?xml version="1.0" encoding="utf-8"?><testsuites><testsuite name="pytest" tests="{tests}" errors="{errors}" '
+         'failures="{failures}" skipped="{skipped}" time="{time}"></testsuite></testsuites>')
+
+
+def _write_shard(directory, index: int, count: int, durations: dict, **counters) -> str:
+    path = directory / "shards" / shard_label(index, count)
+    path.mkdir(parents=True)
+    (path / "junit.xml").write_text(JUNIT.format(**{"errors": 0, "failures": 0, "skipped": 0, **counters}))
+    (path / "durations.json").write_text(json.dumps(durations))
+    return str(path)
+
+
+class TestShardedProducts:
+
+    @pytest.mark.regression
+    def test_plan_places_longest_tests_first_on_the_least_loaded_shard(self):
+        assignment, totals = plan_shards([5, 4, 3, 3, 3], 2)
+        
+        assert assignment == [0, 1, 1, 0, 1]
+        assert totals == [8, 10]
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("count", [2, 3, 7])
+    def test_plan_is_deterministic_and_balanced(self, count):
+        durations = [((i * 37) % 11) / 4 + 0.1 for i in range(60)]
+        
+        assignment, totals = plan_shards(durations, count)
+        
+        assert plan_shards(list(durations), count) == (assignment, totals), "Every node must compute the same plan"
+        assert sorted(set(assignment)) == list(range(count))
+        assert sum(totals) == pytest.approx(sum(durations))
+        assert max(totals) - min(totals) <= max(durations)
+
+    @pytest.mark.regression
+    def test_equal_estimates_split_tests_evenly(self):
+        assignment, _ = plan_shards([DEFAULT_DURATION] * 10, 4)
+        
+        assert sorted(assignment.count(shard) for shard in range(4)) == [2, 2, 3, 3]
+
+    @pytest.mark.regression
+    def test_new_tests_get_the_median_of_the_selected_known_tests(self, tmp_path):
+        store = DurationStore(str(tmp_path / "durations.json"))
+        store.durations = {"a": 1.0, "b": 3.0, "c": 10.0, "unselected": 50.0}
+        
+        assert store.estimates(["a", "new", "c", "b"]) == [1.0, 3.0, 10.0, 3.0]
+        assert store.estimates(["new"]) == [DEFAULT_DURATION], "With nothing known, fall back to the default"
+
+    @pytest.mark.regression
+    def test_durations_are_smoothed_and_saved(self, tmp_path):
+        path = str(tmp_path / "durations.json")
+        store = DurationStore(path)
+        store.update({"a": 2.0})
+        store.update({"a": 4.0, "b": 1.0})
+        store.save()
+        
+        assert DurationStore(path).durations == {"a": 3.0, "b": 1.0}
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize("spec", ["2", "a/b", "0/4", "5/4"])
+    def test_invalid_shard_spec_is_rejected(self, spec):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(spec)
+
+    @pytest.mark.regression
+    def test_merged_junit_totals_add_up(self, tmp_path):
+        paths = [
+            os.path.join(_write_shard(tmp_path, 1, 2, {}, tests=4, failures=1, time=2.5), "junit.xml"),
+            os.path.join(_write_shard(tmp_path, 2, 2, {}, tests=3, errors=1, skipped=2, time=4.0), "junit.xml"),
+        ]
+        output = str(tmp_path / "merged" / "junit.xml")
+        
+        totals = merge_junit(paths, output)
+        
+        assert totals == {"tests": 7, "errors": 1, "failures": 1, "skipped": 2}
+        root = ET.parse(output).getroot()
+        assert {key: root.get(key) for key in ("tests", "errors", "failures", "skipped", "time")} == \
+            {"tests": "7", "errors": "1", "failures": "1", "skipped": "2", "time": "4.000"}
+        assert [suite.get("name") for suite in root] == ["pytest (1-of-2)", "pytest (2-of-2)"]
+
+    @pytest.mark.regression
+    def test_merge_reports_a_missing_shard(self, tmp_path, capsys):
+        _write_shard(tmp_path, 1, 3, {"t1": 1.0}, tests=2, time=1.0)
+        _write_shard(tmp_path, 3, 3, {"t3": 2.0}, tests=1, time=2.0)
+        
+        result = merge_shards(str(tmp_path), junit_output=str(tmp_path / "junit.xml"), keep=True)
+        exit_code = main(["merge", str(tmp_path)])
+        
+        assert result["missing"] == ["2-of-3"]
+        assert result["junit"]["tests"] == 3
+        assert result["tests_timed"] == 2
+        assert exit_code == 1, "A merge with a missing shard should fail the job"
+        assert "MISSING: 2-of-3" in capsys.readouterr().out
+        assert not os.path.exists(tmp_path / "shards" / "1-of-3"), "Shard outputs are removed unless kept"
+        assert DurationStore(str(tmp_path / "durations.json")).durations == {"t1": 1.0, "t3": 2.0}
@@ -1,6 +1,7 @@
 import pytest
 import allure
 from clients.products_client import ProductsClient
+from plugins.reporting import attach_json, step
 
 
 @allure.epic("Products API")
@@ -12,28 +13,28 @@ class TestUpdateProduct:
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_update_product_returns_200(self, products_client: ProductsClient, created_product):
+    def test_update_product_returns_200(self, products_client: ProductsClient, created_product, product_name):
         if created_product is None:
             pytest.skip("Product creation failed")
         
-        with allure.step("Prepare update payload"):
-            update_data = {"name": "Updated Product Name", "price": 149.99}
-            allure.attach(str(update_data), name="Update Payload", attachment_type=allure.attachment_type.JSON)
+        with step("Prepare update payload"):
+            update_data = {"name": product_name("Updated Product Name"), "price": 149.99}
+            attach_json(update_data, name="Update Payload")
         
-        with allure.step(f"Send PATCH request to update product {created_product['id']}"):
+        with step(f"Send PATCH request to update product {created_product['id']}"):
             response = products_client.update_product(
                 product_id=created_product["id"],
-                name="Updated Product Name",
+                name=update_data["name"],
                 price=149.99
             )
         
-        with allure.step("Verify response status code is 200"):
+        with step("Verify response status code is 200"):
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
-        with allure.step("Verify response body contains updated data"):
+        with step("Verify response body contains updated data"):
             response_data = response.json()
-            allure.attach(str(response_data), name="Response Body", attachment_type=allure.attachment_type.JSON)
-            assert response_data["name"] == "Updated Product Name"
+            attach_json(response_data, name="Response Body")
+            assert response_data["name"] == update_data["name"]
             assert response_data["price"] == 149.99
 
     @allure.story("Update Product")
@@ -41,13 +42,13 @@ class TestUpdateProduct:
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.regression
     def test_update_product_not_found_returns_404(self, products_client: ProductsClient):
-        with allure.step("Send PATCH request for non-existent product ID 999999"):
+        with step("Send PATCH request for non-existent product ID 999999"):
             response = products_client.update_product(
                 product_id=999999,
                 name="Non-existent Product"
             )
         
-        with allure.step("Verify response status code is 404"):
+        with step("Verify response status code is 404"):
             assert response.status_code == 404, f"Expected 404, got {response.status_code}"
 
     @allure.story("Validation")
@@ -58,10 +59,10 @@ class TestUpdateProduct:
         if created_product is None:
             pytest.skip("Product creation failed")
         
-        with allure.step(f"Send PATCH request with invalid price type for product {created_product['id']}"):
+        with step(f"Send PATCH request with invalid price type for product {created_product['id']}"):
             response = products_client.patch(f"/products/{created_product['id']}", data={
                 "price": "invalid_price"
             })
         
-        with allure.step("Verify response status code is 422"):
+        with step("Verify response status code is 422"):
             assert response.status_code == 422, f"Expected 422, got {response.status_code}"
@@ -1,6 +1,7 @@
 import pytest
 import allure
 from clients.products_client import ProductsClient
+from plugins.reporting import attach_json, step
 
 
 @allure.epic("Products API")
@@ -12,17 +13,17 @@ class TestCreateProduct:
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_create_product_returns_201(self, products_client: ProductsClient):
-        with allure.step("Prepare product payload"):
+    def test_create_product_returns_201(self, products_client: ProductsClient, product_pool, product_name):
+        with step("Prepare product payload"):
             payload = {
-                "name": "Test Product",
+                "name": product_name("Test Product"),
                 "price": 99.99,
                 "description": "Test product for automated testing",
                 "stock": 10
             }
-            allure.attach(str(payload), name="Request Payload", attachment_type=allure.attachment_type.JSON)
+            attach_json(payload, name="Request Payload")
         
-        with allure.step("Send POST request to create product"):
+        with step("Send POST request to create product"):
             response = products_client.create_product(
                 name=payload["name"],
                 price=payload["price"],
@@ -30,63 +31,64 @@ class TestCreateProduct:
                 stock=payload["stock"]
             )
         
-        with allure.step("Verify response status code is 201"):
+        with step("Verify response status code is 201"):
             assert response.status_code == 201, f"Expected 201, got {response.status_code}"
         
-        with allure.step("Verify response body contains correct data"):
+        with step("Verify response body contains correct data"):
             response_data = response.json()
-            allure.attach(str(response_data), name="Response Body", attachment_type=allure.attachment_type.JSON)
-            assert response_data["name"] == "Test Product"
+            attach_json(response_data, name="Response Body")
+            assert response_data["name"] == payload["name"]
             assert response_data["price"] == 99.99
             assert response_data["description"] == "Test product for automated testing"
             assert response_data["stock"] == 10
             assert "id" in response_data
         
-        with allure.step("Cleanup: Delete created product"):
-            products_client.delete_product(response_data["id"])
+        with step("Cleanup: Schedule created product for bulk deletion"):
+            product_pool.retire(response_data["id"])
 
     @allure.story("Validation")
     @allure.title("Create product without required fields returns 422")
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.regression
     def test_create_product_without_required_fields_returns_422(self, products_client: ProductsClient):
-        with allure.step("Send POST request with empty payload"):
+        with step("Send POST request with empty payload"):
             response = products_client.post("/products/", data={})
         
-        with allure.step("Verify response status code is 422"):
+        with step("Verify response status code is 422"):
             assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
     @allure.story("Validation")
     @allure.title("Create product with invalid price type returns 422")
     @allure.severity(allure.severity_level.NORMAL)
     @pytest.mark.regression
-    def test_create_product_with_invalid_price_returns_422(self, products_client: ProductsClient):
-        with allure.step("Send POST request with invalid price type"):
+    def test_create_product_with_invalid_price_returns_422(self, products_client: ProductsClient, product_name):
+        with step("Send POST request with invalid price type"):
             response = products_client.post("/products/", data={
-                "name": "Invalid Product",
+                "name": product_name("Invalid Product"),
                 "price": "invalid_price",
                 "stock": 10
             })
         
-        with allure.step("Verify response status code is 422"):
+        with step("Verify response status code is 422"):
             assert response.status_code == 422, f"Expected 422, got {response.status_code}"
 
     @allure.story("Validation")
     @allure.title("Create product with negative price")
     @allure.severity(allure.severity_level.MINOR)
     @pytest.mark.regression
-    def test_create_product_with_negative_price_returns_200(self, products_client: ProductsClient):
-        with allure.step("Send POST request with negative price"):
+    def test_create_product_with_negative_price_returns_200(self, products_client: ProductsClient, product_pool,
+                                                            product_name):
+        with step("Send POST request with negative price"):
             response = products_client.create_product(
-                name="Negative Price Product",
+                name=product_name("Negative Price Product"),
                 price=-10.00,
                 stock=5
             )
         
-        with allure.step("Verify response and cleanup if needed"):
+        with step("Verify response and cleanup if needed"):
             if response.status_code == 200:
                 response_data = response.json()
-                products_client.delete_product(response_data["id"])
+                product_pool.retire(response_data["id"])
         
-        with allure.step("Verify response status code is 200 or 422"):
+        with step("Verify response status code is 200 or 422"):
             assert response.status_code in [200, 422], f"Expected 200 or 422, got {response.status_code}"